@@ -16,7 +16,13 @@ import json
 import logging
 import os
 
-from gmail_mcp.utils.encryption import decrypt_data, encrypt_data, key_from_hex
+from gmail_mcp.utils.encryption import (
+    AES_256_GCM,
+    DEFAULT_ALGORITHM,
+    decrypt_data,
+    encrypt_data,
+    key_from_hex,
+)
 from gmail_mcp.utils.errors import TokenError
 
 logger = logging.getLogger(__name__)
@@ -61,8 +67,9 @@ def get_encryption_key() -> bytes:
 def encrypt_token(token_data: dict[str, object]) -> dict[str, str]:
     """Encrypt token data for secure storage.
 
-    Serializes the token data as JSON, encrypts it using AES-256-GCM,
-    and returns the IV and ciphertext as hex strings for easy storage.
+    Serializes the token data as JSON, encrypts it using the host's
+    DEFAULT_ALGORITHM (AES-256-GCM, or ChaCha20-Poly1305 without hardware
+    AES), and returns the IV and ciphertext as hex strings for easy storage.
 
     Args:
         token_data: Dictionary containing OAuth token fields
@@ -72,6 +79,7 @@ def encrypt_token(token_data: dict[str, object]) -> dict[str, str]:
         A dictionary containing:
             - "iv": Hex-encoded initialization vector
             - "ciphertext": Hex-encoded encrypted token data
+            - "algorithm": Name of the AEAD algorithm used
 
     Raises:
         TokenError: If encryption fails or key is unavailable.
@@ -80,17 +88,18 @@ def encrypt_token(token_data: dict[str, object]) -> dict[str, str]:
         >>> token = {"access_token": "ya29...", "refresh_token": "1//..."}
         >>> encrypted = encrypt_token(token)
         >>> encrypted.keys()
-        dict_keys(['iv', 'ciphertext'])
+        dict_keys(['iv', 'ciphertext', 'algorithm'])
     """
     key = get_encryption_key()
 
     try:
         plaintext = json.dumps(token_data).encode("utf-8")
-        encrypted = encrypt_data(plaintext, key)
+        encrypted = encrypt_data(plaintext, key, DEFAULT_ALGORITHM)
 
         result = {
             "iv": encrypted["iv"].hex(),
             "ciphertext": encrypted["ciphertext"].hex(),
+            "algorithm": DEFAULT_ALGORITHM,
         }
         logger.debug("Token encrypted successfully")
         return result
@@ -115,6 +124,8 @@ def decrypt_token(encrypted: dict[str, str]) -> dict[str, object]:
         encrypted: Dictionary containing:
             - "iv": Hex-encoded initialization vector
             - "ciphertext": Hex-encoded encrypted token data
+            - "algorithm": Optional AEAD algorithm name; files written
+              before it was recorded are AES-256-GCM
 
     Returns:
         The decrypted token data dictionary.
@@ -134,7 +145,9 @@ def decrypt_token(encrypted: dict[str, str]) -> dict[str, object]:
         iv = bytes.fromhex(encrypted["iv"])
         ciphertext = bytes.fromhex(encrypted["ciphertext"])
 
-        plaintext = decrypt_data(iv, ciphertext, key)
+        algorithm = encrypted.get("algorithm", AES_256_GCM)
+
+        plaintext = decrypt_data(iv, ciphertext, key, algorithm)
         token_data: dict[str, object] = json.loads(plaintext.decode("utf-8"))
 
         logger.debug("Token decrypted successfully")
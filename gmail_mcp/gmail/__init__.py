@@ -1,5 +1,6 @@
 """Gmail API operations module."""
 
+from gmail_mcp.gmail.batch import execute_batch
 from gmail_mcp.gmail.client import GmailClient, gmail_client
 from gmail_mcp.gmail.labels import (
     create_label,
@@ -10,10 +11,16 @@ from gmail_mcp.gmail.labels import (
     update_label,
 )
 from gmail_mcp.gmail.messages import (
+    batch_get_messages,
     batch_modify_messages,
+    batch_send_messages,
+    batch_trash_messages,
+    build_send_body,
     decode_body,
+    decode_body_truncated,
     delete_message,
     get_message,
+    index_headers,
     list_messages,
     modify_message,
     parse_headers,
@@ -31,15 +38,22 @@ from gmail_mcp.gmail.threads import (
 __all__ = [
     "GmailClient",
     "gmail_client",
+    "execute_batch",
     "list_messages",
     "get_message",
+    "batch_get_messages",
     "send_message",
+    "build_send_body",
+    "batch_send_messages",
     "modify_message",
     "trash_message",
     "delete_message",
     "batch_modify_messages",
+    "batch_trash_messages",
     "parse_headers",
+    "index_headers",
     "decode_body",
+    "decode_body_truncated",
     "list_threads",
     "get_thread",
     "modify_thread",
@@ -0,0 +1,46 @@
+"""Gmail batch HTTP request helpers."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from googleapiclient.discovery import Resource
+
+logger = logging.getLogger(__name__)
+
+# Gmail accepts at most 100 calls per batch HTTP request
+MAX_BATCH_SIZE = 100
+
+BatchResult = tuple[Any, Exception | None]
+
+
+def execute_batch(service: Resource, requests: Sequence[Any]) -> list[BatchResult]:
+    """Execute API requests using Gmail batch HTTP round-trips.
+
+    Requests are submitted in chunks of MAX_BATCH_SIZE, each chunk as a
+    single multipart HTTP POST. Per-request failures are collected rather
+    than raised so callers can report partial success.
+
+    Args:
+        service: Authenticated Gmail API service.
+        requests: Unexecuted HttpRequest objects (e.g. from ``.get(...)``).
+
+    Returns:
+        List of (response, exception) tuples in the same order as requests.
+        Exactly one of the two is set for each request that was answered.
+    """
+    results: list[BatchResult] = [(None, None)] * len(requests)
+
+    def _callback(request_id: str, response: Any, exception: Exception | None) -> None:
+        results[int(request_id)] = (response, exception)
+
+    for start in range(0, len(requests), MAX_BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_callback)
+        for offset, request in enumerate(requests[start : start + MAX_BATCH_SIZE]):
+            batch.add(request, request_id=str(start + offset))
+        batch.execute()
+
+    logger.debug("Executed %d requests in batch", len(requests))
+    return results
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import threading
@@ -18,6 +19,15 @@ from gmail_mcp.utils.errors import AuthenticationError
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _env_client_secret() -> str | None:
+    """Read GOOGLE_CLIENT_SECRET once for all token refreshes.
+
+    Call ``_env_client_secret.cache_clear()`` after changing the variable.
+    """
+    return os.getenv("GOOGLE_CLIENT_SECRET")
+
+
 class GmailClient:
     """Factory for authenticated Gmail API services.
 
@@ -141,7 +151,7 @@ class GmailClient:
         # Fall back to env var for client_secret since it's not stored for security
         client_secret = token_data.get("client_secret")
         if not client_secret:
-            client_secret = os.getenv("GOOGLE_CLIENT_SECRET")
+            client_secret = _env_client_secret()
 
         return Credentials(  # type: ignore[no-untyped-call]
             token=token_data.get("access_token"),
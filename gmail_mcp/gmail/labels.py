@@ -62,7 +62,12 @@ def create_label(
         return label
     except Exception as e:
         logger.error("Failed to create label %s: %s", name, e)
-        raise GmailAPIError(f"Failed to create label {name}: {e}") from e
+        # HttpError exposes the HTTP status on resp; Gmail answers 409 when
+        # a label with the same name already exists
+        status_code = getattr(getattr(e, "resp", None), "status", None)
+        raise GmailAPIError(
+            f"Failed to create label {name}: {e}", status_code=status_code
+        ) from e
 
 
 def update_label(
@@ -4,16 +4,21 @@ from __future__ import annotations
 
 import base64
 import logging
+from collections.abc import Sequence
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Any
 
 from googleapiclient.discovery import Resource
 
+from gmail_mcp.gmail.batch import BatchResult, execute_batch
 from gmail_mcp.utils.errors import GmailAPIError
 
 logger = logging.getLogger(__name__)
 
+# Gmail accepts at most 1000 message IDs per batchModify request
+BATCH_MODIFY_MAX_IDS = 1000
+
 
 def list_messages(
     service: Resource,
@@ -69,6 +74,89 @@ def get_message(
         raise GmailAPIError(f"Failed to get message {message_id}: {e}") from e
 
 
+def batch_get_messages(
+    service: Resource, message_ids: list[str], format: str = "full"
+) -> list[dict[str, Any]]:
+    """Get multiple messages by ID using batch HTTP requests.
+
+    Args:
+        service: Authenticated Gmail API service.
+        message_ids: Message IDs to fetch.
+        format: Message format to return ("full", "metadata", "minimal").
+
+    Returns:
+        Messages in the same order as message_ids.
+
+    Raises:
+        GmailAPIError: If the batch request or any individual get fails.
+    """
+    try:
+        results = execute_batch(
+            service,
+            [
+                service.users().messages().get(userId="me", id=msg_id, format=format)
+                for msg_id in message_ids
+            ],
+        )
+    except Exception as e:
+        logger.error("Failed to batch get messages: %s", e)
+        raise GmailAPIError(f"Failed to get messages: {e}") from e
+
+    messages: list[dict[str, Any]] = []
+    for msg_id, (response, exception) in zip(message_ids, results, strict=True):
+        if exception is not None:
+            logger.error("Failed to get message %s: %s", msg_id, exception)
+            raise GmailAPIError(f"Failed to get message {msg_id}: {exception}")
+        messages.append(response)
+
+    logger.debug("Retrieved %d messages in batch", len(messages))
+    return messages
+
+
+def build_send_body(
+    to: str,
+    subject: str,
+    body: str,
+    cc: list[str] | None = None,
+    bcc: list[str] | None = None,
+    thread_id: str | None = None,
+    html: bool = False,
+) -> dict[str, Any]:
+    """Build the messages.send request body for an email.
+
+    Args:
+        to: Recipient email address.
+        subject: Email subject.
+        body: Email body content.
+        cc: Optional CC recipients.
+        bcc: Optional BCC recipients.
+        thread_id: Optional thread ID when replying.
+        html: Whether body is HTML.
+
+    Returns:
+        Request body with the base64url-encoded RFC 2822 message.
+    """
+    message: MIMEText | MIMEMultipart
+    if html:
+        message = MIMEMultipart("alternative")
+        message.attach(MIMEText(body, "html"))
+    else:
+        message = MIMEText(body)
+
+    message["to"] = to
+    message["subject"] = subject
+    if cc:
+        message["cc"] = ", ".join(cc)
+    if bcc:
+        message["bcc"] = ", ".join(bcc)
+
+    raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+    body_dict: dict[str, Any] = {"raw": raw}
+    if thread_id:
+        body_dict["threadId"] = thread_id
+    return body_dict
+
+
 def send_message(
     service: Resource,
     to: str,
@@ -81,25 +169,7 @@ def send_message(
 ) -> dict[str, Any]:
     """Send an email message."""
     try:
-        message: MIMEText | MIMEMultipart
-        if html:
-            message = MIMEMultipart("alternative")
-            message.attach(MIMEText(body, "html"))
-        else:
-            message = MIMEText(body)
-
-        message["to"] = to
-        message["subject"] = subject
-        if cc:
-            message["cc"] = ", ".join(cc)
-        if bcc:
-            message["bcc"] = ", ".join(bcc)
-
-        raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
-        body_dict: dict[str, Any] = {"raw": raw}
-        if thread_id:
-            body_dict["threadId"] = thread_id
-
+        body_dict = build_send_body(to, subject, body, cc, bcc, thread_id, html)
         sent = service.users().messages().send(userId="me", body=body_dict).execute()
         logger.info("Sent message %s to %s", sent["id"], to)
         return sent
@@ -108,6 +178,37 @@ def send_message(
         raise GmailAPIError(f"Failed to send message: {e}") from e
 
 
+def batch_send_messages(
+    service: Resource, send_bodies: Sequence[dict[str, Any]]
+) -> list[BatchResult]:
+    """Send multiple prepared messages in batch HTTP requests.
+
+    Args:
+        service: Authenticated Gmail API service.
+        send_bodies: Request bodies from build_send_body.
+
+    Returns:
+        (sent message, exception) tuples in the same order as send_bodies.
+
+    Raises:
+        GmailAPIError: If the batch request itself fails.
+    """
+    try:
+        results = execute_batch(
+            service,
+            [
+                service.users().messages().send(userId="me", body=send_body)
+                for send_body in send_bodies
+            ],
+        )
+    except Exception as e:
+        logger.error("Failed to batch send messages: %s", e)
+        raise GmailAPIError(f"Failed to send messages: {e}") from e
+
+    logger.info("Sent %d messages in batch", len(send_bodies))
+    return results
+
+
 def modify_message(
     service: Resource,
     message_id: str,
@@ -171,6 +272,65 @@ def batch_modify_messages(
         raise GmailAPIError(f"Failed to batch modify messages: {e}") from e
 
 
+def batch_trash_messages(service: Resource, message_ids: list[str]) -> dict[str, str]:
+    """Move multiple messages to trash.
+
+    Uses batchModify to add the TRASH label to up to 1000 messages per
+    request. If a chunk is rejected, its messages are trashed individually
+    in a batch HTTP request so per-message failures can be reported.
+
+    Args:
+        service: Authenticated Gmail API service.
+        message_ids: Message IDs to move to trash.
+
+    Returns:
+        Mapping of message ID to error message for messages that failed.
+
+    Raises:
+        GmailAPIError: If the fallback batch request itself fails.
+    """
+    failed: dict[str, str] = {}
+
+    for start in range(0, len(message_ids), BATCH_MODIFY_MAX_IDS):
+        chunk = message_ids[start : start + BATCH_MODIFY_MAX_IDS]
+        try:
+            service.users().messages().batchModify(
+                userId="me",
+                body={
+                    "ids": chunk,
+                    "addLabelIds": ["TRASH"],
+                    "removeLabelIds": ["INBOX", "UNREAD"],
+                },
+            ).execute()
+            logger.info("Trashed %d messages via batchModify", len(chunk))
+            continue
+        except Exception as e:
+            logger.warning(
+                "batchModify trash failed, retrying %d messages individually: %s",
+                len(chunk),
+                e,
+            )
+
+        try:
+            results = execute_batch(
+                service,
+                [
+                    service.users().messages().trash(userId="me", id=msg_id)
+                    for msg_id in chunk
+                ],
+            )
+        except Exception as e:
+            logger.error("Failed to batch trash messages: %s", e)
+            raise GmailAPIError(f"Failed to trash messages: {e}") from e
+
+        for msg_id, (_, exception) in zip(chunk, results, strict=True):
+            if exception is not None:
+                logger.warning("Failed to trash message %s: %s", msg_id, exception)
+                failed[msg_id] = str(exception)
+
+    return failed
+
+
 def parse_headers(message: dict[str, Any]) -> dict[str, str]:
     """Extract common headers from message payload."""
     headers = {}
@@ -182,6 +342,18 @@ def parse_headers(message: dict[str, Any]) -> dict[str, str]:
     return headers
 
 
+def index_headers(message: dict[str, Any]) -> dict[str, str]:
+    """Map every payload header by lowercase name in a single pass.
+
+    Unlike parse_headers this keeps all headers, and the first occurrence
+    of a repeated header wins.
+    """
+    headers: dict[str, str] = {}
+    for header in message.get("payload", {}).get("headers", []):
+        headers.setdefault(header.get("name", "").lower(), header.get("value", ""))
+    return headers
+
+
 def _safe_base64_decode(data: str) -> str:
     """Safely decode base64 data with error handling.
 
@@ -198,34 +370,77 @@ def _safe_base64_decode(data: str) -> str:
         return ""
 
 
-def decode_body(message: dict[str, Any]) -> str:
-    """Decode message body from base64."""
-    payload = message.get("payload", {})
+def _find_body_data(payload: dict[str, Any]) -> str | None:
+    """Find the base64 body data to display for a message payload.
+
+    Prefers a simple body, then text/plain parts, then text/html parts,
+    then nested multipart parts.
 
+    Args:
+        payload: Message payload (or nested part) from the Gmail API.
+
+    Returns:
+        Base64url-encoded body data, or None if no text body exists.
+    """
     # Simple message
     if "body" in payload and payload["body"].get("data"):
-        return _safe_base64_decode(payload["body"]["data"])
+        return payload["body"]["data"]
 
     # Multipart - find text/plain or text/html
     parts = payload.get("parts", [])
-    for part in parts:
-        mime_type = part.get("mimeType", "")
-        if mime_type == "text/plain" and part.get("body", {}).get("data"):
-            return _safe_base64_decode(part["body"]["data"])
-
-    for part in parts:
-        mime_type = part.get("mimeType", "")
-        if mime_type == "text/html" and part.get("body", {}).get("data"):
-            return _safe_base64_decode(part["body"]["data"])
+    for mime_type in ("text/plain", "text/html"):
+        for part in parts:
+            part_data = part.get("body", {}).get("data")
+            if part.get("mimeType", "") == mime_type and part_data:
+                return part_data
 
     # Nested multipart
     for part in parts:
         if "parts" in part:
-            result = decode_body({"payload": part})
-            if result:
-                return result
+            nested = _find_body_data(part)
+            if nested:
+                return nested
+
+    return None
+
+
+def decode_body(message: dict[str, Any]) -> str:
+    """Decode message body from base64."""
+    data = _find_body_data(message.get("payload", {}))
+    return _safe_base64_decode(data) if data else ""
+
+
+def decode_body_truncated(
+    message: dict[str, Any],
+    max_chars: int,
+    suffix: str = "... [truncated]",
+) -> str:
+    """Decode at most max_chars characters of the message body.
+
+    Only the base64 prefix needed to produce max_chars characters is
+    decoded, so long bodies are never decoded in full.
+
+    Args:
+        message: Message object from the Gmail API.
+        max_chars: Maximum number of body characters to return.
+        suffix: Marker appended when the body was truncated.
+
+    Returns:
+        Decoded body, truncated to max_chars with suffix appended if longer.
+    """
+    data = _find_body_data(message.get("payload", {}))
+    if not data:
+        return ""
+
+    # UTF-8 uses at most 4 bytes per character and every 4 base64
+    # characters encode 3 bytes, so this prefix always holds max_chars
+    # complete characters when the body is that long.
+    max_encoded = -(-max_chars * 4 // 3) * 4
 
-    return ""
+    body = _safe_base64_decode(data[:max_encoded])
+    if len(body) > max_chars or len(data) > max_encoded:
+        return body[:max_chars] + suffix
+    return body
 
 
 def get_raw_message(service: Resource, message_id: str) -> bytes:
@@ -48,16 +48,30 @@ def list_threads(
 
 
 def get_thread(
-    service: Resource, thread_id: str, format: str = "full"
+    service: Resource,
+    thread_id: str,
+    format: str = "full",
+    fields: str | None = None,
 ) -> dict[str, Any]:
-    """Get a thread with all its messages."""
+    """Get a thread with all its messages.
+
+    Args:
+        service: Authenticated Gmail API service.
+        thread_id: Gmail thread ID.
+        format: Message format to return ("full", "metadata", "minimal").
+        fields: Optional partial-response field mask limiting the payload.
+
+    Returns:
+        Thread resource from the Gmail API.
+
+    Raises:
+        GmailAPIError: If the API call fails.
+    """
     try:
-        thread = (
-            service.users()
-            .threads()
-            .get(userId="me", id=thread_id, format=format)
-            .execute()
-        )
+        kwargs: dict[str, Any] = {"userId": "me", "id": thread_id, "format": format}
+        if fields:
+            kwargs["fields"] = fields
+        thread = service.users().threads().get(**kwargs).execute()
         msg_count = len(thread.get("messages", []))
         logger.debug("Retrieved thread %s with %d messages", thread_id, msg_count)
         return thread
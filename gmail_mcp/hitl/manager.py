@@ -7,9 +7,12 @@ of expired requests.
 
 from __future__ import annotations
 
+import heapq
+import hmac
 import logging
 import os
 import threading
+import time
 from datetime import UTC, datetime, timedelta
 
 from gmail_mcp.hitl.models import ApprovalRequest, ApprovalStatus
@@ -43,6 +46,16 @@ class ApprovalManager:
         ...     # Execute the action
     """
 
+    # Fixed attribute layout: the hot methods read these on every call
+    __slots__ = (
+        "_expiry_heap",
+        "_lock",
+        "_requests",
+        "_timeout_delta",
+        "_timeout_ms",
+        "_timeout_ns",
+    )
+
     def __init__(self, timeout_ms: int = 300000) -> None:
         """Initialize the ApprovalManager.
 
@@ -51,7 +64,14 @@ class ApprovalManager:
                         Defaults to 300000 (5 minutes).
         """
         self._timeout_ms = timeout_ms
+        # Built once; store() adds these to every request on the hot path
+        self._timeout_delta = timedelta(milliseconds=timeout_ms)
+        self._timeout_ns = timeout_ms * 1_000_000
         self._requests: dict[str, ApprovalRequest] = {}
+        # (deadline_ns, approval_id) min-heap so cleanup only touches expired
+        # entries; entries for consumed or rejected requests go stale and are
+        # discarded when they reach the top or when store() compacts the heap
+        self._expiry_heap: list[tuple[int, str]] = []
         self._lock = threading.Lock()
         logger.info(
             "ApprovalManager initialized with timeout_ms=%d (%d seconds)",
@@ -67,13 +87,14 @@ class ApprovalManager:
     @property
     def timeout_delta(self) -> timedelta:
         """Get the timeout as a timedelta."""
-        return timedelta(milliseconds=self._timeout_ms)
+        return self._timeout_delta
 
     def store(self, request: ApprovalRequest) -> str:
         """Store an approval request and set its expiration time.
 
-        If the request's expires_at is not set or is in the past,
-        it will be updated based on the manager's timeout setting.
+        The request's expires_at, monotonic deadline, created_at and status
+        are always overwritten from the manager's timeout setting, so callers
+        may pass any placeholder expires_at.
 
         Args:
             request: The ApprovalRequest to store.
@@ -85,18 +106,29 @@ class ApprovalManager:
             >>> request = ApprovalRequest(
             ...     action="send_email",
             ...     preview={"to": "user@example.com"},
-            ...     expires_at=datetime.utcnow(),  # Will be updated
+            ...     expires_at=datetime.utcnow(),  # Always overwritten
             ... )
             >>> approval_id = manager.store(request)
         """
         # Calculate expiration based on timeout (use timezone-aware UTC)
         now = datetime.now(UTC)
-        request.expires_at = now + self.timeout_delta
+        request.expires_at = now + self._timeout_delta
         request.created_at = now
         request.status = ApprovalStatus.PENDING
+        request._expires_at_ns = time.monotonic_ns() + self._timeout_ns
 
         with self._lock:
             self._requests[request.id] = request
+            heapq.heappush(self._expiry_heap, (request._expires_at_ns, request.id))
+            # consume() and reject() leave their heap entries behind; once
+            # stale entries outnumber live ones, rebuild from what is stored
+            if len(self._expiry_heap) > 2 * len(self._requests):
+                self._expiry_heap = [
+                    (stored._expires_at_ns, approval_id)
+                    for approval_id, stored in self._requests.items()
+                    if stored._expires_at_ns is not None
+                ]
+                heapq.heapify(self._expiry_heap)
             logger.debug(
                 "Stored approval request: id=%s, action=%s, expires_at=%s",
                 request.id,
@@ -110,6 +142,8 @@ class ApprovalManager:
         """Check if an approval_id exists and hasn't expired.
 
         This method does NOT consume the approval - use consume() for that.
+        It reads without taking the manager lock, so concurrent validations
+        never wait on each other or on store/consume.
 
         Args:
             approval_id: The approval ID to validate.
@@ -123,30 +157,32 @@ class ApprovalManager:
             ... else:
             ...     print("Approval is invalid or expired")
         """
-        with self._lock:
-            request = self._requests.get(approval_id)
-            if request is None:
-                logger.debug("Validation failed: approval_id=%s not found", approval_id)
-                return False
-
-            if request.is_expired():
-                logger.debug(
-                    "Validation failed: approval_id=%s expired at %s",
-                    approval_id,
-                    request.expires_at.isoformat(),
-                )
-                request.status = ApprovalStatus.EXPIRED
-                return False
+        # No lock: a single dict lookup is atomic, and consume() re-checks
+        # under the lock, so a racing consume can at worst make this report
+        # an approval that is about to be used as still valid.
+        request = self._requests.get(approval_id)
+        if request is None:
+            logger.debug("Validation failed: approval_id=%s not found", approval_id)
+            return False
+
+        if request.is_expired():
+            logger.debug(
+                "Validation failed: approval_id=%s expired at %s",
+                approval_id,
+                request.expires_at.isoformat(),
+            )
+            request.status = ApprovalStatus.EXPIRED
+            return False
 
-            if request.status != ApprovalStatus.PENDING:
-                logger.debug(
-                    "Validation failed: approval_id=%s has status %s",
-                    approval_id,
-                    request.status.value,
-                )
-                return False
+        if request.status is not ApprovalStatus.PENDING:
+            logger.debug(
+                "Validation failed: approval_id=%s has status %s",
+                approval_id,
+                request.status.value,
+            )
+            return False
 
-            return True
+        return True
 
     def consume(
         self,
@@ -210,7 +246,7 @@ class ApprovalManager:
                     },
                 )
 
-            if request.status != ApprovalStatus.PENDING:
+            if request.status is not ApprovalStatus.PENDING:
                 logger.warning(
                     "Consume failed: approval_id=%s already consumed (status=%s)",
                     approval_id,
@@ -244,9 +280,10 @@ class ApprovalManager:
                     },
                 )
 
-            # Verify params hash if provided
+            # Verify params hash if provided; constant-time so the comparison
+            # does not reveal how much of a forged hash matched
             if params_hash and request.params_hash:
-                if params_hash != request.params_hash:
+                if not hmac.compare_digest(params_hash, request.params_hash):
                     logger.warning(
                         "Consume failed: approval_id=%s params hash mismatch",
                         approval_id,
@@ -273,7 +310,9 @@ class ApprovalManager:
         """Remove all expired approval requests.
 
         This method should be called periodically to prevent memory leaks
-        from accumulated expired requests.
+        from accumulated expired requests. Requests are popped from an
+        expiry-ordered heap, so the cost grows with the number of expired
+        requests rather than with everything still pending.
 
         Returns:
             The number of expired requests that were removed.
@@ -282,22 +321,37 @@ class ApprovalManager:
             >>> removed = manager.cleanup_expired()
             >>> print(f"Removed {removed} expired requests")
         """
-        now = datetime.now(UTC)
+        now_ns = time.monotonic_ns()
         expired_ids: list[str] = []
 
         with self._lock:
-            for approval_id, request in self._requests.items():
-                if now > request.expires_at:
-                    expired_ids.append(approval_id)
-                    request.status = ApprovalStatus.EXPIRED
-
-            for approval_id in expired_ids:
-                del self._requests[approval_id]
-
-        if expired_ids:
-            logger.info("Cleaned up %d expired approval requests", len(expired_ids))
-
-        return len(expired_ids)
+            heap = self._expiry_heap
+            while heap and now_ns > heap[0][0]:
+                deadline_ns, approval_id = heapq.heappop(heap)
+                request = self._requests.get(approval_id)
+                if request is None or request._expires_at_ns != deadline_ns:
+                    continue  # Already consumed, rejected or re-stored
+                request.status = ApprovalStatus.EXPIRED
+                expired_ids.append(approval_id)
+
+            # dicts never shrink on delete, so after a bulk expiry rebuild the
+            # map to release the table instead of leaving it mostly empty
+            if len(expired_ids) * 2 > len(self._requests):
+                expired = set(expired_ids)
+                self._requests = {
+                    approval_id: request
+                    for approval_id, request in self._requests.items()
+                    if approval_id not in expired
+                }
+            else:
+                for approval_id in expired_ids:
+                    del self._requests[approval_id]
+
+        removed = len(expired_ids)
+        if removed:
+            logger.info("Cleaned up %d expired approval requests", removed)
+
+        return removed
 
     def get_pending_count(self) -> int:
         """Get the number of pending approval requests.
@@ -309,7 +363,7 @@ class ApprovalManager:
             return sum(
                 1
                 for request in self._requests.values()
-                if request.status == ApprovalStatus.PENDING and not request.is_expired()
+                if request.status is ApprovalStatus.PENDING and not request.is_expired()
             )
 
     def reject(self, approval_id: str) -> ApprovalRequest | None:
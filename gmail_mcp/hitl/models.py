@@ -6,12 +6,50 @@ where write operations require explicit user confirmation before execution.
 
 from __future__ import annotations
 
+import os
+import re
+import threading
+import time
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
-from uuid import uuid4
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+# Random bytes fetched per os.urandom() call when minting approval ids
+# (enough for 256 ids, so one syscall per 256 requests per thread)
+REQUEST_ID_POOL_BYTES = 4096
+
+# Canonical lowercase UUID string, the format of generated request ids
+REQUEST_ID_PATTERN = re.compile(
+    r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z"
+)
+
+_request_id_pool = threading.local()
+
+
+def _reset_request_id_pool() -> None:
+    """Drop buffered randomness so a forked child never reuses its parent's."""
+    _request_id_pool.__dict__.clear()
+
+
+os.register_at_fork(after_in_child=_reset_request_id_pool)
+
+
+def _new_request_id() -> str:
+    """Generate a random UUID4 string from a per-thread urandom buffer.
+
+    Returns:
+        A 36-character RFC 4122 version 4 UUID string.
+    """
+    buf: bytes = getattr(_request_id_pool, "buf", b"")
+    offset: int = getattr(_request_id_pool, "offset", 0)
+    if offset >= len(buf):
+        buf = _request_id_pool.buf = os.urandom(REQUEST_ID_POOL_BYTES)
+        offset = 0
+    _request_id_pool.offset = offset + 16
+    return str(UUID(bytes=buf[offset : offset + 16], version=4))
 
 
 class ApprovalStatus(str, Enum):
@@ -56,7 +94,7 @@ class ApprovalRequest(BaseModel):
     """
 
     id: str = Field(
-        default_factory=lambda: str(uuid4()),
+        default_factory=_new_request_id,
         description="Unique identifier for this approval request",
     )
     action: str = Field(
@@ -88,13 +126,36 @@ class ApprovalRequest(BaseModel):
         default=None,
         description="SHA-256 hash of critical parameters for verification",
     )
+    # Monotonic deadline in nanoseconds, set by ApprovalManager.store() so
+    # expiry checks are an int compare instead of building a datetime
+    _expires_at_ns: int | None = PrivateAttr(default=None)
+
+    @staticmethod
+    def id_is_valid(value: str) -> bool:
+        """Check whether value has the format of a generated request id.
+
+        Uses a precompiled pattern rather than parsing with uuid.UUID, so
+        malformed input is rejected without raising and catching.
+
+        Args:
+            value: Candidate approval id.
+
+        Returns:
+            True if value is a canonical lowercase UUID string.
+        """
+        return REQUEST_ID_PATTERN.match(value) is not None
 
     def is_expired(self) -> bool:
         """Check if the approval request has expired.
 
+        Stored requests compare against their monotonic deadline; requests
+        that were never stored fall back to comparing expires_at.
+
         Returns:
             True if current time is past expires_at, False otherwise.
         """
+        if self._expires_at_ns is not None:
+            return time.monotonic_ns() > self._expires_at_ns
         now = datetime.now(UTC)
         # Handle both timezone-aware and naive datetimes for expires_at
         if self.expires_at.tzinfo is None:
@@ -109,7 +170,8 @@ class ApprovalRequest(BaseModel):
         Returns:
             True if request can be approved/consumed, False otherwise.
         """
-        return self.status == ApprovalStatus.PENDING and not self.is_expired()
+        # Enum members are singletons, so identity is an exact, cheap check
+        return self.status is ApprovalStatus.PENDING and not self.is_expired()
 
 
 class ApprovalResponse(BaseModel):
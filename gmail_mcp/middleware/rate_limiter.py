@@ -23,13 +23,19 @@ from gmail_mcp.utils.errors import RateLimitError
 
 logger = logging.getLogger(__name__)
 
+# Number of independently locked bucket maps; must be a power of two
+RATE_LIMIT_SHARDS = 16
 
-@dataclass
+
+@dataclass(slots=True)
 class Bucket:
-    """Token bucket for rate limiting."""
+    """Token bucket for rate limiting.
+
+    tokens and last_update live in one tuple so lock-free readers load a
+    consistent pair; writers always replace the whole tuple.
+    """
 
-    tokens: float
-    last_update: float
+    state: tuple[float, float]  # (tokens, last_update)
     max_tokens: float
     refill_rate: float  # tokens per second
 
@@ -39,6 +45,9 @@ class RateLimiter:
 
     Each user has their own bucket that refills at a constant rate.
     Requests consume tokens; when empty, requests are rejected.
+
+    Buckets are striped across RATE_LIMIT_SHARDS maps, each with its own
+    lock, so requests for different users rarely contend.
     """
 
     def __init__(
@@ -56,8 +65,9 @@ class RateLimiter:
         self._max_requests = max_requests or int(os.getenv("RATE_LIMIT_MAX", "100"))
         self._window_seconds = window_seconds
         self._refill_rate = self._max_requests / window_seconds
-        self._buckets: dict[str, Bucket] = {}
-        self._lock = threading.Lock()
+        self._shards: list[tuple[threading.Lock, dict[str, Bucket]]] = [
+            (threading.Lock(), {}) for _ in range(RATE_LIMIT_SHARDS)
+        ]
 
         logger.info(
             "RateLimiter initialized: %d requests per %d seconds",
@@ -65,40 +75,59 @@ class RateLimiter:
             window_seconds,
         )
 
-    def _get_bucket(self, user_id: str) -> Bucket:
-        """Get or create bucket for user."""
-        if user_id not in self._buckets:
-            self._buckets[user_id] = Bucket(
-                tokens=float(self._max_requests),
-                last_update=time.monotonic(),
+    def _shard(self, user_id: str) -> tuple[threading.Lock, dict[str, Bucket]]:
+        """Get the lock and bucket map that own user_id."""
+        return self._shards[hash(user_id) & (RATE_LIMIT_SHARDS - 1)]
+
+    def _get_bucket(self, buckets: dict[str, Bucket], user_id: str) -> Bucket:
+        """Get or create bucket for user in its shard's map."""
+        if user_id not in buckets:
+            buckets[user_id] = Bucket(
+                state=(float(self._max_requests), time.monotonic()),
                 max_tokens=float(self._max_requests),
                 refill_rate=self._refill_rate,
             )
-        return self._buckets[user_id]
+        return buckets[user_id]
 
-    def _refill(self, bucket: Bucket) -> None:
-        """Refill bucket based on elapsed time."""
+    def _refill(self, bucket: Bucket) -> float:
+        """Refill bucket based on elapsed time and return its tokens."""
         now = time.monotonic()
-        elapsed = now - bucket.last_update
-        bucket.tokens = min(
+        tokens, last_update = bucket.state
+        tokens = min(
             bucket.max_tokens,
-            bucket.tokens + elapsed * bucket.refill_rate,
+            tokens + (now - last_update) * bucket.refill_rate,
         )
-        bucket.last_update = now
+        bucket.state = (tokens, now)
+        return tokens
+
+    def _peek_tokens(self, user_id: str) -> float:
+        """Compute a user's current tokens without locking or mutating state.
+
+        The (tokens, last_update) pair is read in a single load without the
+        shard lock, so it is always consistent; a consume() racing with this
+        read can only make the result stale by that one call. consume()
+        itself always re-checks under the lock.
+        """
+        _, buckets = self._shard(user_id)
+        bucket = buckets.get(user_id)
+        if bucket is None:
+            return float(self._max_requests)
+        tokens, last_update = bucket.state
+        elapsed = time.monotonic() - last_update
+        return min(bucket.max_tokens, tokens + elapsed * bucket.refill_rate)
 
     def check(self, user_id: str = "default") -> bool:
         """Check if request is allowed without consuming a token.
 
+        This is a lock-free read; see _peek_tokens for its consistency.
+
         Args:
             user_id: User identifier.
 
         Returns:
             True if request would be allowed, False otherwise.
         """
-        with self._lock:
-            bucket = self._get_bucket(user_id)
-            self._refill(bucket)
-            return bucket.tokens >= 1.0
+        return self._peek_tokens(user_id) >= 1.0
 
     def consume(self, user_id: str = "default", tokens: int = 1) -> None:
         """Consume tokens for a request.
@@ -110,12 +139,13 @@ class RateLimiter:
         Raises:
             RateLimitError: If not enough tokens available.
         """
-        with self._lock:
-            bucket = self._get_bucket(user_id)
-            self._refill(bucket)
+        lock, buckets = self._shard(user_id)
+        with lock:
+            bucket = self._get_bucket(buckets, user_id)
+            available = self._refill(bucket)
 
-            if bucket.tokens < tokens:
-                wait_time = (tokens - bucket.tokens) / bucket.refill_rate
+            if available < tokens:
+                wait_time = (tokens - available) / bucket.refill_rate
                 logger.warning(
                     "Rate limit exceeded for %s. Retry after %.1f seconds",
                     user_id,
@@ -126,37 +156,37 @@ class RateLimiter:
                     details={
                         "user_id": user_id,
                         "retry_after_seconds": round(wait_time, 1),
-                        "remaining": int(bucket.tokens),
+                        "remaining": int(available),
                     },
                 )
 
-            bucket.tokens -= tokens
+            bucket.state = (available - tokens, bucket.state[1])
             logger.debug(
                 "Consumed %d token(s) for %s. Remaining: %.1f",
                 tokens,
                 user_id,
-                bucket.tokens,
+                available - tokens,
             )
 
     def remaining(self, user_id: str = "default") -> int:
         """Get remaining tokens for user.
 
+        This is a lock-free read; see _peek_tokens for its consistency.
+
         Args:
             user_id: User identifier.
 
         Returns:
             Number of remaining tokens (rounded down).
         """
-        with self._lock:
-            bucket = self._get_bucket(user_id)
-            self._refill(bucket)
-            return int(bucket.tokens)
+        return int(self._peek_tokens(user_id))
 
     def reset(self, user_id: str) -> None:
         """Reset bucket for user to full capacity."""
-        with self._lock:
-            if user_id in self._buckets:
-                del self._buckets[user_id]
+        lock, buckets = self._shard(user_id)
+        with lock:
+            if user_id in buckets:
+                del buckets[user_id]
                 logger.debug("Reset rate limit bucket for %s", user_id)
 
     def cleanup_stale(self, max_age_seconds: float = 3600) -> int:
@@ -174,23 +204,24 @@ class RateLimiter:
         now = time.monotonic()
         removed = 0
 
-        with self._lock:
-            stale_users = [
-                user_id
-                for user_id, bucket in self._buckets.items()
-                if now - bucket.last_update > max_age_seconds
-            ]
-
-            for user_id in stale_users:
-                del self._buckets[user_id]
-                removed += 1
-
-            if removed > 0:
-                logger.debug(
-                    "Cleaned up %d stale rate limit buckets (older than %ds)",
-                    removed,
-                    max_age_seconds,
-                )
+        for lock, buckets in self._shards:
+            with lock:
+                stale_users = [
+                    user_id
+                    for user_id, bucket in buckets.items()
+                    if now - bucket.state[1] > max_age_seconds
+                ]
+
+                for user_id in stale_users:
+                    del buckets[user_id]
+                removed += len(stale_users)
+
+        if removed > 0:
+            logger.debug(
+                "Cleaned up %d stale rate limit buckets (older than %ds)",
+                removed,
+                max_age_seconds,
+            )
 
         return removed
 
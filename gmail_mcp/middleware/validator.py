@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable
 
 from gmail_mcp.utils.errors import ValidationError
 
@@ -48,11 +49,11 @@ def validate_email(email: str) -> str:
     return email
 
 
-def validate_email_list(emails: list[str]) -> list[str]:
+def validate_email_list(emails: Iterable[str]) -> list[str]:
     """Validate a list of email addresses.
 
     Args:
-        emails: List of email addresses.
+        emails: Email addresses; any iterable, consumed once.
 
     Returns:
         List of validated email addresses.
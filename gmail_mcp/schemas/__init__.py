@@ -15,6 +15,7 @@ from gmail_mcp.schemas.tools import (
     OrganizeLabelsParams,
     SearchParams,
     SendEmailParams,
+    SendEmailsBatchParams,
     SummarizeThreadParams,
     TriageParams,
     UnsubscribeParams,
@@ -30,6 +31,7 @@ __all__ = [
     "ApplyLabelsParams",
     # Write tools
     "SendEmailParams",
+    "SendEmailsBatchParams",
     "ArchiveEmailParams",
     "DeleteEmailParams",
     "UnsubscribeParams",
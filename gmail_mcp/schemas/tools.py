@@ -178,6 +178,25 @@ class SendEmailParams(BaseModel):
     )
 
 
+class SendEmailsBatchParams(BaseModel):
+    """Parameters for gmail_send_emails_batch tool (HITL required).
+
+    Sends several emails under a single approval. Each email's own
+    approval_id is ignored; approval is granted for the batch as a whole.
+    """
+
+    emails: list[SendEmailParams] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Emails to send (max 100)",
+    )
+    approval_id: str | None = Field(
+        None,
+        description="Approval ID from step 1 (required for execution)",
+    )
+
+
 class ArchiveEmailParams(BaseModel):
     """Parameters for gmail_archive_email tool (HITL required).
 
@@ -43,6 +43,7 @@ from gmail_mcp.schemas.tools import (
     OrganizeLabelsParams,
     SearchParams,
     SendEmailParams,
+    SendEmailsBatchParams,
     SummarizeThreadParams,
     TriageParams,
     UnsubscribeParams,
@@ -63,6 +64,7 @@ from gmail_mcp.tools import (
     gmail_organize_labels,
     gmail_search,
     gmail_send_email,
+    gmail_send_emails_batch,
     gmail_summarize_thread,
     gmail_triage_inbox,
     gmail_unsubscribe,
@@ -526,6 +528,37 @@ def _register_write_tools(mcp: FastMCP) -> None:
         )
         return await gmail_send_email(params)
 
+    @mcp.tool(
+        name="gmail_send_emails_batch",
+        annotations=ToolAnnotations(
+            readOnlyHint=False,
+            destructiveHint=True,
+            idempotentHint=False,
+        ),
+    )
+    async def gmail_send_emails_batch_tool(
+        emails: list[dict[str, Any]],
+        approval_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Send several emails under one approval (requires HITL approval).
+
+        Two-step HITL flow:
+        1. First call (no approval_id): Returns a preview of every email
+        2. Second call (with approval_id): Sends all emails in one batch
+
+        Args:
+            emails: Emails to send (max 100). Each has to, subject, body and
+                optional cc, bcc and reply_to_thread_id, as in gmail_send_email.
+            approval_id: Approval ID from step 1 (required for execution).
+
+        Returns:
+            Approval request (step 1) or per-email send results (step 2).
+        """
+        params = SendEmailsBatchParams.model_validate(
+            {"emails": emails, "approval_id": approval_id}
+        )
+        return await gmail_send_emails_batch(params)
+
     @mcp.tool(
         name="gmail_archive_email",
         annotations=ToolAnnotations(
@@ -35,6 +35,7 @@ from gmail_mcp.tools.write import (
     gmail_delete_email,
     gmail_organize_labels,
     gmail_send_email,
+    gmail_send_emails_batch,
     gmail_unsubscribe,
 )
 
@@ -63,5 +64,6 @@ __all__ = [
     "gmail_delete_email",
     "gmail_organize_labels",
     "gmail_send_email",
+    "gmail_send_emails_batch",
     "gmail_unsubscribe",
 ]
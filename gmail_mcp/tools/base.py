@@ -12,20 +12,26 @@ import hashlib
 import json
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime, timedelta
+from operator import itemgetter
 from typing import Any, TypeVar
 
+from gmail_mcp.gmail.batch import execute_batch
+from gmail_mcp.gmail.messages import parse_headers
 from gmail_mcp.hitl.manager import approval_manager
 from gmail_mcp.hitl.models import ApprovalRequest, ApprovalResponse
 from gmail_mcp.middleware.audit_logger import audit_logger
 from gmail_mcp.middleware.rate_limiter import rate_limiter
-from gmail_mcp.utils.errors import GmailMCPError
+from gmail_mcp.utils.errors import ApprovalError, GmailMCPError
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Snippet characters shown per message in HITL previews
+PREVIEW_SNIPPET_LENGTH = 100
+
 
 # =============================================================================
 # Parameter Hash Computation
@@ -48,6 +54,29 @@ def compute_params_hash(params: dict[str, Any]) -> str:
     return hashlib.sha256(canonical.encode()).hexdigest()
 
 
+def compute_params_hash_stream(pairs: Iterable[tuple[str, Any]]) -> str:
+    """Compute the parameter hash from (key, value) pairs without a dict.
+
+    Feeds the same canonical JSON that compute_params_hash produces into the
+    hash incrementally, so the digests are interchangeable.
+
+    Args:
+        pairs: (key, value) pairs with unique string keys.
+
+    Returns:
+        Hex-encoded SHA-256 hash, equal to compute_params_hash(dict(pairs)).
+    """
+    digest = hashlib.sha256(b"{")
+    for index, (key, value) in enumerate(sorted(pairs, key=itemgetter(0))):
+        if index:
+            digest.update(b", ")
+        digest.update(json.dumps(key).encode())
+        digest.update(b": ")
+        digest.update(json.dumps(value, sort_keys=True, default=str).encode())
+    digest.update(b"}")
+    return digest.hexdigest()
+
+
 # =============================================================================
 # Standard Response Keys
 # =============================================================================
@@ -64,6 +93,18 @@ class ResponseKeys:
     ERROR_CODE = "error_code"
 
 
+# Fixed leading keys of each response, copied per call rather than built
+# from ResponseKeys attribute lookups
+_SUCCESS_TEMPLATE: dict[str, Any] = {
+    ResponseKeys.STATUS: "success",
+    ResponseKeys.DATA: None,
+}
+_ERROR_TEMPLATE: dict[str, Any] = {
+    ResponseKeys.STATUS: "error",
+    ResponseKeys.ERROR: None,
+}
+
+
 # =============================================================================
 # Response Builders
 # =============================================================================
@@ -84,10 +125,8 @@ def build_success_response(
     Returns:
         Standardized success response dict.
     """
-    response: dict[str, Any] = {
-        ResponseKeys.STATUS: "success",
-        ResponseKeys.DATA: data,
-    }
+    response = _SUCCESS_TEMPLATE.copy()
+    response[ResponseKeys.DATA] = data
     if message:
         response[ResponseKeys.MESSAGE] = message
     if count is not None:
@@ -110,10 +149,8 @@ def build_error_response(
     Returns:
         Standardized error response dict.
     """
-    response: dict[str, Any] = {
-        ResponseKeys.STATUS: "error",
-        ResponseKeys.ERROR: error,
-    }
+    response = _ERROR_TEMPLATE.copy()
+    response[ResponseKeys.ERROR] = error
     if error_code:
         response[ResponseKeys.ERROR_CODE] = error_code
     if details:
@@ -131,6 +168,7 @@ async def execute_tool(
     params: dict[str, Any],
     operation: Callable[[], T],
     user_id: str = "default",
+    tokens: int = 1,
 ) -> T:
     """Execute a tool with rate limiting and audit logging.
 
@@ -144,6 +182,7 @@ async def execute_tool(
         params: Tool parameters (for audit logging).
         operation: The actual operation to execute (sync callable).
         user_id: User identifier for rate limiting.
+        tokens: Rate limit tokens to consume, e.g. one per email sent.
 
     Returns:
         Result of the operation.
@@ -158,7 +197,7 @@ async def execute_tool(
 
     try:
         # Rate limit check
-        rate_limiter.consume(user_id)
+        rate_limiter.consume(user_id, tokens=tokens)
 
         # Execute operation
         result = operation()
@@ -199,6 +238,10 @@ def create_approval_request(
     This is used in Step 1 of the HITL two-step flow when a write tool
     is called without an approval_id.
 
+    The preview is always hashed, stored with the request and returned to
+    the client for review, so it is taken as a built dict rather than a
+    lazy builder.
+
     Args:
         action: The action type (e.g., "send_email", "delete_email").
         preview: Action-specific preview data for user review.
@@ -248,6 +291,15 @@ def validate_and_consume_approval(
         ApprovalError: If approval is invalid, expired, action mismatch,
                       or params_hash mismatch.
     """
+    # Approvals created by create_approval_request always have generated
+    # ids, so a malformed id cannot match and is rejected up front
+    if not ApprovalRequest.id_is_valid(approval_id):
+        logger.warning("Consume failed: approval_id=%s is malformed", approval_id)
+        raise ApprovalError(
+            "Invalid approval ID",
+            details={"approval_id": approval_id, "reason": "not_found"},
+        )
+
     # approval_manager.consume() raises ApprovalError on failure
     # The None return is technically unreachable but kept for type safety
     result = approval_manager.consume(
@@ -257,3 +309,63 @@ def validate_and_consume_approval(
     )
     assert result is not None  # consume() always raises or returns valid request
     return result
+
+
+def build_message_previews(
+    service: Any, message_ids: list[str]
+) -> list[dict[str, str]]:
+    """Fetch id/from/subject/snippet previews for messages in one batch.
+
+    Messages that cannot be fetched get a "(failed to fetch)" placeholder so
+    the preview (and therefore its hash) stays stable across HITL steps.
+
+    Args:
+        service: Authenticated Gmail API service.
+        message_ids: Message IDs to preview.
+
+    Returns:
+        One preview dict per message ID, in order.
+    """
+    try:
+        results = execute_batch(
+            service,
+            [
+                service.users()
+                .messages()
+                .get(
+                    userId="me",
+                    id=msg_id,
+                    format="metadata",
+                    metadataHeaders=["From", "Subject"],
+                )
+                for msg_id in message_ids
+            ],
+        )
+    except Exception as e:
+        logger.warning("Failed to fetch message previews: %s", e)
+        results = [(None, e)] * len(message_ids)
+
+    previews: list[dict[str, str]] = []
+    for msg_id, (message, exception) in zip(message_ids, results, strict=True):
+        if exception is not None or message is None:
+            logger.warning("Failed to fetch preview for %s: %s", msg_id, exception)
+            previews.append(
+                {
+                    "id": msg_id,
+                    "from": "Unknown",
+                    "subject": "(failed to fetch)",
+                    "snippet": "",
+                }
+            )
+            continue
+
+        headers = parse_headers(message)
+        previews.append(
+            {
+                "id": msg_id,
+                "from": headers.get("From", "Unknown"),
+                "subject": headers.get("Subject", "(no subject)"),
+                "snippet": message.get("snippet", "")[:PREVIEW_SNIPPET_LENGTH],
+            }
+        )
+    return previews
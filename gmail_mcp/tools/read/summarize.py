@@ -9,7 +9,7 @@ import logging
 from typing import Any
 
 from gmail_mcp.gmail.client import gmail_client
-from gmail_mcp.gmail.messages import decode_body, parse_headers
+from gmail_mcp.gmail.messages import decode_body_truncated, parse_headers
 from gmail_mcp.gmail.threads import get_thread
 from gmail_mcp.middleware.validator import validate_thread_id
 from gmail_mcp.schemas.tools import SummarizeThreadParams
@@ -25,6 +25,11 @@ logger = logging.getLogger(__name__)
 # Maximum body length to return per message
 MAX_BODY_LENGTH = 5000
 
+# Partial-response mask: drops thread and message metadata we don't return.
+# The payload is kept whole because text parts can be nested at any depth
+# (e.g. mixed > related > alternative > text/plain).
+THREAD_FIELDS = "messages(id,snippet,payload)"
+
 
 async def gmail_summarize_thread(
     params: SummarizeThreadParams, user_id: str = "default"
@@ -58,8 +63,8 @@ async def gmail_summarize_thread(
         # Get authenticated Gmail service
         service = gmail_client.get_service()
 
-        # Fetch full thread
-        thread = get_thread(service, thread_id, format="full")
+        # Fetch thread, restricted to the fields used below
+        thread = get_thread(service, thread_id, format="full", fields=THREAD_FIELDS)
 
         # Extract messages
         raw_messages = thread.get("messages", [])
@@ -76,32 +81,32 @@ async def gmail_summarize_thread(
                 count=0,
             )
 
-        # Process each message
-        messages: list[dict[str, Any]] = []
-        subject = ""
-
-        for msg in raw_messages:
-            headers = parse_headers(msg)
-            body = decode_body(msg)
-
-            # Truncate body to prevent token overflow
-            if len(body) > MAX_BODY_LENGTH:
-                body = body[:MAX_BODY_LENGTH] + "... [truncated]"
-
-            # Use first message subject as thread subject
-            if not subject:
-                subject = headers.get("Subject", "")
-
-            messages.append(
-                {
-                    "id": msg.get("id", ""),
-                    "from": headers.get("From", ""),
-                    "to": headers.get("To", ""),
-                    "date": headers.get("Date", ""),
-                    "subject": headers.get("Subject", ""),
-                    "body": body,
-                }
+        # Parse headers and decode only as much body as we return to
+        # prevent token overflow. Messages without an inline text body
+        # fall back to their snippet.
+        parsed = [
+            (
+                msg,
+                parse_headers(msg),
+                decode_body_truncated(msg, MAX_BODY_LENGTH) or msg.get("snippet", ""),
             )
+            for msg in raw_messages
+        ]
+
+        # Use first message subject as thread subject
+        subject = parsed[0][1].get("Subject", "")
+
+        messages: list[dict[str, Any]] = [
+            {
+                "id": msg.get("id", ""),
+                "from": headers.get("From", ""),
+                "to": headers.get("To", ""),
+                "date": headers.get("Date", ""),
+                "subject": headers.get("Subject", ""),
+                "body": body,
+            }
+            for msg, headers, body in parsed
+        ]
 
         return build_success_response(
             data={
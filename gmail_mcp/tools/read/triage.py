@@ -7,10 +7,16 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import Counter
+from operator import itemgetter
 from typing import Any
 
 from gmail_mcp.gmail.client import gmail_client
-from gmail_mcp.gmail.messages import get_message, list_messages, parse_headers
+from gmail_mcp.gmail.messages import (
+    batch_get_messages,
+    index_headers,
+    list_messages,
+)
 from gmail_mcp.schemas.tools import TriageParams
 from gmail_mcp.tools.base import (
     build_error_response,
@@ -26,7 +32,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 # Keywords indicating urgent emails
-URGENT_KEYWORDS = [
+URGENT_KEYWORDS = (
     "urgent",
     "asap",
     "immediately",
@@ -37,10 +43,10 @@ URGENT_KEYWORDS = [
     "deadline",
     "important",
     "priority",
-]
+)
 
 # Patterns indicating newsletters/marketing (List-Unsubscribe header or common patterns)
-NEWSLETTER_PATTERNS = [
+NEWSLETTER_PATTERNS = (
     r"unsubscribe",
     r"list-unsubscribe",
     r"email\s*preferences",
@@ -48,10 +54,10 @@ NEWSLETTER_PATTERNS = [
     r"newsletter",
     r"weekly\s*digest",
     r"daily\s*update",
-]
+)
 
 # Known social media domains
-SOCIAL_DOMAINS = [
+SOCIAL_DOMAINS = (
     "facebook.com",
     "twitter.com",
     "x.com",
@@ -63,7 +69,16 @@ SOCIAL_DOMAINS = [
     "facebookmail.com",
     "linkedin.email",
     "notifications.twitter.com",
-]
+)
+
+# Gmail's own inbox categories, trusted over text heuristics when present
+CATEGORY_LABELS = {
+    "CATEGORY_PROMOTIONS": ("newsletter", 4),
+    "CATEGORY_SOCIAL": ("social", 3),
+}
+
+# Newsletter patterns combined into one alternation, compiled once at import
+_NEWSLETTER_RE = re.compile("|".join(NEWSLETTER_PATTERNS))
 
 
 # =============================================================================
@@ -80,49 +95,37 @@ def _extract_from_domain(from_header: str) -> str:
     Returns:
         Lowercase domain or empty string if not found.
     """
-    match = re.search(r"@([a-zA-Z0-9.-]+)", from_header)
-    return match.group(1).lower() if match else ""
+    # Last "@" so quoted display names containing "@" are skipped
+    _, sep, rest = from_header.rpartition("@")
+    if not sep:
+        return ""
+    end = rest.find(">")
+    domain = rest if end < 0 else rest[:end]
+    return domain.strip().rstrip(".").lower()
 
 
-def _is_urgent(subject: str, snippet: str) -> bool:
+def _is_urgent(text_lower: str) -> bool:
     """Check if email appears urgent based on keywords.
 
     Args:
-        subject: Email subject line.
-        snippet: Email snippet/preview.
+        text_lower: Lowercased subject and snippet.
 
     Returns:
         True if email contains urgency indicators.
     """
-    text = f"{subject} {snippet}".lower()
-    return any(keyword in text for keyword in URGENT_KEYWORDS)
+    return any(keyword in text_lower for keyword in URGENT_KEYWORDS)
 
 
-def _is_newsletter(message: dict[str, Any]) -> bool:
-    """Check if email is a newsletter/marketing email.
+def _matches_newsletter_text(text_lower: str) -> bool:
+    """Check subject and snippet for newsletter patterns.
 
     Args:
-        message: Full message object from Gmail API.
+        text_lower: Lowercased subject and snippet.
 
     Returns:
-        True if email appears to be a newsletter.
+        True if the text matches a newsletter pattern.
     """
-    payload = message.get("payload", {})
-    headers = payload.get("headers", [])
-
-    # Check for List-Unsubscribe header (strong indicator)
-    for header in headers:
-        name = header.get("name", "").lower()
-        if name == "list-unsubscribe":
-            return True
-
-    # Check subject and snippet for newsletter patterns
-    headers_dict = parse_headers(message)
-    subject = headers_dict.get("Subject", "")
-    snippet = message.get("snippet", "")
-    text = f"{subject} {snippet}".lower()
-
-    return any(re.search(pattern, text) for pattern in NEWSLETTER_PATTERNS)
+    return _NEWSLETTER_RE.search(text_lower) is not None
 
 
 def _is_social(from_header: str) -> bool:
@@ -138,30 +141,36 @@ def _is_social(from_header: str) -> bool:
     return any(social in domain for social in SOCIAL_DOMAINS)
 
 
-def _categorize_email(message: dict[str, Any]) -> tuple[str, int]:
+def _categorize_email(
+    message: dict[str, Any], headers: dict[str, str]
+) -> tuple[str, int]:
     """Categorize an email by type and priority.
 
     Args:
         message: Full message object from Gmail API.
+        headers: Message headers keyed by lowercase name (index_headers).
 
     Returns:
         Tuple of (category, priority) where priority 1 is highest.
     """
-    headers = parse_headers(message)
-    subject = headers.get("Subject", "")
-    snippet = message.get("snippet", "")
-    from_header = headers.get("From", "")
+    # Keyword checks share one lowercased copy of subject and snippet
+    text_lower = f"{headers.get('subject', '')} {message.get('snippet', '')}".lower()
 
     # Check urgent first (highest priority)
-    if _is_urgent(subject, snippet):
+    if _is_urgent(text_lower):
         return "urgent", 1
 
-    # Check newsletters
-    if _is_newsletter(message):
+    # Gmail category labels already classify most bulk mail server-side
+    for label_id in message.get("labelIds", []):
+        if label_id in CATEGORY_LABELS:
+            return CATEGORY_LABELS[label_id]
+
+    # Check newsletters: header lookup first, regex sweep only if absent
+    if "list-unsubscribe" in headers or _matches_newsletter_text(text_lower):
         return "newsletter", 4
 
     # Check social
-    if _is_social(from_header):
+    if _is_social(headers.get("from", "")):
         return "social", 3
 
     # Default to "other" with medium priority
@@ -233,36 +242,32 @@ async def gmail_triage_inbox(
                 count=0,
             )
 
-        # Fetch full message details and categorize
-        triaged_emails: list[dict[str, Any]] = []
-        category_counts: dict[str, int] = {
-            "urgent": 0,
-            "other": 0,
-            "social": 0,
-            "newsletter": 0,
-        }
+        # Fetch message headers and snippets in batch, then categorize
+        message_ids = [ref["id"] for ref in messages_list if ref.get("id")]
+        messages = batch_get_messages(service, message_ids, "metadata")
 
-        for msg_ref in messages_list:
-            message_id = msg_ref.get("id")
-            if not message_id:
-                continue
+        triaged_emails: list[dict[str, Any]] = []
+        # Seeded so the summary lists categories in priority order
+        category_counts: Counter[str] = Counter(
+            {"urgent": 0, "other": 0, "social": 0, "newsletter": 0}
+        )
 
-            # Get full message
-            message = get_message(service, message_id, format="full")
-            headers = parse_headers(message)
+        for message_id, message in zip(message_ids, messages, strict=True):
+            # One pass over the headers serves categorization and the entry
+            headers = index_headers(message)
 
             # Categorize
-            category, priority = _categorize_email(message)
-            category_counts[category] = category_counts.get(category, 0) + 1
+            category, priority = _categorize_email(message, headers)
+            category_counts[category] += 1
 
             # Build result entry
             triaged_emails.append(
                 {
                     "id": message_id,
                     "thread_id": message.get("threadId", ""),
-                    "from": headers.get("From", ""),
-                    "subject": headers.get("Subject", ""),
-                    "date": headers.get("Date", ""),
+                    "from": headers.get("from", ""),
+                    "subject": headers.get("subject", ""),
+                    "date": headers.get("date", ""),
                     "snippet": message.get("snippet", ""),
                     "category": category,
                     "priority": priority,
@@ -270,7 +275,7 @@ async def gmail_triage_inbox(
             )
 
         # Sort by priority (ascending), preserving relative order within priority
-        triaged_emails.sort(key=lambda x: x["priority"])
+        triaged_emails.sort(key=itemgetter("priority"))
 
         # Build summary message
         summary_parts = [
@@ -287,7 +292,8 @@ async def gmail_triage_inbox(
     try:
         return await execute_tool(
             tool_name="gmail_triage_inbox",
-            params=params.model_dump(),
+            # Only caller-supplied fields are audited; defaults are implied
+            params=params.model_dump(exclude_unset=True),
             operation=_execute,
             user_id=user_id,
         )
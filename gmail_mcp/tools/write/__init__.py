@@ -7,7 +7,7 @@ before executing destructive operations.
 from gmail_mcp.tools.write.archive import gmail_archive_email
 from gmail_mcp.tools.write.delete import gmail_delete_email
 from gmail_mcp.tools.write.labels import gmail_create_label, gmail_organize_labels
-from gmail_mcp.tools.write.send import gmail_send_email
+from gmail_mcp.tools.write.send import gmail_send_email, gmail_send_emails_batch
 from gmail_mcp.tools.write.unsubscribe import gmail_unsubscribe
 
 __all__ = [
@@ -16,5 +16,6 @@ __all__ = [
     "gmail_delete_email",
     "gmail_organize_labels",
     "gmail_send_email",
+    "gmail_send_emails_batch",
     "gmail_unsubscribe",
 ]
@@ -6,11 +6,12 @@ import logging
 from typing import Any
 
 from gmail_mcp.gmail.client import gmail_client
-from gmail_mcp.gmail.messages import batch_modify_messages, get_message, parse_headers
+from gmail_mcp.gmail.messages import batch_modify_messages
 from gmail_mcp.middleware.validator import validate_message_ids
 from gmail_mcp.schemas.tools import ArchiveEmailParams
 from gmail_mcp.tools.base import (
     build_error_response,
+    build_message_previews,
     build_success_response,
     compute_params_hash,
     create_approval_request,
@@ -27,6 +28,33 @@ MAX_PREVIEW_MESSAGES = 5
 INBOX_LABEL = "INBOX"
 
 
+def _build_preview(service: Any, validated_ids: list[str]) -> dict[str, Any]:
+    """Build the archive approval preview.
+
+    Used for both the step 1 preview and the step 2 hash verification so
+    the two are guaranteed to match.
+
+    Args:
+        service: Authenticated Gmail API service.
+        validated_ids: Validated, de-duplicated message IDs.
+
+    Returns:
+        Preview dict with message count and up to MAX_PREVIEW_MESSAGES previews.
+    """
+    message_count = len(validated_ids)
+    preview: dict[str, Any] = {
+        "message_count": message_count,
+        "messages": build_message_previews(
+            service, validated_ids[:MAX_PREVIEW_MESSAGES]
+        ),
+    }
+
+    # Indicate if there are more messages than shown
+    if message_count > MAX_PREVIEW_MESSAGES:
+        preview["additional_messages"] = message_count - MAX_PREVIEW_MESSAGES
+    return preview
+
+
 async def gmail_archive_email(params: ArchiveEmailParams) -> dict[str, Any]:
     """Archive emails by removing them from inbox with HITL approval.
 
@@ -56,46 +84,12 @@ async def gmail_archive_email(params: ArchiveEmailParams) -> dict[str, Any]:
     try:
         # Validate message IDs upfront
         validated_ids = validate_message_ids(params.message_ids)
+        # Drop repeated IDs (order-preserving) before any API calls
+        validated_ids = list(dict.fromkeys(validated_ids))
 
         # Step 1: No approval_id - return preview for user confirmation
         if not params.approval_id:
-            # Fetch previews for first N messages
-            service = gmail_client.get_service()
-            previews: list[dict[str, str]] = []
-
-            for msg_id in validated_ids[:MAX_PREVIEW_MESSAGES]:
-                try:
-                    message = get_message(service, msg_id, format="metadata")
-                    headers = parse_headers(message)
-
-                    previews.append(
-                        {
-                            "id": msg_id,
-                            "from": headers.get("From", "Unknown"),
-                            "subject": headers.get("Subject", "(no subject)"),
-                            "snippet": message.get("snippet", "")[:100],
-                        }
-                    )
-                except GmailMCPError as e:
-                    logger.warning("Failed to fetch preview for %s: %s", msg_id, e)
-                    previews.append(
-                        {
-                            "id": msg_id,
-                            "from": "Unknown",
-                            "subject": "(failed to fetch)",
-                            "snippet": "",
-                        }
-                    )
-
-            preview = {
-                "message_count": len(validated_ids),
-                "messages": previews,
-            }
-
-            # Indicate if there are more messages than shown
-            if len(validated_ids) > MAX_PREVIEW_MESSAGES:
-                additional = len(validated_ids) - MAX_PREVIEW_MESSAGES
-                preview["additional_messages"] = additional
+            preview = _build_preview(gmail_client.get_service(), validated_ids)
 
             logger.debug(
                 "Creating archive_email approval request for %d messages",
@@ -109,45 +103,12 @@ async def gmail_archive_email(params: ArchiveEmailParams) -> dict[str, Any]:
         # Step 2: Validate approval and execute archive
         # For archive, the critical parameters are message_ids - we need to verify
         # they haven't been tampered with. We hash the same preview structure.
+        # Fetch the service once and reuse it for verification and the operation
         service = gmail_client.get_service()
-        verification_previews: list[dict[str, str]] = []
-
-        for msg_id in validated_ids[:MAX_PREVIEW_MESSAGES]:
-            try:
-                message = get_message(service, msg_id, format="metadata")
-                headers = parse_headers(message)
-
-                verification_previews.append(
-                    {
-                        "id": msg_id,
-                        "from": headers.get("From", "Unknown"),
-                        "subject": headers.get("Subject", "(no subject)"),
-                        "snippet": message.get("snippet", "")[:100],
-                    }
-                )
-            except GmailMCPError:
-                verification_previews.append(
-                    {
-                        "id": msg_id,
-                        "from": "Unknown",
-                        "subject": "(failed to fetch)",
-                        "snippet": "",
-                    }
-                )
-
-        verification_preview: dict[str, Any] = {
-            "message_count": len(validated_ids),
-            "messages": verification_previews,
-        }
-        if len(validated_ids) > MAX_PREVIEW_MESSAGES:
-            verification_preview["additional_messages"] = (
-                len(validated_ids) - MAX_PREVIEW_MESSAGES
-            )
-
         validate_and_consume_approval(
             params.approval_id,
             ACTION_NAME,
-            params_hash=compute_params_hash(verification_preview),
+            params_hash=compute_params_hash(_build_preview(service, validated_ids)),
         )
         logger.info(
             "Approval validated for archive_email, archiving %d messages",
@@ -161,7 +122,6 @@ async def gmail_archive_email(params: ArchiveEmailParams) -> dict[str, Any]:
         }
 
         def _archive_operation() -> dict[str, Any]:
-            service = gmail_client.get_service()
             batch_modify_messages(
                 service=service,
                 message_ids=validated_ids,
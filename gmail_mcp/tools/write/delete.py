@@ -6,11 +6,12 @@ import logging
 from typing import Any
 
 from gmail_mcp.gmail.client import gmail_client
-from gmail_mcp.gmail.messages import get_message, parse_headers, trash_message
+from gmail_mcp.gmail.messages import batch_trash_messages
 from gmail_mcp.middleware.validator import validate_message_ids
 from gmail_mcp.schemas.tools import DeleteEmailParams
 from gmail_mcp.tools.base import (
     build_error_response,
+    build_message_previews,
     build_success_response,
     compute_params_hash,
     create_approval_request,
@@ -30,6 +31,34 @@ DELETE_WARNING = (
 )
 
 
+def _build_preview(service: Any, validated_ids: list[str]) -> dict[str, Any]:
+    """Build the delete approval preview.
+
+    Used for both the step 1 preview and the step 2 hash verification so
+    the two are guaranteed to match.
+
+    Args:
+        service: Authenticated Gmail API service.
+        validated_ids: Validated, de-duplicated message IDs.
+
+    Returns:
+        Preview dict with message count and up to MAX_PREVIEW_MESSAGES previews.
+    """
+    message_count = len(validated_ids)
+    preview: dict[str, Any] = {
+        "message_count": message_count,
+        "messages": build_message_previews(
+            service, validated_ids[:MAX_PREVIEW_MESSAGES]
+        ),
+        "warning": DELETE_WARNING,
+    }
+
+    # Indicate if there are more messages than shown
+    if message_count > MAX_PREVIEW_MESSAGES:
+        preview["additional_messages"] = message_count - MAX_PREVIEW_MESSAGES
+    return preview
+
+
 async def gmail_delete_email(params: DeleteEmailParams) -> dict[str, Any]:
     """Delete emails by moving them to trash with HITL approval.
 
@@ -42,7 +71,7 @@ async def gmail_delete_email(params: DeleteEmailParams) -> dict[str, Any]:
 
     Step 2 (with approval_id):
         - Validates and consumes the approval
-        - Moves messages to trash using trash_message for each
+        - Moves messages to trash in batched requests
         - Returns count of deleted messages and any failures
 
     Args:
@@ -59,47 +88,12 @@ async def gmail_delete_email(params: DeleteEmailParams) -> dict[str, Any]:
     try:
         # Validate message IDs upfront
         validated_ids = validate_message_ids(params.message_ids)
+        # Drop repeated IDs (order-preserving) before any API calls
+        validated_ids = list(dict.fromkeys(validated_ids))
 
         # Step 1: No approval_id - return preview for user confirmation
         if not params.approval_id:
-            # Fetch previews for first N messages
-            service = gmail_client.get_service()
-            previews: list[dict[str, str]] = []
-
-            for msg_id in validated_ids[:MAX_PREVIEW_MESSAGES]:
-                try:
-                    message = get_message(service, msg_id, format="metadata")
-                    headers = parse_headers(message)
-
-                    previews.append(
-                        {
-                            "id": msg_id,
-                            "from": headers.get("From", "Unknown"),
-                            "subject": headers.get("Subject", "(no subject)"),
-                            "snippet": message.get("snippet", "")[:100],
-                        }
-                    )
-                except GmailMCPError as e:
-                    logger.warning("Failed to fetch preview for %s: %s", msg_id, e)
-                    previews.append(
-                        {
-                            "id": msg_id,
-                            "from": "Unknown",
-                            "subject": "(failed to fetch)",
-                            "snippet": "",
-                        }
-                    )
-
-            preview = {
-                "message_count": len(validated_ids),
-                "messages": previews,
-                "warning": DELETE_WARNING,
-            }
-
-            # Indicate if there are more messages than shown
-            if len(validated_ids) > MAX_PREVIEW_MESSAGES:
-                additional = len(validated_ids) - MAX_PREVIEW_MESSAGES
-                preview["additional_messages"] = additional
+            preview = _build_preview(gmail_client.get_service(), validated_ids)
 
             logger.debug(
                 "Creating delete_email approval request for %d messages",
@@ -113,46 +107,12 @@ async def gmail_delete_email(params: DeleteEmailParams) -> dict[str, Any]:
         # Step 2: Validate approval and execute delete
         # For delete, the critical parameters are message_ids - we need to verify
         # they haven't been tampered with. We hash the same preview structure.
+        # Fetch the service once and reuse it for verification and the operation
         service = gmail_client.get_service()
-        verification_previews: list[dict[str, str]] = []
-
-        for msg_id in validated_ids[:MAX_PREVIEW_MESSAGES]:
-            try:
-                message = get_message(service, msg_id, format="metadata")
-                headers = parse_headers(message)
-
-                verification_previews.append(
-                    {
-                        "id": msg_id,
-                        "from": headers.get("From", "Unknown"),
-                        "subject": headers.get("Subject", "(no subject)"),
-                        "snippet": message.get("snippet", "")[:100],
-                    }
-                )
-            except GmailMCPError:
-                verification_previews.append(
-                    {
-                        "id": msg_id,
-                        "from": "Unknown",
-                        "subject": "(failed to fetch)",
-                        "snippet": "",
-                    }
-                )
-
-        verification_preview: dict[str, Any] = {
-            "message_count": len(validated_ids),
-            "messages": verification_previews,
-            "warning": DELETE_WARNING,
-        }
-        if len(validated_ids) > MAX_PREVIEW_MESSAGES:
-            verification_preview["additional_messages"] = (
-                len(validated_ids) - MAX_PREVIEW_MESSAGES
-            )
-
         validate_and_consume_approval(
             params.approval_id,
             ACTION_NAME,
-            params_hash=compute_params_hash(verification_preview),
+            params_hash=compute_params_hash(_build_preview(service, validated_ids)),
         )
         logger.info(
             "Approval validated for delete_email, deleting %d messages",
@@ -166,17 +126,12 @@ async def gmail_delete_email(params: DeleteEmailParams) -> dict[str, Any]:
         }
 
         def _delete_operation() -> dict[str, Any]:
-            service = gmail_client.get_service()
-            deleted_ids: list[str] = []
-            failed_ids: list[dict[str, str]] = []
-
-            for msg_id in validated_ids:
-                try:
-                    trash_message(service, msg_id)
-                    deleted_ids.append(msg_id)
-                except GmailMCPError as e:
-                    logger.warning("Failed to delete message %s: %s", msg_id, e)
-                    failed_ids.append({"id": msg_id, "error": str(e)})
+            failures = batch_trash_messages(service, validated_ids)
+
+            deleted_ids = [msg_id for msg_id in validated_ids if msg_id not in failures]
+            failed_ids = [
+                {"id": msg_id, "error": error} for msg_id, error in failures.items()
+            ]
 
             return {
                 "deleted_count": len(deleted_ids),
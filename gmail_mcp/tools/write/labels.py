@@ -8,8 +8,10 @@ This module implements write tools for Gmail label operations:
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections.abc import Callable
+from typing import Any, cast
 
+from gmail_mcp.gmail.batch import execute_batch
 from gmail_mcp.gmail.client import gmail_client
 from gmail_mcp.gmail.labels import (
     create_label,
@@ -23,6 +25,7 @@ from gmail_mcp.tools.base import (
     build_error_response,
     build_success_response,
     compute_params_hash,
+    compute_params_hash_stream,
     create_approval_request,
     execute_tool,
     validate_and_consume_approval,
@@ -32,11 +35,33 @@ from gmail_mcp.utils.errors import ApprovalError, GmailAPIError, ValidationError
 logger = logging.getLogger(__name__)
 
 # Valid operations for organize_labels
-VALID_OPERATIONS = {"rename", "delete", "update_visibility"}
+VALID_OPERATIONS = frozenset({"rename", "delete", "update_visibility"})
 
 # Valid visibility values
-VALID_LABEL_LIST_VISIBILITY = {"labelHide", "labelShow", "labelShowIfUnread"}
-VALID_MESSAGE_LIST_VISIBILITY = {"hide", "show"}
+VALID_LABEL_LIST_VISIBILITY = frozenset({"labelHide", "labelShow", "labelShowIfUnread"})
+VALID_MESSAGE_LIST_VISIBILITY = frozenset({"hide", "show"})
+
+# Sorted copies for error details, so responses are stable across calls
+SORTED_VALID_OPERATIONS = tuple(sorted(VALID_OPERATIONS))
+SORTED_LABEL_LIST_VISIBILITY = tuple(sorted(VALID_LABEL_LIST_VISIBILITY))
+SORTED_MESSAGE_LIST_VISIBILITY = tuple(sorted(VALID_MESSAGE_LIST_VISIBILITY))
+
+ORGANIZE_WARNING = (
+    "These operations will modify your Gmail labels. "
+    "Delete operations cannot be undone."
+)
+AUTH_ERROR_MESSAGE = "Failed to authenticate with Gmail"
+
+# HTTP status Gmail returns when creating a label whose name is taken
+LABEL_CONFLICT_STATUS = 409
+
+# CreateLabelParams fields recorded in the audit log (None values are skipped)
+CREATE_LABEL_AUDIT_FIELDS = (
+    "name",
+    "label_list_visibility",
+    "message_list_visibility",
+    "approval_id",
+)
 
 
 async def gmail_create_label(params: CreateLabelParams) -> dict[str, Any]:
@@ -69,7 +94,7 @@ async def gmail_create_label(params: CreateLabelParams) -> dict[str, Any]:
             return build_error_response(
                 error=f"Invalid label_list_visibility: {params.label_list_visibility}",
                 error_code="VALIDATION_ERROR",
-                details={"valid_values": list(VALID_LABEL_LIST_VISIBILITY)},
+                details={"valid_values": SORTED_LABEL_LIST_VISIBILITY},
             )
 
         if params.message_list_visibility not in VALID_MESSAGE_LIST_VISIBILITY:
@@ -77,34 +102,30 @@ async def gmail_create_label(params: CreateLabelParams) -> dict[str, Any]:
             return build_error_response(
                 error=f"Invalid message_list_visibility: {msg_vis}",
                 error_code="VALIDATION_ERROR",
-                details={"valid_values": list(VALID_MESSAGE_LIST_VISIBILITY)},
+                details={"valid_values": SORTED_MESSAGE_LIST_VISIBILITY},
             )
 
+        # Preview fields, shared by the step 1 preview and the step 2 hash
+        preview_items = (
+            ("name", validated_name),
+            ("label_list_visibility", params.label_list_visibility),
+            ("message_list_visibility", params.message_list_visibility),
+        )
+
         # Step 1: No approval_id - return preview for user confirmation
         if not params.approval_id:
-            preview = {
-                "name": validated_name,
-                "label_list_visibility": params.label_list_visibility,
-                "message_list_visibility": params.message_list_visibility,
-            }
             return create_approval_request(
                 action="create_label",
-                preview=preview,
+                preview=dict(preview_items),
             )
 
         # Step 2: Validate approval and create label
-        # Rebuild the preview to verify parameters haven't been tampered with
-        verification_preview = {
-            "name": validated_name,
-            "label_list_visibility": params.label_list_visibility,
-            "message_list_visibility": params.message_list_visibility,
-        }
-
+        # Hash the preview fields to verify they haven't been tampered with
         try:
             validate_and_consume_approval(
                 params.approval_id,
                 expected_action="create_label",
-                params_hash=compute_params_hash(verification_preview),
+                params_hash=compute_params_hash_stream(preview_items),
             )
         except ApprovalError as e:
             return build_error_response(
@@ -118,23 +139,12 @@ async def gmail_create_label(params: CreateLabelParams) -> dict[str, Any]:
         except Exception as e:
             logger.error("Failed to get Gmail service: %s", e)
             return build_error_response(
-                error="Failed to authenticate with Gmail",
+                error=AUTH_ERROR_MESSAGE,
                 error_code="AUTH_ERROR",
             )
 
-        # Check if label already exists
-        existing_label = get_label_by_name(service, validated_name)
-        if existing_label:
-            return build_error_response(
-                error=f"Label '{validated_name}' already exists",
-                error_code="LABEL_EXISTS",
-                details={
-                    "existing_label_id": existing_label.get("id"),
-                    "existing_label_name": existing_label.get("name"),
-                },
-            )
-
-        # Create the label
+        # Create the label; duplicates are reported by Gmail itself, so the
+        # existing label is only looked up when the create is rejected
         try:
             created_label = create_label(
                 service,
@@ -143,6 +153,17 @@ async def gmail_create_label(params: CreateLabelParams) -> dict[str, Any]:
                 message_list_visibility=params.message_list_visibility,
             )
         except GmailAPIError as e:
+            if e.status_code == LABEL_CONFLICT_STATUS:
+                existing_label = get_label_by_name(service, validated_name)
+                if existing_label:
+                    return build_error_response(
+                        error=f"Label '{validated_name}' already exists",
+                        error_code="LABEL_EXISTS",
+                        details={
+                            "existing_label_id": existing_label.get("id"),
+                            "existing_label_name": existing_label.get("name"),
+                        },
+                    )
             return build_error_response(
                 error=str(e),
                 error_code="GMAIL_API_ERROR",
@@ -160,11 +181,48 @@ async def gmail_create_label(params: CreateLabelParams) -> dict[str, Any]:
 
     return await execute_tool(
         tool_name="gmail_create_label",
-        params=params.model_dump(exclude_none=True),
+        params={
+            field: value
+            for field in CREATE_LABEL_AUDIT_FIELDS
+            if (value := getattr(params, field)) is not None
+        },
         operation=operation,
     )
 
 
+def _check_rename(op: dict[str, str], index: int) -> dict[str, Any] | None:
+    """Validate the new name of a rename operation."""
+    try:
+        validate_label_name(op["new_name"])
+    except ValidationError as e:
+        return build_error_response(
+            error=f"Operation {index}: {e}",
+            error_code="VALIDATION_ERROR",
+        )
+    return None
+
+
+def _check_visibility(op: dict[str, str], index: int) -> dict[str, Any] | None:
+    """Validate the visibility value of an update_visibility operation."""
+    visibility = op["visibility"]
+    if visibility not in VALID_LABEL_LIST_VISIBILITY:
+        return build_error_response(
+            error=f"Operation {index}: invalid visibility '{visibility}'",
+            error_code="VALIDATION_ERROR",
+            details={"valid_values": SORTED_LABEL_LIST_VISIBILITY},
+        )
+    return None
+
+
+# Per-action required fields (beyond label_id) and optional value validator
+_OperationCheck = Callable[[dict[str, str], int], dict[str, Any] | None]
+_ACTION_SPEC: dict[str, tuple[tuple[str, ...], _OperationCheck | None]] = {
+    "rename": (("new_name",), _check_rename),
+    "delete": ((), None),
+    "update_visibility": (("visibility",), _check_visibility),
+}
+
+
 def _validate_operation(op: dict[str, str], index: int) -> dict[str, Any] | None:
     """Validate a single label operation.
 
@@ -182,54 +240,94 @@ def _validate_operation(op: dict[str, str], index: int) -> dict[str, Any] | None
             error_code="VALIDATION_ERROR",
         )
 
-    if action not in VALID_OPERATIONS:
+    spec = _ACTION_SPEC.get(action)
+    if spec is None:
         return build_error_response(
             error=f"Operation {index}: invalid action '{action}'",
             error_code="VALIDATION_ERROR",
-            details={"valid_actions": list(VALID_OPERATIONS)},
+            details={"valid_actions": SORTED_VALID_OPERATIONS},
         )
 
-    label_id = op.get("label_id")
-    if not label_id:
+    if not op.get("label_id"):
         return build_error_response(
             error=f"Operation {index}: missing 'label_id' field",
             error_code="VALIDATION_ERROR",
         )
 
     # Action-specific validation
-    if action == "rename":
-        new_name = op.get("new_name")
-        if not new_name:
-            return build_error_response(
-                error=f"Operation {index}: 'rename' action requires 'new_name' field",
-                error_code="VALIDATION_ERROR",
-            )
-        try:
-            validate_label_name(new_name)
-        except ValidationError as e:
-            return build_error_response(
-                error=f"Operation {index}: {e}",
-                error_code="VALIDATION_ERROR",
-            )
-
-    elif action == "update_visibility":
-        visibility = op.get("visibility")
-        if not visibility:
+    required_fields, check = spec
+    for field in required_fields:
+        if not op.get(field):
             return build_error_response(
                 error=(
-                    f"Operation {index}: 'update_visibility' action "
-                    "requires 'visibility' field"
+                    f"Operation {index}: '{action}' action requires '{field}' field"
                 ),
                 error_code="VALIDATION_ERROR",
             )
-        if visibility not in VALID_LABEL_LIST_VISIBILITY:
-            return build_error_response(
-                error=f"Operation {index}: invalid visibility '{visibility}'",
-                error_code="VALIDATION_ERROR",
-                details={"valid_values": list(VALID_LABEL_LIST_VISIBILITY)},
-            )
 
-    return None
+    return check(op, index) if check else None
+
+
+def _build_organize_preview(operations: list[dict[str, str]]) -> dict[str, Any]:
+    """Build the organize_labels approval preview.
+
+    Used for both the step 1 preview and the step 2 hash verification so
+    the two are guaranteed to match.
+
+    Args:
+        operations: Validated operation dicts.
+
+    Returns:
+        Preview dict with operation count, per-operation descriptions and
+        a warning.
+    """
+    operation_previews: list[dict[str, str]] = []
+    for op in operations:
+        match op:
+            case {"action": "rename", "label_id": label_id, "new_name": new_name}:
+                preview = {
+                    "action": "rename",
+                    "label_id": label_id,
+                    "description": f"Rename label '{label_id}' to '{new_name}'",
+                    "new_name": new_name,
+                }
+            case {"action": "delete", "label_id": label_id}:
+                preview = {
+                    "action": "delete",
+                    "label_id": label_id,
+                    "description": f"Delete label '{label_id}'",
+                }
+            case {
+                "action": "update_visibility",
+                "label_id": label_id,
+                "visibility": vis,
+            }:
+                preview = {
+                    "action": "update_visibility",
+                    "label_id": label_id,
+                    "description": (
+                        f"Update visibility of label '{label_id}' to '{vis}'"
+                    ),
+                    "visibility": vis,
+                }
+            case _:
+                # Unreachable after _validate_operation; kept so every
+                # operation still gets a preview of its own
+                action = op.get("action", "")
+                label_id = op.get("label_id", "")
+                preview = {
+                    "action": action,
+                    "label_id": label_id,
+                    "description": f"{action} on label '{label_id}'",
+                }
+
+        operation_previews.append(preview)
+
+    return {
+        "operation_count": len(operations),
+        "operations": operation_previews,
+        "warning": ORGANIZE_WARNING,
+    }
 
 
 def _execute_operation(service: Any, op: dict[str, str]) -> dict[str, Any]:
@@ -291,6 +389,84 @@ def _execute_operation(service: Any, op: dict[str, str]) -> dict[str, Any]:
         }
 
 
+def _build_operation_request(service: Any, op: dict[str, str]) -> Any:
+    """Build the unexecuted Gmail API request for a label operation.
+
+    Renames and visibility changes use labels.patch, which only touches the
+    given fields, so no prior labels.get is needed.
+
+    Args:
+        service: Gmail API service.
+        op: Validated operation dict.
+
+    Returns:
+        HttpRequest for the operation.
+    """
+    labels = service.users().labels()
+    if op["action"] == "rename":
+        body = {"name": op["new_name"]}
+    elif op["action"] == "update_visibility":
+        body = {"labelListVisibility": op["visibility"]}
+    else:
+        return labels.delete(userId="me", id=op["label_id"])
+    return labels.patch(userId="me", id=op["label_id"], body=body)
+
+
+def _execute_operations_batch(
+    service: Any, operations: list[dict[str, str]]
+) -> list[dict[str, Any]]:
+    """Execute label operations in a single Gmail batch HTTP request.
+
+    If the batch request itself cannot be sent, the operations are executed
+    one by one instead. They are not run concurrently because the service's
+    httplib2 transport is not thread-safe.
+
+    Args:
+        service: Gmail API service.
+        operations: Validated operation dicts.
+
+    Returns:
+        One result dict per operation, in order, shaped like
+        _execute_operation results.
+    """
+    try:
+        responses = execute_batch(
+            service, [_build_operation_request(service, op) for op in operations]
+        )
+    except Exception as e:
+        logger.warning(
+            "Label operations batch failed, executing %d operations individually: %s",
+            len(operations),
+            e,
+        )
+        return [_execute_operation(service, op) for op in operations]
+
+    # Pre-sized to the operation count and filled by index
+    results: list[dict[str, Any] | None] = [None] * len(operations)
+    for index, (op, (response, exception)) in enumerate(
+        zip(operations, responses, strict=True)
+    ):
+        action = op["action"]
+        label_id = op["label_id"]
+        result: dict[str, Any] = {
+            "status": "success",
+            "action": action,
+            "label_id": label_id,
+        }
+
+        if exception is not None:
+            logger.error("Failed to %s label %s: %s", action, label_id, exception)
+            result["status"] = "error"
+            result["error"] = f"Failed to {action} label {label_id}: {exception}"
+        elif action == "rename":
+            result["new_name"] = (response or {}).get("name")
+        elif action == "update_visibility":
+            result["visibility"] = (response or {}).get("labelListVisibility")
+        results[index] = result
+    # Every slot was assigned above
+    return cast("list[dict[str, Any]]", results)
+
+
 async def gmail_organize_labels(params: OrganizeLabelsParams) -> dict[str, Any]:
     """Perform batch label operations (rename, delete, update_visibility).
 
@@ -335,88 +511,18 @@ async def gmail_organize_labels(params: OrganizeLabelsParams) -> dict[str, Any]:
 
         # Step 1: No approval_id - return preview for user confirmation
         if not params.approval_id:
-            # Build human-readable operation descriptions
-            operation_previews = []
-            for op in operations:
-                action = op["action"]
-                label_id = op["label_id"]
-
-                if action == "rename":
-                    desc = f"Rename label '{label_id}' to '{op['new_name']}'"
-                elif action == "delete":
-                    desc = f"Delete label '{label_id}'"
-                elif action == "update_visibility":
-                    vis = op["visibility"]
-                    desc = f"Update visibility of label '{label_id}' to '{vis}'"
-                else:
-                    desc = f"{action} on label '{label_id}'"
-
-                operation_previews.append(
-                    {
-                        "action": action,
-                        "label_id": label_id,
-                        "description": desc,
-                        **{
-                            k: v
-                            for k, v in op.items()
-                            if k not in ("action", "label_id")
-                        },
-                    }
-                )
-
-            preview = {
-                "operation_count": len(operations),
-                "operations": operation_previews,
-                "warning": (
-                    "These operations will modify your Gmail labels. "
-                    "Delete operations cannot be undone."
-                ),
-            }
             return create_approval_request(
                 action="organize_labels",
-                preview=preview,
+                preview=_build_organize_preview(operations),
             )
 
         # Step 2: Validate approval and execute operations
         # Rebuild the preview to verify parameters haven't been tampered with
-        verification_operation_previews = []
-        for op in operations:
-            action = op["action"]
-            label_id = op["label_id"]
-
-            if action == "rename":
-                desc = f"Rename label '{label_id}' to '{op['new_name']}'"
-            elif action == "delete":
-                desc = f"Delete label '{label_id}'"
-            elif action == "update_visibility":
-                vis = op["visibility"]
-                desc = f"Update visibility of label '{label_id}' to '{vis}'"
-            else:
-                desc = f"{action} on label '{label_id}'"
-
-            verification_operation_previews.append(
-                {
-                    "action": action,
-                    "label_id": label_id,
-                    "description": desc,
-                    **{k: v for k, v in op.items() if k not in ("action", "label_id")},
-                }
-            )
-
-        verification_preview = {
-            "operation_count": len(operations),
-            "operations": verification_operation_previews,
-            "warning": (
-                "These operations will modify your Gmail labels. "
-                "Delete operations cannot be undone."
-            ),
-        }
-
         try:
             validate_and_consume_approval(
                 params.approval_id,
                 expected_action="organize_labels",
-                params_hash=compute_params_hash(verification_preview),
+                params_hash=compute_params_hash(_build_organize_preview(operations)),
             )
         except ApprovalError as e:
             return build_error_response(
@@ -430,22 +536,18 @@ async def gmail_organize_labels(params: OrganizeLabelsParams) -> dict[str, Any]:
         except Exception as e:
             logger.error("Failed to get Gmail service: %s", e)
             return build_error_response(
-                error="Failed to authenticate with Gmail",
+                error=AUTH_ERROR_MESSAGE,
                 error_code="AUTH_ERROR",
             )
 
-        # Execute each operation and collect results
-        results = []
-        success_count = 0
-        failure_count = 0
-
-        for op in operations:
-            result = _execute_operation(service, op)
-            results.append(result)
-            if result["status"] == "success":
-                success_count += 1
-            else:
-                failure_count += 1
+        # Single operations run directly; larger sets share one batch request
+        if len(operations) == 1:
+            results = [_execute_operation(service, operations[0])]
+        else:
+            results = _execute_operations_batch(service, operations)
+
+        success_count = sum(1 for r in results if r["status"] == "success")
+        failure_count = len(results) - success_count
 
         # Build response based on results
         if failure_count == 0:
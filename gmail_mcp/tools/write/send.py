@@ -3,16 +3,18 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
+from itertools import chain
 from typing import Any
 
 from gmail_mcp.gmail.client import gmail_client
-from gmail_mcp.gmail.messages import send_message
+from gmail_mcp.gmail.messages import batch_send_messages, build_send_body, send_message
 from gmail_mcp.middleware.validator import (
     validate_email,
     validate_email_list,
     validate_thread_id,
 )
-from gmail_mcp.schemas.tools import SendEmailParams
+from gmail_mcp.schemas.tools import SendEmailParams, SendEmailsBatchParams
 from gmail_mcp.tools.base import (
     build_error_response,
     build_success_response,
@@ -27,9 +29,121 @@ logger = logging.getLogger(__name__)
 
 # Constants
 ACTION_NAME = "send_email"
+BATCH_ACTION_NAME = "send_emails_batch"
 BODY_PREVIEW_MAX_LENGTH = 500
 
 
+@dataclass(frozen=True)
+class _ValidatedEmail:
+    """Email fields after validation, shared by single and batch sends."""
+
+    to: str
+    subject: str
+    body: str
+    cc: list[str]
+    bcc: list[str]
+    thread_id: str | None
+
+
+def _body_preview(body: str) -> str:
+    """Truncate the body for the approval preview.
+
+    Bodies within BODY_PREVIEW_MAX_LENGTH are returned as-is without copying.
+
+    Args:
+        body: Full email body.
+
+    Returns:
+        Body, truncated with "..." appended if longer than the limit.
+    """
+    if len(body) <= BODY_PREVIEW_MAX_LENGTH:
+        return body
+    return body[:BODY_PREVIEW_MAX_LENGTH] + "..."
+
+
+def _validate_email_params(params: SendEmailParams) -> _ValidatedEmail:
+    """Validate recipients and thread ID of an email.
+
+    SendEmailParams already checks EmailStr, but validate_email is stricter
+    (ASCII-only, 254 chars max) and strips whitespace, so it is not skipped.
+
+    Args:
+        params: Email parameters.
+
+    Returns:
+        Validated email fields.
+
+    Raises:
+        ValidationError: If an address or the thread ID is invalid.
+    """
+    validated_to = validate_email(params.to)
+    # CC and BCC are validated in one pass, then split back apart
+    validated_recipients = validate_email_list(chain(params.cc, params.bcc))
+
+    validated_thread_id: str | None = None
+    if params.reply_to_thread_id:
+        validated_thread_id = validate_thread_id(params.reply_to_thread_id)
+
+    return _ValidatedEmail(
+        to=validated_to,
+        subject=params.subject,
+        body=params.body,
+        cc=validated_recipients[: len(params.cc)],
+        bcc=validated_recipients[len(params.cc) :],
+        thread_id=validated_thread_id,
+    )
+
+
+def _build_preview(email: _ValidatedEmail) -> dict[str, Any]:
+    """Build the approval preview for one email.
+
+    Used for both the step 1 preview and the step 2 hash verification so
+    the two are guaranteed to match.
+
+    Args:
+        email: Validated email fields.
+
+    Returns:
+        Preview dict with to, subject, truncated body and optional cc, bcc
+        and reply_to_thread_id.
+    """
+    preview: dict[str, Any] = {
+        "to": email.to,
+        "subject": email.subject,
+        "body_preview": _body_preview(email.body),
+    }
+
+    # Only include cc/bcc in preview if present
+    if email.cc:
+        preview["cc"] = email.cc
+    if email.bcc:
+        preview["bcc"] = email.bcc
+    if email.thread_id:
+        preview["reply_to_thread_id"] = email.thread_id
+    return preview
+
+
+def _audit_params(email: _ValidatedEmail) -> dict[str, Any]:
+    """Build the audit log entry for one email.
+
+    The body itself is never logged, only whether one was given.
+
+    Args:
+        email: Validated email fields.
+
+    Returns:
+        Audit dict with to, subject, cc, bcc, reply_to_thread_id and has_body.
+    """
+    return {
+        "to": email.to,
+        "subject": email.subject,
+        "cc": email.cc,
+        "bcc": email.bcc,
+        "reply_to_thread_id": email.thread_id,
+        "has_body": bool(email.body),
+    }
+
+
 async def gmail_send_email(params: SendEmailParams) -> dict[str, Any]:
     """Send an email with HITL approval.
 
@@ -62,85 +176,39 @@ async def gmail_send_email(params: SendEmailParams) -> dict[str, Any]:
             - Error response: status, error, error_code
     """
     try:
-        # Validate email addresses upfront
-        validated_to = validate_email(params.to)
-        validated_cc = validate_email_list(list(params.cc)) if params.cc else []
-        validated_bcc = validate_email_list(list(params.bcc)) if params.bcc else []
-
-        # Validate thread_id if provided
-        validated_thread_id: str | None = None
-        if params.reply_to_thread_id:
-            validated_thread_id = validate_thread_id(params.reply_to_thread_id)
+        # Validate email addresses and thread ID upfront
+        email = _validate_email_params(params)
 
         # Step 1: No approval_id - return preview for user confirmation
         if not params.approval_id:
-            # Build preview with truncated body
-            body_preview = params.body[:BODY_PREVIEW_MAX_LENGTH]
-            if len(params.body) > BODY_PREVIEW_MAX_LENGTH:
-                body_preview += "..."
-
-            preview: dict[str, Any] = {
-                "to": validated_to,
-                "subject": params.subject,
-                "body_preview": body_preview,
-            }
-
-            # Only include cc/bcc in preview if present
-            if validated_cc:
-                preview["cc"] = validated_cc
-            if validated_bcc:
-                preview["bcc"] = validated_bcc
-            if validated_thread_id:
-                preview["reply_to_thread_id"] = validated_thread_id
-
-            logger.debug("Creating send_email approval request for: %s", validated_to)
+            logger.debug("Creating send_email approval request for: %s", email.to)
             return create_approval_request(
                 action=ACTION_NAME,
-                preview=preview,
+                preview=_build_preview(email),
             )
 
         # Step 2: Validate approval and execute send
         # Rebuild the preview to verify parameters haven't been tampered with
-        verification_preview: dict[str, Any] = {
-            "to": validated_to,
-            "subject": params.subject,
-            "body_preview": params.body[:BODY_PREVIEW_MAX_LENGTH]
-            + ("..." if len(params.body) > BODY_PREVIEW_MAX_LENGTH else ""),
-        }
-        if validated_cc:
-            verification_preview["cc"] = validated_cc
-        if validated_bcc:
-            verification_preview["bcc"] = validated_bcc
-        if validated_thread_id:
-            verification_preview["reply_to_thread_id"] = validated_thread_id
-
         validate_and_consume_approval(
             params.approval_id,
             ACTION_NAME,
-            params_hash=compute_params_hash(verification_preview),
+            params_hash=compute_params_hash(_build_preview(email)),
         )
         logger.info("Approval validated for send_email, proceeding to send")
 
         # Prepare audit params (exclude sensitive body content)
-        audit_params = {
-            "to": validated_to,
-            "subject": params.subject,
-            "cc": validated_cc,
-            "bcc": validated_bcc,
-            "reply_to_thread_id": validated_thread_id,
-            "has_body": bool(params.body),
-        }
+        audit_params = _audit_params(email)
 
         def _send_operation() -> dict[str, Any]:
             service = gmail_client.get_service()
             result = send_message(
                 service=service,
-                to=validated_to,
-                subject=params.subject,
-                body=params.body,
-                cc=validated_cc if validated_cc else None,
-                bcc=validated_bcc if validated_bcc else None,
-                thread_id=validated_thread_id,
+                to=email.to,
+                subject=email.subject,
+                body=email.body,
+                cc=email.cc if email.cc else None,
+                bcc=email.bcc if email.bcc else None,
+                thread_id=email.thread_id,
             )
             return {
                 "message_id": result.get("id"),
@@ -156,7 +224,7 @@ async def gmail_send_email(params: SendEmailParams) -> dict[str, Any]:
         logger.info("Email sent successfully: %s", result.get("message_id"))
         return build_success_response(
             data=result,
-            message=f"Email sent successfully to {validated_to}",
+            message=f"Email sent successfully to {email.to}",
         )
 
     except ValidationError as e:
@@ -177,3 +245,150 @@ async def gmail_send_email(params: SendEmailParams) -> dict[str, Any]:
             error="An internal error occurred while sending email",
             error_code="INTERNAL_ERROR",
         )
+
+
+async def gmail_send_emails_batch(params: SendEmailsBatchParams) -> dict[str, Any]:
+    """Send several emails under one HITL approval.
+
+    Step 1 (no approval_id):
+        - Validates every email's addresses
+        - Returns one preview per email for a single confirmation
+
+    Step 2 (with approval_id):
+        - Validates and consumes the approval
+        - Sends all emails in one Gmail batch HTTP request
+        - Returns per-email message IDs or errors
+
+    Args:
+        params: SendEmailsBatchParams with the emails and optional approval_id.
+
+    Returns:
+        dict with either:
+            - Approval request (step 1): status, approval_id, preview, message
+            - Success response (step 2): status, data with per-email results
+            - Error response: status, error, error_code
+    """
+    try:
+        # Validate all emails upfront, reporting which one failed
+        emails: list[_ValidatedEmail] = []
+        for index, email_params in enumerate(params.emails):
+            try:
+                emails.append(_validate_email_params(email_params))
+            except ValidationError as e:
+                raise ValidationError(f"Email {index}: {e}") from e
+
+        batch_preview = {
+            "email_count": len(emails),
+            "emails": [_build_preview(email) for email in emails],
+        }
+
+        # Step 1: No approval_id - return preview for user confirmation
+        if not params.approval_id:
+            logger.debug(
+                "Creating send_emails_batch approval request for %d emails",
+                len(emails),
+            )
+            return create_approval_request(
+                action=BATCH_ACTION_NAME,
+                preview=batch_preview,
+            )
+
+        # Step 2: Validate approval and execute sends
+        validate_and_consume_approval(
+            params.approval_id,
+            BATCH_ACTION_NAME,
+            params_hash=compute_params_hash(batch_preview),
+        )
+        logger.info(
+            "Approval validated for send_emails_batch, sending %d emails",
+            len(emails),
+        )
+
+        # Prepare audit params (exclude sensitive body content)
+        audit_params = {
+            "email_count": len(emails),
+            "emails": [_audit_params(email) for email in emails],
+        }
+
+        def _send_batch_operation() -> list[dict[str, Any]]:
+            service = gmail_client.get_service()
+            send_bodies = [
+                build_send_body(
+                    email.to,
+                    email.subject,
+                    email.body,
+                    cc=email.cc or None,
+                    bcc=email.bcc or None,
+                    thread_id=email.thread_id,
+                )
+                for email in emails
+            ]
+            results: list[dict[str, Any]] = []
+            for email, (sent, exception) in zip(
+                emails, batch_send_messages(service, send_bodies), strict=True
+            ):
+                if exception is not None or sent is None:
+                    logger.error("Failed to send email to %s: %s", email.to, exception)
+                    results.append(
+                        {"to": email.to, "status": "error", "error": str(exception)}
+                    )
+                else:
+                    results.append(
+                        {
+                            "to": email.to,
+                            "status": "success",
+                            "message_id": sent.get("id"),
+                            "thread_id": sent.get("threadId"),
+                        }
+                    )
+            return results
+
+        results = await execute_tool(
+            tool_name="gmail_send_emails_batch",
+            params=audit_params,
+            operation=_send_batch_operation,
+            # Each email counts against the limit as a single send would
+            tokens=len(emails),
+        )
+
+        success_count = sum(1 for result in results if result["status"] == "success")
+        failure_count = len(results) - success_count
+        data = {
+            "results": results,
+            "success_count": success_count,
+            "failure_count": failure_count,
+        }
+
+        if success_count == 0:
+            return build_error_response(
+                error="All emails failed to send",
+                error_code="ALL_OPERATIONS_FAILED",
+                details=data,
+            )
+        if failure_count:
+            data["partial_success"] = True
+            message = f"Partial success: {success_count} sent, {failure_count} failed"
+        else:
+            message = f"All {success_count} emails sent successfully"
+
+        logger.info("Sent %d of %d batched emails", success_count, len(results))
+        return build_success_response(data=data, message=message, count=success_count)
+
+    except ValidationError as e:
+        logger.warning("Validation error in send_emails_batch: %s", e)
+        return build_error_response(
+            error=str(e),
+            error_code="VALIDATION_ERROR",
+        )
+    except GmailMCPError as e:
+        logger.error("Gmail MCP error in send_emails_batch: %s", e)
+        return build_error_response(
+            error=str(e),
+            error_code=e.__class__.__name__.upper(),
+        )
+    except Exception:
+        logger.exception("Unexpected error in send_emails_batch")
+        return build_error_response(
+            error="An internal error occurred while sending emails",
+            error_code="INTERNAL_ERROR",
+        )
@@ -11,7 +11,7 @@ import re
 from typing import Any
 
 from gmail_mcp.gmail.client import gmail_client
-from gmail_mcp.gmail.messages import get_message, parse_headers
+from gmail_mcp.gmail.messages import get_message, index_headers
 from gmail_mcp.middleware.validator import validate_message_id
 from gmail_mcp.schemas.tools import UnsubscribeParams
 from gmail_mcp.tools.base import (
@@ -26,13 +26,27 @@ from gmail_mcp.utils.errors import ApprovalError, GmailAPIError, ValidationError
 
 logger = logging.getLogger(__name__)
 
-# Regex patterns for extracting unsubscribe links
-HTTP_LINK_PATTERN = re.compile(r"<(https?://[^>]+)>")
-MAILTO_LINK_PATTERN = re.compile(r"<(mailto:[^>]+)>")
+# Single-pass pattern for unsubscribe links: group 1 is an HTTP(S) link,
+# group 2 a mailto link
+UNSUBSCRIBE_LINK_PATTERN = re.compile(r"<(https?://[^>]+)>|<(mailto:[^>]+)>")
+HTTP_LINK_PREFIXES = ("http://", "https://")
+
+# UnsubscribeParams fields recorded in the audit log (None values are skipped)
+UNSUBSCRIBE_AUDIT_FIELDS = ("message_id", "approval_id")
+
+_BASE_WARNING = (
+    "This will return the unsubscribe link. "
+    "You will need to follow the link to complete unsubscription."
+)
+# Preview warnings indexed by is_mailto
+UNSUBSCRIBE_WARNINGS = (
+    _BASE_WARNING,
+    _BASE_WARNING + " For mailto links, an email must be sent to unsubscribe.",
+)
 
 
 def _extract_unsubscribe_link(
-    headers_raw: list[dict[str, Any]],
+    list_unsubscribe_value: str | None,
 ) -> dict[str, Any] | None:
     """Extract unsubscribe link from List-Unsubscribe header.
 
@@ -42,37 +56,47 @@ def _extract_unsubscribe_link(
     - <https://...>, <mailto:...> (multiple options)
 
     Args:
-        headers_raw: Raw headers list from Gmail API message payload.
+        list_unsubscribe_value: Value of the List-Unsubscribe header, or None
+            if the message has no such header.
 
     Returns:
         Dict with unsubscribe link info, or None if not found.
         Keys: link, is_mailto, raw_header
     """
-    # Find List-Unsubscribe header (case-insensitive)
-    list_unsubscribe_value = None
-    for header in headers_raw:
-        name = header.get("name", "").lower()
-        if name == "list-unsubscribe":
-            list_unsubscribe_value = header.get("value", "")
-            break
-
     if not list_unsubscribe_value:
         return None
 
-    # Try to extract HTTP link first (preferred)
-    http_match = HTTP_LINK_PATTERN.search(list_unsubscribe_value)
-    if http_match:
-        return {
-            "link": http_match.group(1),
-            "is_mailto": False,
-            "raw_header": list_unsubscribe_value,
-        }
+    # Fast path: most headers carry a well-formed <http...> link, which can
+    # be sliced out with two finds instead of running the regex
+    start = list_unsubscribe_value.find("<http")
+    end = list_unsubscribe_value.find(">", start)
+    if start >= 0 and end >= 0:
+        candidate = list_unsubscribe_value[start + 1 : end]
+        if candidate.startswith(HTTP_LINK_PREFIXES):
+            scheme_end = candidate.find("://") + 3
+            if len(candidate) > scheme_end:
+                return {
+                    "link": candidate,
+                    "is_mailto": False,
+                    "raw_header": list_unsubscribe_value,
+                }
+
+    # Prefer the first HTTP link, falling back to the first mailto link
+    mailto_link = None
+    for match in UNSUBSCRIBE_LINK_PATTERN.finditer(list_unsubscribe_value):
+        http_link, mailto = match.groups()
+        if http_link:
+            return {
+                "link": http_link,
+                "is_mailto": False,
+                "raw_header": list_unsubscribe_value,
+            }
+        if mailto_link is None:
+            mailto_link = mailto
 
-    # Fall back to mailto link
-    mailto_match = MAILTO_LINK_PATTERN.search(list_unsubscribe_value)
-    if mailto_match:
+    if mailto_link:
         return {
-            "link": mailto_match.group(1),
+            "link": mailto_link,
             "is_mailto": True,
             "raw_header": list_unsubscribe_value,
         }
@@ -84,6 +108,36 @@ def _extract_unsubscribe_link(
     return None
 
 
+def _build_preview(
+    message_id: str,
+    sender: str,
+    subject: str,
+    unsubscribe_info: dict[str, Any],
+) -> dict[str, Any]:
+    """Build the unsubscribe approval preview.
+
+    Used for both the step 1 preview and the step 2 hash verification so
+    the two are guaranteed to match.
+
+    Args:
+        message_id: Validated message ID.
+        sender: From header of the message.
+        subject: Subject header of the message.
+        unsubscribe_info: Result of _extract_unsubscribe_link.
+
+    Returns:
+        Preview dict with message details, the link and a warning.
+    """
+    return {
+        "message_id": message_id,
+        "from": sender,
+        "subject": subject,
+        "unsubscribe_link": unsubscribe_info["link"],
+        "is_mailto": unsubscribe_info["is_mailto"],
+        "warning": UNSUBSCRIBE_WARNINGS[unsubscribe_info["is_mailto"]],
+    }
+
+
 async def gmail_unsubscribe(params: UnsubscribeParams) -> dict[str, Any]:
     """Unsubscribe from a mailing list using List-Unsubscribe header.
 
@@ -131,71 +185,42 @@ async def gmail_unsubscribe(params: UnsubscribeParams) -> dict[str, Any]:
                 error_code="GMAIL_API_ERROR",
             )
 
-        # Extract headers
-        payload = message.get("payload", {})
-        headers_raw = payload.get("headers", [])
-        parsed_headers = parse_headers(message)
+        # Index headers once for the sender, subject and unsubscribe lookups
+        headers = index_headers(message)
+        sender = headers.get("from", "Unknown")
+        subject = headers.get("subject", "No Subject")
 
         # Extract unsubscribe link
-        unsubscribe_info = _extract_unsubscribe_link(headers_raw)
+        unsubscribe_info = _extract_unsubscribe_link(headers.get("list-unsubscribe"))
         if not unsubscribe_info:
             return build_error_response(
                 error="No List-Unsubscribe header found in this email",
                 error_code="NO_UNSUBSCRIBE_HEADER",
                 details={
                     "message_id": validated_message_id,
-                    "from": parsed_headers.get("From", "Unknown"),
-                    "subject": parsed_headers.get("Subject", "No Subject"),
+                    "from": sender,
+                    "subject": subject,
                 },
             )
 
+        preview = _build_preview(
+            validated_message_id, sender, subject, unsubscribe_info
+        )
+
         # Step 1: No approval_id - return preview for user confirmation
         if not params.approval_id:
-            preview = {
-                "message_id": validated_message_id,
-                "from": parsed_headers.get("From", "Unknown"),
-                "subject": parsed_headers.get("Subject", "No Subject"),
-                "unsubscribe_link": unsubscribe_info["link"],
-                "is_mailto": unsubscribe_info["is_mailto"],
-                "warning": (
-                    "This will return the unsubscribe link. "
-                    "You will need to follow the link to complete unsubscription."
-                    + (
-                        " For mailto links, an email must be sent to unsubscribe."
-                        if unsubscribe_info["is_mailto"]
-                        else ""
-                    )
-                ),
-            }
             return create_approval_request(
                 action="unsubscribe",
                 preview=preview,
             )
 
         # Step 2: Validate approval and return unsubscribe info
-        # Rebuild the preview to verify parameters haven't been tampered with
-        verification_preview = {
-            "message_id": validated_message_id,
-            "from": parsed_headers.get("From", "Unknown"),
-            "subject": parsed_headers.get("Subject", "No Subject"),
-            "unsubscribe_link": unsubscribe_info["link"],
-            "is_mailto": unsubscribe_info["is_mailto"],
-            "warning": (
-                "This will return the unsubscribe link. "
-                "You will need to follow the link to complete unsubscription."
-                + (
-                    " For mailto links, an email must be sent to unsubscribe."
-                    if unsubscribe_info["is_mailto"]
-                    else ""
-                )
-            ),
-        }
-
+        # The rebuilt preview must match the approved one to rule out tampering
         try:
             validate_and_consume_approval(
                 params.approval_id,
                 expected_action="unsubscribe",
-                params_hash=compute_params_hash(verification_preview),
+                params_hash=compute_params_hash(preview),
             )
         except ApprovalError as e:
             return build_error_response(
@@ -207,8 +232,8 @@ async def gmail_unsubscribe(params: UnsubscribeParams) -> dict[str, Any]:
         return build_success_response(
             data={
                 "message_id": validated_message_id,
-                "from": parsed_headers.get("From", "Unknown"),
-                "subject": parsed_headers.get("Subject", "No Subject"),
+                "from": sender,
+                "subject": subject,
                 "unsubscribe_link": unsubscribe_info["link"],
                 "is_mailto": unsubscribe_info["is_mailto"],
                 "action_required": (
@@ -222,6 +247,10 @@ async def gmail_unsubscribe(params: UnsubscribeParams) -> dict[str, Any]:
 
     return await execute_tool(
         tool_name="gmail_unsubscribe",
-        params=params.model_dump(exclude_none=True),
+        params={
+            field: value
+            for field in UNSUBSCRIBE_AUDIT_FIELDS
+            if (value := getattr(params, field)) is not None
+        },
         operation=operation,
     )
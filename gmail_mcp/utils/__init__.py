@@ -5,8 +5,11 @@ encryption helpers, and other shared functionality.
 """
 
 from gmail_mcp.utils.encryption import (
+    decrypt_blob,
     decrypt_data,
+    encrypt_blob,
     encrypt_data,
+    encrypt_many,
     generate_key,
     key_from_hex,
 )
@@ -25,6 +28,9 @@ __all__ = [
     "generate_key",
     "encrypt_data",
     "decrypt_data",
+    "encrypt_many",
+    "encrypt_blob",
+    "decrypt_blob",
     "key_from_hex",
     # Exception hierarchy
     "GmailMCPError",
@@ -3,19 +3,28 @@
 This module provides cryptographic functions for encrypting and decrypting
 sensitive data (primarily OAuth tokens) using AES-256-GCM authenticated
 encryption. GCM mode provides both confidentiality and integrity protection.
+ChaCha20-Poly1305 is available for hosts without hardware AES, where it is
+considerably faster than software AES-GCM.
 
 Security considerations:
 - Keys must be 256 bits (32 bytes) for AES-256
 - IVs are 96 bits (12 bytes) and must be unique per encryption
 - Never reuse an IV with the same key
+- IVs are drawn fresh from the CSPRNG rather than a per-process counter,
+  which would repeat across forked processes sharing the key
 - Store keys securely (environment variables, secrets manager)
 """
 
 from __future__ import annotations
 
-import os
+import binascii
+import secrets
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import NoReturn
 
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
 
 from gmail_mcp.utils.errors import TokenError, ValidationError
 
@@ -23,7 +32,49 @@ from gmail_mcp.utils.errors import TokenError, ValidationError
 KEY_SIZE_BITS = 256
 KEY_SIZE_BYTES = KEY_SIZE_BITS // 8  # 32 bytes
 IV_SIZE_BYTES = 12  # 96 bits, recommended for GCM
+TAG_SIZE_BYTES = 16  # 128-bit GCM authentication tag
 HEX_KEY_LENGTH = KEY_SIZE_BYTES * 2  # 64 hex characters
+CIPHER_CACHE_SIZE = 4  # Distinct keys whose AEAD contexts are kept
+
+# Supported AEAD algorithms; both take a 32-byte key and a 12-byte nonce
+AES_256_GCM = "aes-256-gcm"
+CHACHA20_POLY1305 = "chacha20-poly1305"
+_AEAD_CLASSES: dict[str, type[AESGCM] | type[ChaCha20Poly1305]] = {
+    AES_256_GCM: AESGCM,
+    CHACHA20_POLY1305: ChaCha20Poly1305,
+}
+SUPPORTED_ALGORITHMS = tuple(_AEAD_CLASSES)
+
+CPUINFO_PATH = "/proc/cpuinfo"
+
+
+def _has_hardware_aes(cpuinfo_path: str = CPUINFO_PATH) -> bool:
+    """Check whether the CPU advertises AES instructions.
+
+    Reads the x86 ``flags`` or ARM ``Features`` line of /proc/cpuinfo.
+    Where that is unavailable (macOS, Windows) or inconclusive, hardware
+    AES is assumed, as on every mainstream desktop and server CPU.
+
+    Args:
+        cpuinfo_path: Path to the cpuinfo file.
+
+    Returns:
+        False only if cpuinfo lists CPU features without "aes".
+    """
+    try:
+        with open(cpuinfo_path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                name, sep, features = line.partition(":")
+                if sep and name.strip() in ("flags", "Features"):
+                    return "aes" in features.split()
+    except OSError:
+        pass
+    return True
+
+
+# AES-GCM without AES-NI/ARMv8 crypto extensions runs in software and is
+# several times slower than ChaCha20-Poly1305, so prefer the latter there
+DEFAULT_ALGORITHM = AES_256_GCM if _has_hardware_aes() else CHACHA20_POLY1305
 
 
 def generate_key() -> bytes:
@@ -45,7 +96,9 @@ def generate_key() -> bytes:
     return AESGCM.generate_key(bit_length=KEY_SIZE_BITS)
 
 
-def encrypt_data(plaintext: bytes, key: bytes) -> dict[str, bytes]:
+def encrypt_data(
+    plaintext: bytes, key: bytes, algorithm: str = AES_256_GCM
+) -> dict[str, bytes]:
     """Encrypt data using AES-256-GCM authenticated encryption.
 
     Generates a unique 12-byte IV for each encryption operation to ensure
@@ -54,6 +107,8 @@ def encrypt_data(plaintext: bytes, key: bytes) -> dict[str, bytes]:
     Args:
         plaintext: The data to encrypt.
         key: A 32-byte (256-bit) encryption key.
+        algorithm: AEAD algorithm, AES_256_GCM or CHACHA20_POLY1305. The
+            same algorithm must be passed to decrypt_data.
 
     Returns:
         A dictionary containing:
@@ -61,7 +116,8 @@ def encrypt_data(plaintext: bytes, key: bytes) -> dict[str, bytes]:
             - "ciphertext": The encrypted data with authentication tag
 
     Raises:
-        ValidationError: If the key is not exactly 32 bytes.
+        ValidationError: If the key is not exactly 32 bytes or the
+            algorithm is not supported.
         TokenError: If encryption fails for any reason.
 
     Example:
@@ -71,12 +127,14 @@ def encrypt_data(plaintext: bytes, key: bytes) -> dict[str, bytes]:
         >>> encrypted.keys()
         dict_keys(['iv', 'ciphertext'])
     """
-    _validate_key(key)
+    if len(key) != KEY_SIZE_BYTES:
+        _raise_invalid_key(key)
+    if algorithm not in _AEAD_CLASSES:
+        _raise_unsupported_algorithm(algorithm)
 
     try:
-        iv = os.urandom(IV_SIZE_BYTES)
-        aesgcm = AESGCM(key)
-        ciphertext = aesgcm.encrypt(iv, plaintext, None)
+        iv = secrets.token_bytes(IV_SIZE_BYTES)
+        ciphertext = _cipher_for_key(key, algorithm).encrypt(iv, plaintext, None)
         return {"iv": iv, "ciphertext": ciphertext}
     except Exception as e:
         raise TokenError(
@@ -85,7 +143,50 @@ def encrypt_data(plaintext: bytes, key: bytes) -> dict[str, bytes]:
         ) from e
 
 
-def decrypt_data(iv: bytes, ciphertext: bytes, key: bytes) -> bytes:
+def encrypt_many(plaintexts: Iterable[bytes], key: bytes) -> list[tuple[bytes, bytes]]:
+    """Encrypt several payloads with one key in a single call.
+
+    Validates the key and resolves its AESGCM context once, then encrypts
+    each payload under its own fresh IV. Useful when rotating the tokens of
+    several accounts together.
+
+    Args:
+        plaintexts: The payloads to encrypt.
+        key: A 32-byte (256-bit) encryption key.
+
+    Returns:
+        List of (iv, ciphertext) tuples in input order, each suitable for
+        decrypt_data.
+
+    Raises:
+        ValidationError: If the key is not exactly 32 bytes.
+        TokenError: If encryption fails for any payload.
+
+    Example:
+        >>> key = generate_key()
+        >>> [(iv, ct)] = encrypt_many([b"token"], key)
+        >>> decrypt_data(iv, ct, key)
+        b'token'
+    """
+    if len(key) != KEY_SIZE_BYTES:
+        _raise_invalid_key(key)
+
+    try:
+        encrypt = _cipher_for_key(key).encrypt
+        return [
+            (iv := secrets.token_bytes(IV_SIZE_BYTES), encrypt(iv, plaintext, None))
+            for plaintext in plaintexts
+        ]
+    except Exception as e:
+        raise TokenError(
+            "Failed to encrypt data",
+            details={"error_type": type(e).__name__, "error_message": str(e)},
+        ) from e
+
+
+def decrypt_data(
+    iv: bytes, ciphertext: bytes, key: bytes, algorithm: str = AES_256_GCM
+) -> bytes:
     """Decrypt data using AES-256-GCM authenticated decryption.
 
     Decrypts and verifies the authentication tag in a single operation.
@@ -95,12 +196,14 @@ def decrypt_data(iv: bytes, ciphertext: bytes, key: bytes) -> bytes:
         iv: The 12-byte initialization vector used during encryption.
         ciphertext: The encrypted data with authentication tag.
         key: The 32-byte (256-bit) encryption key used for encryption.
+        algorithm: AEAD algorithm the data was encrypted with.
 
     Returns:
         The decrypted plaintext data.
 
     Raises:
-        ValidationError: If the key or IV has invalid length.
+        ValidationError: If the key or IV has invalid length, or the
+            algorithm is not supported.
         TokenError: If decryption fails (invalid key, corrupted data, or
             tampered ciphertext).
 
@@ -112,19 +215,101 @@ def decrypt_data(iv: bytes, ciphertext: bytes, key: bytes) -> bytes:
         >>> decrypted == data
         True
     """
-    _validate_key(key)
-    _validate_iv(iv)
+    if len(key) != KEY_SIZE_BYTES:
+        _raise_invalid_key(key)
+    if len(iv) != IV_SIZE_BYTES:
+        _raise_invalid_iv(iv)
+    if algorithm not in _AEAD_CLASSES:
+        _raise_unsupported_algorithm(algorithm)
+
+    try:
+        return _cipher_for_key(key, algorithm).decrypt(iv, ciphertext, None)
+    except (InvalidTag, ValueError) as e:
+        # InvalidTag carries no message, so there are no details worth adding
+        raise TokenError(
+            "Failed to decrypt data - invalid key or corrupted ciphertext"
+        ) from e
+
+
+def encrypt_blob(plaintext: bytes, key: bytes) -> bytes:
+    """Encrypt data into a single IV-prefixed AES-256-GCM blob.
+
+    Equivalent to encrypt_data, but returns ``iv + ciphertext`` as one
+    bytes object for callers that store the two together.
+
+    Args:
+        plaintext: The data to encrypt.
+        key: A 32-byte (256-bit) encryption key.
+
+    Returns:
+        The 12-byte IV followed by the ciphertext and authentication tag.
+
+    Raises:
+        ValidationError: If the key is not exactly 32 bytes.
+        TokenError: If encryption fails for any reason.
+
+    Example:
+        >>> key = generate_key()
+        >>> blob = encrypt_blob(b"secret token data", key)
+        >>> decrypt_blob(blob, key)
+        b'secret token data'
+    """
+    if len(key) != KEY_SIZE_BYTES:
+        _raise_invalid_key(key)
 
     try:
-        aesgcm = AESGCM(key)
-        return aesgcm.decrypt(iv, ciphertext, None)
+        iv = secrets.token_bytes(IV_SIZE_BYTES)
+        return iv + _cipher_for_key(key).encrypt(iv, plaintext, None)
     except Exception as e:
         raise TokenError(
-            "Failed to decrypt data - invalid key or corrupted ciphertext",
+            "Failed to encrypt data",
             details={"error_type": type(e).__name__, "error_message": str(e)},
         ) from e
 
 
+def decrypt_blob(blob: bytes, key: bytes) -> bytes:
+    """Decrypt an IV-prefixed blob produced by encrypt_blob.
+
+    The IV and ciphertext are read through a memoryview, so the blob is
+    not copied before decryption.
+
+    Args:
+        blob: The 12-byte IV followed by the ciphertext and authentication tag.
+        key: The 32-byte (256-bit) encryption key used for encryption.
+
+    Returns:
+        The decrypted plaintext data.
+
+    Raises:
+        ValidationError: If the key is invalid or the blob is too short to
+            hold an IV and authentication tag.
+        TokenError: If decryption fails (invalid key, corrupted data, or
+            tampered ciphertext).
+    """
+    if len(key) != KEY_SIZE_BYTES:
+        _raise_invalid_key(key)
+
+    min_length = IV_SIZE_BYTES + TAG_SIZE_BYTES
+    if len(blob) < min_length:
+        raise ValidationError(
+            f"Invalid blob length: expected at least {min_length} bytes, "
+            f"got {len(blob)}",
+            field="blob",
+            details={"min_length": min_length, "actual_length": len(blob)},
+        )
+
+    view = memoryview(blob)
+    try:
+        return _cipher_for_key(key).decrypt(
+            view[:IV_SIZE_BYTES], view[IV_SIZE_BYTES:], None
+        )
+    except (InvalidTag, ValueError) as e:
+        # InvalidTag carries no message, so there are no details worth adding
+        raise TokenError(
+            "Failed to decrypt data - invalid key or corrupted ciphertext"
+        ) from e
+
+
 def key_from_hex(hex_key: str) -> bytes:
     """Convert a hexadecimal string to an encryption key.
 
@@ -158,9 +343,11 @@ def key_from_hex(hex_key: str) -> bytes:
             details={"expected_length": HEX_KEY_LENGTH, "actual_length": len(hex_key)},
         )
 
+    # unhexlify decodes in one C pass and, unlike bytes.fromhex, rejects
+    # embedded whitespace that would otherwise yield a short key
     try:
-        return bytes.fromhex(hex_key)
-    except ValueError as e:
+        return binascii.unhexlify(hex_key)
+    except binascii.Error as e:
         raise ValidationError(
             "Invalid hex key: contains non-hexadecimal characters",
             field="hex_key",
@@ -168,43 +355,89 @@ def key_from_hex(hex_key: str) -> bytes:
         ) from e
 
 
-def _validate_key(key: bytes) -> None:
-    """Validate that the key is the correct length for AES-256.
+@lru_cache(maxsize=CIPHER_CACHE_SIZE)
+def _cipher_for_key(
+    key: bytes, algorithm: str = AES_256_GCM
+) -> AESGCM | ChaCha20Poly1305:
+    """Return a cached AEAD context for the given key and algorithm.
+
+    Token storage encrypts and decrypts repeatedly with the same key, so
+    reusing the context avoids re-running key setup on every call. AESGCM
+    holds no per-message state and is safe to share between calls.
+
+    AESGCM is the lowest-level supported entry point: cryptography's
+    OpenSSL bindings no longer expose the EVP cipher functions, so a cached
+    context is as specialized as this path can get.
+
+    Args:
+        key: A validated 32-byte encryption key.
+        algorithm: A supported algorithm name.
+
+    Returns:
+        AESGCM or ChaCha20Poly1305 instance bound to the key.
+    """
+    return _AEAD_CLASSES[algorithm](key)
+
+
+def _raise_invalid_key(key: bytes) -> NoReturn:
+    """Raise the error for a key that is not the correct length for AES-256.
+
+    Callers check the length inline so the valid path makes no extra call.
 
     Args:
-        key: The encryption key to validate.
+        key: The rejected encryption key.
 
     Raises:
-        ValidationError: If the key is not exactly 32 bytes.
+        ValidationError: Always.
     """
-    if len(key) != KEY_SIZE_BYTES:
-        raise ValidationError(
-            f"Invalid key length: expected {KEY_SIZE_BYTES} bytes, got {len(key)}",
-            field="key",
-            details={"expected_length": KEY_SIZE_BYTES, "actual_length": len(key)},
-        )
+    raise ValidationError(
+        f"Invalid key length: expected {KEY_SIZE_BYTES} bytes, got {len(key)}",
+        field="key",
+        details={"expected_length": KEY_SIZE_BYTES, "actual_length": len(key)},
+    )
 
 
-def _validate_iv(iv: bytes) -> None:
-    """Validate that the IV is the correct length for GCM.
+def _raise_unsupported_algorithm(algorithm: str) -> NoReturn:
+    """Raise the error for an unknown AEAD algorithm name.
 
     Args:
-        iv: The initialization vector to validate.
+        algorithm: The rejected algorithm name.
 
     Raises:
-        ValidationError: If the IV is not exactly 12 bytes.
+        ValidationError: Always.
     """
-    if len(iv) != IV_SIZE_BYTES:
-        raise ValidationError(
-            f"Invalid IV length: expected {IV_SIZE_BYTES} bytes, got {len(iv)}",
-            field="iv",
-            details={"expected_length": IV_SIZE_BYTES, "actual_length": len(iv)},
-        )
+    raise ValidationError(
+        f"Unsupported encryption algorithm: {algorithm}",
+        field="algorithm",
+        details={"supported": SUPPORTED_ALGORITHMS},
+    )
+
+
+def _raise_invalid_iv(iv: bytes) -> NoReturn:
+    """Raise the error for an IV that is not the correct length for GCM.
+
+    Args:
+        iv: The rejected initialization vector.
+
+    Raises:
+        ValidationError: Always.
+    """
+    raise ValidationError(
+        f"Invalid IV length: expected {IV_SIZE_BYTES} bytes, got {len(iv)}",
+        field="iv",
+        details={"expected_length": IV_SIZE_BYTES, "actual_length": len(iv)},
+    )
 
 
 __all__ = [
+    "AES_256_GCM",
+    "CHACHA20_POLY1305",
+    "DEFAULT_ALGORITHM",
     "generate_key",
     "encrypt_data",
     "decrypt_data",
+    "encrypt_many",
+    "encrypt_blob",
+    "decrypt_blob",
     "key_from_hex",
 ]
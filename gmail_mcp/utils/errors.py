@@ -7,6 +7,13 @@ authentication, encryption, approval workflows, and API interactions.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Shared read-only details for errors raised without context, so raising
+# does not allocate an empty dict each time
+_EMPTY_DETAILS: Mapping[str, object] = MappingProxyType({})
+
 
 class GmailMCPError(Exception):
     """Base exception for all Gmail MCP Server errors.
@@ -16,7 +23,8 @@ class GmailMCPError(Exception):
 
     Attributes:
         message: Human-readable error description.
-        details: Optional dictionary containing additional error context.
+        details: Additional error context; an empty read-only mapping when
+            none was given.
     """
 
     def __init__(self, message: str, details: dict[str, object] | None = None) -> None:
@@ -28,7 +36,7 @@ class GmailMCPError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self.details: Mapping[str, object] = details or _EMPTY_DETAILS
 
     def __str__(self) -> str:
         """Return string representation of the error."""
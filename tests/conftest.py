@@ -1,50 +1,77 @@
 """Pytest configuration and fixtures for Gmail MCP server tests."""
 
-import pytest
+from collections.abc import Callable, Mapping, Sequence
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
 
+import pytest
 
-@pytest.fixture
-def mock_credentials():
-    """Fixture providing mock Google OAuth credentials."""
-    return {
+# Shared fixture data, built once at import and handed out read-only
+_MOCK_CREDENTIALS = MappingProxyType(
+    {
         "client_id": "test-client-id.apps.googleusercontent.com",
         "client_secret": "test-client-secret",
         "redirect_uri": "http://localhost:3000/oauth/callback",
     }
+)
 
-
-@pytest.fixture
-def mock_token():
-    """Fixture providing mock OAuth token data."""
-    return {
+_MOCK_TOKEN = MappingProxyType(
+    {
         "access_token": "mock-access-token",
         "refresh_token": "mock-refresh-token",
         "token_type": "Bearer",
         "expires_in": 3600,
     }
+)
 
-
-@pytest.fixture
-def sample_email():
-    """Fixture providing sample email data for testing."""
-    return {
+_SAMPLE_EMAIL = MappingProxyType(
+    {
         "id": "18abc123def",
         "threadId": "18abc123def",
-        "labelIds": ["INBOX", "UNREAD"],
+        "labelIds": ("INBOX", "UNREAD"),
         "snippet": "This is a test email snippet...",
-        "payload": {
-            "headers": [
-                {"name": "From", "value": "sender@example.com"},
-                {"name": "To", "value": "recipient@example.com"},
-                {"name": "Subject", "value": "Test Email Subject"},
-                {"name": "Date", "value": "Mon, 20 Jan 2026 10:00:00 -0500"},
-            ],
-            "mimeType": "text/plain",
-            "body": {
-                "data": "VGhpcyBpcyB0aGUgZW1haWwgYm9keSBjb250ZW50Lg==",
-            },
-        },
+        "payload": MappingProxyType(
+            {
+                "headers": (
+                    MappingProxyType({"name": "From", "value": "sender@example.com"}),
+                    MappingProxyType({"name": "To", "value": "recipient@example.com"}),
+                    MappingProxyType(
+                        {"name": "Subject", "value": "Test Email Subject"}
+                    ),
+                    MappingProxyType(
+                        {"name": "Date", "value": "Mon, 20 Jan 2026 10:00:00 -0500"}
+                    ),
+                ),
+                "mimeType": "text/plain",
+                "body": MappingProxyType(
+                    {"data": "VGhpcyBpcyB0aGUgZW1haWwgYm9keSBjb250ZW50Lg=="}
+                ),
+            }
+        ),
     }
+)
+
+
+@pytest.fixture(scope="session")
+def mock_credentials() -> Mapping[str, Any]:
+    """Fixture providing read-only mock Google OAuth credentials."""
+    return _MOCK_CREDENTIALS
+
+
+@pytest.fixture(scope="session")
+def mock_token() -> Mapping[str, Any]:
+    """Fixture providing read-only mock OAuth token data."""
+    return _MOCK_TOKEN
+
+
+@pytest.fixture(scope="session")
+def sample_email() -> Mapping[str, Any]:
+    """Fixture providing read-only sample email data for testing.
+
+    Nested mappings and sequences are also read-only, so tests that need to
+    modify the message must copy it first.
+    """
+    return _SAMPLE_EMAIL
 
 
 @pytest.fixture
@@ -52,3 +79,52 @@ def mock_gmail_service(mocker):
     """Fixture providing a mocked Gmail API service."""
     mock_service = mocker.MagicMock()
     return mock_service
+
+
+class ListCallRecorder:
+    """Stand-in for a Gmail ``list()`` method that records its kwargs.
+
+    Cheaper than a MagicMock chain for tests that only inspect the
+    arguments of the one terminal list call.
+    """
+
+    def __init__(self, response: Mapping[str, Any]) -> None:
+        self.response = response
+        self.kwargs: dict[str, Any] | None = None
+
+    def __call__(self, **kwargs: Any) -> SimpleNamespace:
+        self.kwargs = kwargs
+        return SimpleNamespace(execute=lambda: self.response)
+
+    def reset(self) -> None:
+        """Forget the recorded call."""
+        self.kwargs = None
+
+
+def _build_list_service(
+    resource: str, items: Sequence[Mapping[str, Any]]
+) -> SimpleNamespace:
+    """Build a ``service.users().<resource>()`` stub with a single list page.
+
+    The page is keyed by the resource name, matching the Gmail API response
+    shape (``{"messages": [...]}`` or ``{"threads": [...]}``). Only the
+    collection's ``list_next(request, response)`` is stubbed, since that is
+    the pagination path the list helpers take. The returned service exposes
+    the recorder as ``service.list_call``.
+    """
+    recorder = ListCallRecorder({resource: list(items)})
+    collection = SimpleNamespace(
+        list=recorder, list_next=lambda _request, _response: None
+    )
+    return SimpleNamespace(
+        users=lambda: SimpleNamespace(**{resource: lambda: collection}),
+        list_call=recorder,
+    )
+
+
+@pytest.fixture(scope="session")
+def list_service_factory() -> Callable[
+    [str, Sequence[Mapping[str, Any]]], SimpleNamespace
+]:
+    """Fixture providing a builder for recording list() service stubs."""
+    return _build_list_service
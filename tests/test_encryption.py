@@ -1,16 +1,29 @@
 """Tests for encryption utilities."""
 
+from collections.abc import Iterable
+
 import pytest
 
 from gmail_mcp.utils.encryption import (
+    decrypt_blob,
     decrypt_data,
+    encrypt_blob,
     encrypt_data,
+    encrypt_many,
     generate_key,
     key_from_hex,
 )
 from gmail_mcp.utils.errors import TokenError, ValidationError
 
 
+def _assert_all_unique(items: Iterable[bytes]) -> None:
+    """Fail on the first repeated item, naming it in the assertion."""
+    seen: set[bytes] = set()
+    for item in items:
+        assert item not in seen, f"duplicate value: {item.hex()}"
+        seen.add(item)
+
+
 class TestGenerateKey:
     """Tests for generate_key function."""
 
@@ -21,9 +34,7 @@ class TestGenerateKey:
 
     def test_generates_unique_keys(self) -> None:
         """Each call should generate a unique key."""
-        keys = [generate_key() for _ in range(10)]
-        # All keys should be unique
-        assert len(set(keys)) == 10
+        _assert_all_unique(generate_key() for _ in range(10))
 
 
 class TestKeyFromHex:
@@ -54,6 +65,11 @@ class TestKeyFromHex:
             key_from_hex("g" * 64)  # 'g' is not hex
         assert "hex" in str(exc_info.value).lower()
 
+    def test_raises_on_embedded_whitespace(self) -> None:
+        """Should reject interior whitespace that would shorten the key."""
+        with pytest.raises(ValidationError):
+            key_from_hex("aa" * 10 + "    " + "aa" * 20)  # 64 chars, 30 bytes
+
 
 class TestEncryptDecrypt:
     """Tests for encrypt_data and decrypt_data functions."""
@@ -105,18 +121,14 @@ class TestEncryptDecrypt:
     def test_unique_iv_per_encryption(self, key: bytes) -> None:
         """Each encryption should use a unique IV."""
         plaintext = b"Same message"
-        encryptions = [encrypt_data(plaintext, key) for _ in range(10)]
-        ivs = [e["iv"] for e in encryptions]
-        # All IVs should be unique
-        assert len(set(ivs)) == 10
+        _assert_all_unique(encrypt_data(plaintext, key)["iv"] for _ in range(10))
 
     def test_same_plaintext_produces_different_ciphertext(self, key: bytes) -> None:
         """Same plaintext should produce different ciphertext due to unique IV."""
         plaintext = b"Same message"
-        encryptions = [encrypt_data(plaintext, key) for _ in range(10)]
-        ciphertexts = [e["ciphertext"] for e in encryptions]
-        # All ciphertexts should be unique
-        assert len(set(ciphertexts)) == 10
+        _assert_all_unique(
+            encrypt_data(plaintext, key)["ciphertext"] for _ in range(10)
+        )
 
     def test_decrypt_with_wrong_key_fails(self, key: bytes) -> None:
         """Decryption with wrong key should fail."""
@@ -154,6 +166,166 @@ class TestEncryptDecrypt:
             decrypt_data(wrong_iv, encrypted["ciphertext"], key)
         assert "decrypt" in str(exc_info.value).lower()
 
+    def test_cipher_context_reused_per_key(self, key: bytes) -> None:
+        """Repeated calls with one key should share a cipher context."""
+        from gmail_mcp.utils.encryption import _cipher_for_key
+
+        _cipher_for_key.cache_clear()
+        encrypted = encrypt_data(b"first", key)
+        decrypt_data(encrypted["iv"], encrypted["ciphertext"], key)
+        encrypt_data(b"second", key)
+
+        info = _cipher_for_key.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_cached_ciphertext_matches_aesgcm_format(self, key: bytes) -> None:
+        """Ciphertext should stay decryptable by a plain AESGCM instance."""
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+        encrypted = encrypt_data(b"stored token", key)
+
+        plaintext = AESGCM(key).decrypt(encrypted["iv"], encrypted["ciphertext"], None)
+        assert plaintext == b"stored token"
+
+
+class TestAlgorithmSelection:
+    """Tests for AEAD algorithm selection."""
+
+    def test_chacha20_roundtrip(self) -> None:
+        """ChaCha20-Poly1305 data should decrypt with the same algorithm only."""
+        from gmail_mcp.utils.encryption import CHACHA20_POLY1305
+
+        key = generate_key()
+        encrypted = encrypt_data(b"token", key, CHACHA20_POLY1305)
+
+        assert (
+            decrypt_data(
+                encrypted["iv"], encrypted["ciphertext"], key, CHACHA20_POLY1305
+            )
+            == b"token"
+        )
+        with pytest.raises(TokenError):
+            decrypt_data(encrypted["iv"], encrypted["ciphertext"], key)
+
+    def test_unsupported_algorithm_rejected(self) -> None:
+        """Unknown algorithm names should raise ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            encrypt_data(b"data", generate_key(), "rot13")
+        assert "rot13" in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        ("cpuinfo", "expected"),
+        [
+            ("processor\t: 0\nflags\t\t: fpu sse2 aes avx\n", True),
+            ("processor\t: 0\nflags\t\t: fpu sse2 avx\n", False),
+            ("Features\t: fp asimd aes pmull\n", True),
+            ("Features\t: fp asimd\n", False),
+            ("processor\t: 0\n", True),
+        ],
+    )
+    def test_has_hardware_aes_reads_cpuinfo(
+        self, tmp_path, cpuinfo: str, expected: bool
+    ) -> None:
+        """The CPU feature line decides whether hardware AES is assumed."""
+        from gmail_mcp.utils.encryption import _has_hardware_aes
+
+        path = tmp_path / "cpuinfo"
+        path.write_text(cpuinfo)
+
+        assert _has_hardware_aes(str(path)) is expected
+
+    def test_missing_cpuinfo_assumes_hardware_aes(self, tmp_path) -> None:
+        """Hosts without /proc/cpuinfo should keep AES-GCM."""
+        from gmail_mcp.utils.encryption import _has_hardware_aes
+
+        assert _has_hardware_aes(str(tmp_path / "missing")) is True
+
+
+class TestTokenAlgorithmField:
+    """Tests for the algorithm recorded with encrypted tokens."""
+
+    def test_token_records_algorithm_and_legacy_defaults_to_aes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Tokens store their algorithm; files without one decrypt as AES-GCM."""
+        from gmail_mcp.auth.tokens import decrypt_token, encrypt_token
+        from gmail_mcp.utils.encryption import DEFAULT_ALGORITHM
+
+        key = generate_key()
+        monkeypatch.setenv("TOKEN_ENCRYPTION_KEY", key.hex())
+
+        encrypted = encrypt_token({"access_token": "abc"})
+        assert encrypted["algorithm"] == DEFAULT_ALGORITHM
+        assert decrypt_token(encrypted) == {"access_token": "abc"}
+
+        legacy = encrypt_data(b'{"access_token": "old"}', key)
+        assert decrypt_token(
+            {"iv": legacy["iv"].hex(), "ciphertext": legacy["ciphertext"].hex()}
+        ) == {"access_token": "old"}
+
+
+class TestEncryptMany:
+    """Tests for encrypt_many function."""
+
+    def test_each_payload_roundtrips_with_unique_iv(self) -> None:
+        """Each payload should decrypt and use its own IV."""
+        key = generate_key()
+        plaintexts = [b"token-a", b"token-b", b"token-c"]
+
+        encrypted = encrypt_many(plaintexts, key)
+
+        assert [decrypt_data(iv, ct, key) for iv, ct in encrypted] == plaintexts
+        _assert_all_unique(iv for iv, _ in encrypted)
+
+    def test_invalid_key_rejected(self) -> None:
+        """Should raise ValidationError for invalid key length."""
+        with pytest.raises(ValidationError):
+            encrypt_many([b"data"], b"short")
+
+
+class TestEncryptDecryptBlob:
+    """Tests for encrypt_blob and decrypt_blob functions."""
+
+    def test_roundtrip(self) -> None:
+        """Blob decryption should recover the original plaintext."""
+        key = generate_key()
+        blob = encrypt_blob(b"token bytes", key)
+
+        assert len(blob) == 12 + len(b"token bytes") + 16
+        assert decrypt_blob(blob, key) == b"token bytes"
+
+    def test_blob_is_iv_plus_ciphertext(self) -> None:
+        """Blob layout should be compatible with decrypt_data."""
+        key = generate_key()
+        blob = encrypt_blob(b"layout", key)
+
+        assert decrypt_data(blob[:12], blob[12:], key) == b"layout"
+
+    def test_tampered_blob_fails(self) -> None:
+        """Modified blobs should fail authentication."""
+        key = generate_key()
+        blob = bytearray(encrypt_blob(b"secret", key))
+        blob[-1] ^= 0xFF
+
+        with pytest.raises(TokenError):
+            decrypt_blob(bytes(blob), key)
+
+    def test_tag_failure_chains_invalid_tag(self) -> None:
+        """Authentication failures should surface as TokenError from InvalidTag."""
+        from cryptography.exceptions import InvalidTag
+
+        blob = encrypt_blob(b"secret", generate_key())
+
+        with pytest.raises(TokenError) as exc_info:
+            decrypt_blob(blob, generate_key())
+        assert isinstance(exc_info.value.__cause__, InvalidTag)
+
+    def test_short_blob_rejected(self) -> None:
+        """Blobs without room for IV and tag should be rejected."""
+        with pytest.raises(ValidationError):
+            decrypt_blob(b"short", generate_key())
+
 
 class TestEncryptionValidation:
     """Tests for input validation in encryption functions."""
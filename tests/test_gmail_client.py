@@ -2,24 +2,38 @@
 
 from __future__ import annotations
 
-import os
 from datetime import datetime, timedelta
-from typing import Any
-from unittest.mock import MagicMock, patch
+from typing import TYPE_CHECKING
 
 import pytest
 
-from gmail_mcp.gmail.client import GmailClient
+from gmail_mcp.gmail.client import GmailClient, _env_client_secret
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Any
+
+# Unexpired token expiry; only its validity matters, so compute it once
+_FUTURE_EXPIRY = (datetime.now() + timedelta(hours=1)).isoformat()
+
+
+@pytest.fixture(autouse=True)
+def _clear_env_client_secret() -> Iterator[None]:
+    """Re-read GOOGLE_CLIENT_SECRET in each test and drop it afterwards."""
+    _env_client_secret.cache_clear()
+    yield
+    _env_client_secret.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def gmail_client() -> GmailClient:
+    """Create one GmailClient; _build_credentials does not touch its state."""
+    return GmailClient()
 
 
 class TestBuildCredentials:
     """Tests for _build_credentials method."""
 
-    @pytest.fixture
-    def gmail_client(self) -> GmailClient:
-        """Create a fresh GmailClient instance."""
-        return GmailClient()
-
     @pytest.fixture
     def token_data_with_secret(self) -> dict[str, Any]:
         """Token data that includes client_secret."""
@@ -30,7 +44,7 @@ class TestBuildCredentials:
             "client_id": "test-client-id",
             "client_secret": "test-secret-from-token",
             "scopes": ["https://www.googleapis.com/auth/gmail.readonly"],
-            "expiry": (datetime.now() + timedelta(hours=1)).isoformat(),
+            "expiry": _FUTURE_EXPIRY,
         }
 
     @pytest.fixture
@@ -43,7 +57,7 @@ class TestBuildCredentials:
             "client_id": "test-client-id",
             # No client_secret - simulating token file after refresh
             "scopes": ["https://www.googleapis.com/auth/gmail.readonly"],
-            "expiry": (datetime.now() + timedelta(hours=1)).isoformat(),
+            "expiry": _FUTURE_EXPIRY,
         }
 
     def test_uses_client_secret_from_token_data_when_present(
@@ -60,10 +74,11 @@ class TestBuildCredentials:
         self,
         gmail_client: GmailClient,
         token_data_without_secret: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Verify fallback to GOOGLE_CLIENT_SECRET env var when missing from token."""
-        with patch.dict(os.environ, {"GOOGLE_CLIENT_SECRET": "secret-from-env"}):
-            creds = gmail_client._build_credentials(token_data_without_secret)
+        monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "secret-from-env")
+        creds = gmail_client._build_credentials(token_data_without_secret)
 
         assert creds.client_secret == "secret-from-env"
 
@@ -71,10 +86,11 @@ class TestBuildCredentials:
         self,
         gmail_client: GmailClient,
         token_data_with_secret: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Verify token_data client_secret takes precedence over env var."""
-        with patch.dict(os.environ, {"GOOGLE_CLIENT_SECRET": "secret-from-env"}):
-            creds = gmail_client._build_credentials(token_data_with_secret)
+        monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "secret-from-env")
+        creds = gmail_client._build_credentials(token_data_with_secret)
 
         # Token data should win over environment
         assert creds.client_secret == "test-secret-from-token"
@@ -82,6 +98,7 @@ class TestBuildCredentials:
     def test_handles_missing_expiry(
         self,
         gmail_client: GmailClient,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Verify credentials build correctly without expiry field."""
         token_data = {
@@ -89,8 +106,8 @@ class TestBuildCredentials:
             "refresh_token": "test-refresh-token",
             "client_id": "test-client-id",
         }
-        with patch.dict(os.environ, {"GOOGLE_CLIENT_SECRET": "secret-from-env"}):
-            creds = gmail_client._build_credentials(token_data)
+        monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "secret-from-env")
+        creds = gmail_client._build_credentials(token_data)
 
         assert creds.token == "test-access-token"
         assert creds.expiry is None
@@ -98,6 +115,7 @@ class TestBuildCredentials:
     def test_handles_invalid_expiry_format(
         self,
         gmail_client: GmailClient,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Verify invalid expiry is handled gracefully."""
         token_data = {
@@ -106,8 +124,8 @@ class TestBuildCredentials:
             "client_id": "test-client-id",
             "expiry": "not-a-valid-date",
         }
-        with patch.dict(os.environ, {"GOOGLE_CLIENT_SECRET": "secret-from-env"}):
-            creds = gmail_client._build_credentials(token_data)
+        monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "secret-from-env")
+        creds = gmail_client._build_credentials(token_data)
 
         # Should handle gracefully, expiry will be None
         assert creds.token == "test-access-token"
@@ -1,12 +1,65 @@
-"""Tests for Gmail message operations (list_messages label filtering)."""
+"""Tests for Gmail message operations (list filtering, batching, decoding)."""
 
 from __future__ import annotations
 
+import base64
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
 
-from gmail_mcp.gmail.messages import list_messages
+from gmail_mcp.gmail.messages import (
+    batch_get_messages,
+    batch_trash_messages,
+    decode_body_truncated,
+    index_headers,
+    list_messages,
+)
+from gmail_mcp.utils.errors import GmailAPIError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping, Sequence
+    from typing import Any
+
+
+# Items on the canned list() page returned by the shared mock service
+_LIST_ITEMS = ({"id": "msg1", "threadId": "t1"},)
+
+
+# (query, label_ids, expected_q) cases shared by the label-filter tests;
+# label_ids are tuples so the table stays immutable across tests
+_LABEL_QUERY_CASES = (
+    pytest.param(
+        "",
+        ("INBOX", "UNREAD"),
+        "label:INBOX label:UNREAD",
+        id="labels_merged_into_query",
+    ),
+    pytest.param(
+        "is:important",
+        ("INBOX",),
+        "is:important label:INBOX",
+        id="labels_appended_to_query",
+    ),
+    pytest.param(
+        "from:test@example.com",
+        None,
+        "from:test@example.com",
+        id="no_labels_query_unchanged",
+    ),
+    pytest.param("subject:test", (), "subject:test", id="empty_labels_query_unchanged"),
+    pytest.param("", ("INBOX",), "label:INBOX", id="single_label"),
+    pytest.param("", ("SENT",), "label:SENT", id="no_leading_space"),
+)
+
+
+@pytest.fixture(scope="module")
+def mock_service(
+    list_service_factory: Callable[[str, Sequence[Mapping[str, Any]]], SimpleNamespace],
+) -> SimpleNamespace:
+    """Create a recording Gmail API service stub shared by the module."""
+    return list_service_factory("messages", _LIST_ITEMS)
 
 
 class TestListMessagesLabelFiltering:
@@ -17,67 +70,165 @@ class TestListMessagesLabelFiltering:
     are instead encoded as ``label:X label:Y`` in the q parameter.
     """
 
-    @pytest.fixture
-    def mock_service(self) -> MagicMock:
-        """Create a mock Gmail API service."""
+    @pytest.fixture(autouse=True)
+    def _reset_mock_service(self, mock_service: SimpleNamespace) -> Iterator[None]:
+        """Clear the recorded list call after each test."""
+        yield
+        mock_service.list_call.reset()
+
+    @pytest.mark.parametrize(("query", "label_ids", "expected_q"), _LABEL_QUERY_CASES)
+    def test_query_merge(
+        self,
+        mock_service: SimpleNamespace,
+        query: str,
+        label_ids: tuple[str, ...] | None,
+        expected_q: str,
+    ) -> None:
+        """label_ids become label: filters in q and never labelIds."""
+        labels = list(label_ids) if label_ids is not None else None
+        list_messages(mock_service, query=query, label_ids=labels)
+
+        call_kwargs = mock_service.list_call.kwargs
+        assert call_kwargs["q"] == expected_q
+        assert "labelIds" not in call_kwargs
+
+
+def _fake_batch_factory(
+    respond: Callable[[str], tuple[Any, Exception | None]],
+) -> Callable[..., MagicMock]:
+    """Build a new_batch_http_request stand-in that answers each request id."""
+
+    def new_batch(callback: Any) -> MagicMock:
+        batch = MagicMock()
+        added: list[str] = []
+        batch.add.side_effect = lambda request, request_id: added.append(request_id)
+
+        def execute() -> None:
+            for request_id in added:
+                callback(request_id, *respond(request_id))
+
+        batch.execute.side_effect = execute
+        return batch
+
+    return new_batch
+
+
+class TestBatchGetMessages:
+    """Verify messages are fetched in a batch request in input order."""
+
+    def test_returns_messages_in_order(self) -> None:
+        """Responses are mapped back to the requested ids by position."""
         service = MagicMock()
-        mock_list = MagicMock()
-        mock_list.execute.return_value = {
-            "messages": [{"id": "msg1", "threadId": "t1"}],
-        }
-        service.users().messages().list.return_value = mock_list
-        service.users().messages().list_next.return_value = None
-        return service
+        get_call = service.users().messages().get
+        service.new_batch_http_request.side_effect = _fake_batch_factory(
+            lambda request_id: ({"id": f"msg{request_id}"}, None)
+        )
 
-    def test_label_ids_merged_into_query(self, mock_service: MagicMock) -> None:
-        """label_ids should be converted to label: filters in q param."""
-        list_messages(mock_service, label_ids=["INBOX", "UNREAD"])
+        messages = batch_get_messages(service, ["msg0", "msg1"], format="metadata")
 
-        call_kwargs = mock_service.users().messages().list.call_args.kwargs
-        assert "labelIds" not in call_kwargs
-        assert "label:INBOX" in call_kwargs["q"]
-        assert "label:UNREAD" in call_kwargs["q"]
+        assert [m["id"] for m in messages] == ["msg0", "msg1"]
+        assert get_call.call_args.kwargs["format"] == "metadata"
 
-    def test_label_ids_appended_to_existing_query(
-        self, mock_service: MagicMock
-    ) -> None:
-        """label: filters should be appended to existing query string."""
-        list_messages(mock_service, query="is:important", label_ids=["INBOX"])
+    def test_failed_get_raises(self) -> None:
+        """A per-message failure is surfaced as GmailAPIError."""
+        service = MagicMock()
+        service.new_batch_http_request.side_effect = _fake_batch_factory(
+            lambda request_id: (None, Exception("not found"))
+        )
 
-        call_kwargs = mock_service.users().messages().list.call_args.kwargs
-        assert call_kwargs["q"] == "is:important label:INBOX"
+        with pytest.raises(GmailAPIError, match="msg0"):
+            batch_get_messages(service, ["msg0"])
 
-    def test_no_label_ids_passes_query_unchanged(self, mock_service: MagicMock) -> None:
-        """When label_ids is None, q should be the original query."""
-        list_messages(mock_service, query="from:test@example.com")
 
-        call_kwargs = mock_service.users().messages().list.call_args.kwargs
-        assert call_kwargs["q"] == "from:test@example.com"
-        assert "labelIds" not in call_kwargs
+class TestBatchTrashMessages:
+    """Verify messages are trashed via batchModify with a per-message fallback."""
 
-    def test_empty_label_ids_passes_query_unchanged(
-        self, mock_service: MagicMock
-    ) -> None:
-        """When label_ids is empty, q should be the original query."""
-        list_messages(mock_service, query="subject:test", label_ids=[])
+    def test_trash_uses_batch_modify_in_chunks(self) -> None:
+        """Ids should be sent in chunks of at most 1000 per batchModify call."""
+        service = MagicMock()
+        ids = [f"msg{i}" for i in range(1500)]
 
-        call_kwargs = mock_service.users().messages().list.call_args.kwargs
-        assert call_kwargs["q"] == "subject:test"
-        assert "labelIds" not in call_kwargs
+        failures = batch_trash_messages(service, ids)
 
-    def test_single_label_id(self, mock_service: MagicMock) -> None:
-        """Single label should produce single label: filter."""
-        list_messages(mock_service, label_ids=["INBOX"])
+        batch_modify = service.users().messages().batchModify
+        assert failures == {}
+        assert batch_modify.call_count == 2
+        first_body = batch_modify.call_args_list[0].kwargs["body"]
+        assert first_body["ids"] == ids[:1000]
+        assert first_body["addLabelIds"] == ["TRASH"]
+        assert batch_modify.call_args_list[1].kwargs["body"]["ids"] == ids[1000:]
 
-        call_kwargs = mock_service.users().messages().list.call_args.kwargs
-        assert call_kwargs["q"] == "label:INBOX"
-        assert "labelIds" not in call_kwargs
+    def test_fallback_reports_failed_ids(self) -> None:
+        """A rejected batchModify falls back to a batch request per message."""
+        service = MagicMock()
+        service.users().messages().batchModify().execute.side_effect = Exception(
+            "rejected"
+        )
 
-    def test_empty_query_with_labels_no_leading_space(
-        self, mock_service: MagicMock
-    ) -> None:
-        """Empty query + labels should not have leading whitespace."""
-        list_messages(mock_service, query="", label_ids=["SENT"])
+        service.new_batch_http_request.side_effect = _fake_batch_factory(
+            lambda request_id: (
+                (None, Exception("not found")) if request_id == "1" else ({}, None)
+            )
+        )
+
+        failures = batch_trash_messages(service, ["msg1", "msg2", "msg3"])
+
+        assert failures == {"msg2": "not found"}
+
+
+def _encode(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode()).decode()
+
+
+class TestDecodeBodyTruncated:
+    """Verify bodies are decoded only up to the requested length."""
+
+    def test_short_body_returned_unchanged(self) -> None:
+        """Bodies within the limit are returned without a marker."""
+        message = {"payload": {"body": {"data": _encode("Hello world")}}}
+
+        assert decode_body_truncated(message, 100) == "Hello world"
+
+    def test_long_body_truncated_with_suffix(self) -> None:
+        """Bodies over the limit are cut and marked as truncated."""
+        message = {"payload": {"body": {"data": _encode("é" * 50)}}}
 
-        call_kwargs = mock_service.users().messages().list.call_args.kwargs
-        assert call_kwargs["q"] == "label:SENT"
+        assert decode_body_truncated(message, 10) == "é" * 10 + "... [truncated]"
+
+    def test_prefers_plain_text_part(self) -> None:
+        """text/plain parts win over text/html parts in multipart messages."""
+        message = {
+            "payload": {
+                "parts": [
+                    {"mimeType": "text/html", "body": {"data": _encode("<p>x</p>")}},
+                    {"mimeType": "text/plain", "body": {"data": _encode("plain")}},
+                ]
+            }
+        }
+
+        assert decode_body_truncated(message, 100) == "plain"
+
+    def test_missing_body_returns_empty_string(self) -> None:
+        """Messages without a text body decode to an empty string."""
+        assert decode_body_truncated({"payload": {}}, 100) == ""
+
+
+class TestIndexHeaders:
+    """Verify headers are indexed by lowercase name."""
+
+    def test_indexes_all_headers_first_wins(self) -> None:
+        """Every header is kept and the first repeated value wins."""
+        message = {
+            "payload": {
+                "headers": [
+                    {"name": "From", "value": "a@example.com"},
+                    {"name": "List-Unsubscribe", "value": "<https://x.test/u>"},
+                    {"name": "from", "value": "b@example.com"},
+                ]
+            }
+        }
+
+        assert index_headers(message) == {
+            "from": "a@example.com",
+            "list-unsubscribe": "<https://x.test/u>",
+        }
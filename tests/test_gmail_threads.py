@@ -1,12 +1,57 @@
-"""Tests for Gmail thread operations (list_threads label filtering)."""
+"""Tests for Gmail thread operations (label filtering, partial responses)."""
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
 
-from gmail_mcp.gmail.threads import list_threads
+from gmail_mcp.gmail.threads import get_thread, list_threads
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping, Sequence
+    from typing import Any
+
+
+# Items on the canned list() page returned by the shared mock service
+_LIST_ITEMS = ({"id": "t1", "snippet": "hello"},)
+
+
+# (query, label_ids, expected_q) cases shared by the label-filter tests;
+# label_ids are tuples so the table stays immutable across tests
+_LABEL_QUERY_CASES = (
+    pytest.param(
+        "",
+        ("INBOX", "UNREAD"),
+        "label:INBOX label:UNREAD",
+        id="labels_merged_into_query",
+    ),
+    pytest.param(
+        "is:important",
+        ("INBOX",),
+        "is:important label:INBOX",
+        id="labels_appended_to_query",
+    ),
+    pytest.param(
+        "from:test@example.com",
+        None,
+        "from:test@example.com",
+        id="no_labels_query_unchanged",
+    ),
+    pytest.param("subject:test", (), "subject:test", id="empty_labels_query_unchanged"),
+    pytest.param("", ("INBOX",), "label:INBOX", id="single_label"),
+    pytest.param("", ("SENT",), "label:SENT", id="no_leading_space"),
+)
+
+
+@pytest.fixture(scope="module")
+def mock_service(
+    list_service_factory: Callable[[str, Sequence[Mapping[str, Any]]], SimpleNamespace],
+) -> SimpleNamespace:
+    """Create a recording Gmail API service stub shared by the module."""
+    return list_service_factory("threads", _LIST_ITEMS)
 
 
 class TestListThreadsLabelFiltering:
@@ -17,67 +62,48 @@ class TestListThreadsLabelFiltering:
     are instead encoded as ``label:X label:Y`` in the q parameter.
     """
 
-    @pytest.fixture
-    def mock_service(self) -> MagicMock:
-        """Create a mock Gmail API service."""
-        service = MagicMock()
-        mock_list = MagicMock()
-        mock_list.execute.return_value = {
-            "threads": [{"id": "t1", "snippet": "hello"}],
-        }
-        service.users().threads().list.return_value = mock_list
-        service.users().threads().list_next.return_value = None
-        return service
-
-    def test_label_ids_merged_into_query(self, mock_service: MagicMock) -> None:
-        """label_ids should be converted to label: filters in q param."""
-        list_threads(mock_service, label_ids=["INBOX", "UNREAD"])
-
-        call_kwargs = mock_service.users().threads().list.call_args.kwargs
-        assert "labelIds" not in call_kwargs
-        assert "label:INBOX" in call_kwargs["q"]
-        assert "label:UNREAD" in call_kwargs["q"]
-
-    def test_label_ids_appended_to_existing_query(
-        self, mock_service: MagicMock
+    @pytest.fixture(autouse=True)
+    def _reset_mock_service(self, mock_service: SimpleNamespace) -> Iterator[None]:
+        """Clear the recorded list call after each test."""
+        yield
+        mock_service.list_call.reset()
+
+    @pytest.mark.parametrize(("query", "label_ids", "expected_q"), _LABEL_QUERY_CASES)
+    def test_query_merge(
+        self,
+        mock_service: SimpleNamespace,
+        query: str,
+        label_ids: tuple[str, ...] | None,
+        expected_q: str,
     ) -> None:
-        """label: filters should be appended to existing query string."""
-        list_threads(mock_service, query="is:important", label_ids=["INBOX"])
+        """label_ids become label: filters in q and never labelIds."""
+        labels = list(label_ids) if label_ids is not None else None
+        list_threads(mock_service, query=query, label_ids=labels)
 
-        call_kwargs = mock_service.users().threads().list.call_args.kwargs
-        assert call_kwargs["q"] == "is:important label:INBOX"
-
-    def test_no_label_ids_passes_query_unchanged(self, mock_service: MagicMock) -> None:
-        """When label_ids is None, q should be the original query."""
-        list_threads(mock_service, query="from:test@example.com")
-
-        call_kwargs = mock_service.users().threads().list.call_args.kwargs
-        assert call_kwargs["q"] == "from:test@example.com"
+        call_kwargs = mock_service.list_call.kwargs
+        assert call_kwargs["q"] == expected_q
         assert "labelIds" not in call_kwargs
 
-    def test_empty_label_ids_passes_query_unchanged(
-        self, mock_service: MagicMock
-    ) -> None:
-        """When label_ids is empty, q should be the original query."""
-        list_threads(mock_service, query="subject:test", label_ids=[])
 
-        call_kwargs = mock_service.users().threads().list.call_args.kwargs
-        assert call_kwargs["q"] == "subject:test"
-        assert "labelIds" not in call_kwargs
+class TestGetThreadFields:
+    """Verify the optional partial-response field mask is forwarded."""
+
+    @pytest.fixture
+    def mocks(self) -> SimpleNamespace:
+        """Mock service plus a captured reference to its threads().get."""
+        service = MagicMock()
+        get_call = service.users().threads().get
+        get_call.return_value.execute.return_value = {"messages": []}
+        return SimpleNamespace(service=service, get_call=get_call)
 
-    def test_single_label_id(self, mock_service: MagicMock) -> None:
-        """Single label should produce single label: filter."""
-        list_threads(mock_service, label_ids=["INBOX"])
+    def test_fields_passed_when_given(self, mocks: SimpleNamespace) -> None:
+        """fields should be sent to threads().get when provided."""
+        get_thread(mocks.service, "t1", fields="messages(id)")
 
-        call_kwargs = mock_service.users().threads().list.call_args.kwargs
-        assert call_kwargs["q"] == "label:INBOX"
-        assert "labelIds" not in call_kwargs
+        assert mocks.get_call.call_args.kwargs["fields"] == "messages(id)"
 
-    def test_empty_query_with_labels_no_leading_space(
-        self, mock_service: MagicMock
-    ) -> None:
-        """Empty query + labels should not have leading whitespace."""
-        list_threads(mock_service, query="", label_ids=["SENT"])
+    def test_fields_omitted_by_default(self, mocks: SimpleNamespace) -> None:
+        """Without fields, the full resource should be requested."""
+        get_thread(mocks.service, "t1")
 
-        call_kwargs = mock_service.users().threads().list.call_args.kwargs
-        assert call_kwargs["q"] == "label:SENT"
+        assert "fields" not in mocks.get_call.call_args.kwargs
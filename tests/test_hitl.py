@@ -10,9 +10,12 @@ Tests cover:
 
 from __future__ import annotations
 
+import asyncio
+import queue
 import threading
 import time
 from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
 import pytest
 
@@ -25,6 +28,9 @@ from gmail_mcp.hitl import (
 )
 from gmail_mcp.utils.errors import ApprovalError
 
+# Placeholder expiry for requests that ApprovalManager.store() will overwrite
+_SENTINEL_EXPIRES = datetime(1970, 1, 1, tzinfo=UTC)
+
 
 class TestApprovalStatus:
     """Tests for ApprovalStatus enum."""
@@ -53,7 +59,33 @@ class TestApprovalRequest:
         assert request.status == ApprovalStatus.PENDING
         assert request.user_id is None
         assert request.id is not None
-        assert len(request.id) == 36  # UUID format
+        assert ApprovalRequest.id_is_valid(request.id)
+
+    def test_default_ids_are_unique_uuid4(self) -> None:
+        """Default ids stay unique version-4 UUIDs across buffer refills."""
+        ids = {
+            ApprovalRequest(
+                action="send_email", preview={}, expires_at=_SENTINEL_EXPIRES
+            ).id
+            for _ in range(600)
+        }
+
+        assert len(ids) == 600
+        assert all(UUID(request_id).version == 4 for request_id in ids)
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param("0f8fad5b-d9cb-469f-a165-70867728950e", True, id="uuid"),
+            pytest.param("0F8FAD5B-D9CB-469F-A165-70867728950E", False, id="upper"),
+            pytest.param("0f8fad5bd9cb469fa16570867728950e", False, id="no_dashes"),
+            pytest.param("custom-id-123", False, id="custom"),
+            pytest.param("0f8fad5b-d9cb-469f-a165-70867728950e\n", False, id="newline"),
+        ],
+    )
+    def test_id_is_valid(self, value: str, expected: bool) -> None:
+        """id_is_valid accepts only canonical lowercase UUID strings."""
+        assert ApprovalRequest.id_is_valid(value) is expected
 
     def test_create_request_with_all_fields(self) -> None:
         """Test creating a request with all fields specified."""
@@ -77,58 +109,52 @@ class TestApprovalRequest:
         assert request.expires_at == expires
         assert request.user_id == "user-456"
 
-    def test_is_expired_when_not_expired(self) -> None:
-        """Test is_expired returns False when request hasn't expired."""
+    @pytest.mark.parametrize(
+        ("expires_in", "expected"),
+        [
+            pytest.param(timedelta(minutes=5), False, id="not_expired"),
+            pytest.param(timedelta(seconds=-1), True, id="expired"),
+        ],
+    )
+    def test_is_expired(self, expires_in: timedelta, expected: bool) -> None:
+        """is_expired compares the current time against expires_at."""
         request = ApprovalRequest(
             action="send_email",
             preview={},
-            expires_at=datetime.utcnow() + timedelta(minutes=5),
+            expires_at=datetime.utcnow() + expires_in,
         )
 
-        assert request.is_expired() is False
-
-    def test_is_expired_when_expired(self) -> None:
-        """Test is_expired returns True when request has expired."""
-        request = ApprovalRequest(
-            action="send_email",
-            preview={},
-            expires_at=datetime.utcnow() - timedelta(seconds=1),
-        )
-
-        assert request.is_expired() is True
-
-    def test_is_valid_when_pending_and_not_expired(self) -> None:
-        """Test is_valid returns True for pending, non-expired request."""
-        request = ApprovalRequest(
-            action="send_email",
-            preview={},
-            expires_at=datetime.utcnow() + timedelta(minutes=5),
-            status=ApprovalStatus.PENDING,
-        )
-
-        assert request.is_valid() is True
-
-    def test_is_valid_when_expired(self) -> None:
-        """Test is_valid returns False for expired request."""
-        request = ApprovalRequest(
-            action="send_email",
-            preview={},
-            expires_at=datetime.utcnow() - timedelta(seconds=1),
-            status=ApprovalStatus.PENDING,
-        )
-
-        assert request.is_valid() is False
-
-    def test_is_valid_when_not_pending(self) -> None:
-        """Test is_valid returns False for non-pending request."""
+        assert request.is_expired() is expected
+
+    @pytest.mark.parametrize(
+        ("expires_in", "status", "expected"),
+        [
+            pytest.param(
+                timedelta(minutes=5),
+                ApprovalStatus.PENDING,
+                True,
+                id="pending_and_not_expired",
+            ),
+            pytest.param(
+                timedelta(seconds=-1), ApprovalStatus.PENDING, False, id="expired"
+            ),
+            pytest.param(
+                timedelta(minutes=5), ApprovalStatus.APPROVED, False, id="not_pending"
+            ),
+        ],
+    )
+    def test_is_valid(
+        self, expires_in: timedelta, status: ApprovalStatus, expected: bool
+    ) -> None:
+        """is_valid requires a pending, non-expired request."""
         request = ApprovalRequest(
             action="send_email",
             preview={},
-            expires_at=datetime.utcnow() + timedelta(minutes=5),
-            status=ApprovalStatus.APPROVED,
+            expires_at=datetime.utcnow() + expires_in,
+            status=status,
         )
 
-        assert request.is_valid() is False
+        assert request.is_valid() is expected
 
 
 class TestApprovalResponse:
@@ -210,7 +236,7 @@ class TestApprovalManager:
         approval_id = manager.store(request)
 
         assert approval_id == request.id
-        assert len(approval_id) == 36  # UUID format
+        assert ApprovalRequest.id_is_valid(approval_id)
 
     def test_store_sets_expires_at(self, manager: ApprovalManager) -> None:
         """Test store sets expires_at based on timeout."""
@@ -237,7 +263,7 @@ class TestApprovalManager:
         request = ApprovalRequest(
             action="send_email",
             preview={},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
             status=ApprovalStatus.APPROVED,  # Will be reset
         )
 
@@ -252,7 +278,7 @@ class TestApprovalManager:
         request = ApprovalRequest(
             action="send_email",
             preview={},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
         )
         approval_id = manager.store(request)
 
@@ -273,7 +299,7 @@ class TestApprovalManager:
         request = ApprovalRequest(
             action="send_email",
             preview={},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
         )
         approval_id = short_manager.store(request)
 
@@ -287,7 +313,7 @@ class TestApprovalManager:
         request = ApprovalRequest(
             action="send_email",
             preview={},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
         )
         approval_id = manager.store(request)
 
@@ -303,7 +329,7 @@ class TestApprovalManager:
         request = ApprovalRequest(
             action="send_email",
             preview={"to": "test@example.com"},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
         )
         approval_id = manager.store(request)
 
@@ -333,7 +359,7 @@ class TestApprovalManager:
         request = ApprovalRequest(
             action="send_email",
             preview={},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
         )
         approval_id = short_manager.store(request)
 
@@ -352,7 +378,7 @@ class TestApprovalManager:
         request = ApprovalRequest(
             action="send_email",
             preview={},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
         )
         approval_id = manager.store(request)
 
@@ -376,7 +402,7 @@ class TestApprovalManager:
             request = ApprovalRequest(
                 action=f"action_{i}",
                 preview={},
-                expires_at=datetime.utcnow(),
+                expires_at=_SENTINEL_EXPIRES,
             )
             short_manager.store(request)
 
@@ -395,7 +421,7 @@ class TestApprovalManager:
         request = ApprovalRequest(
             action="send_email",
             preview={},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
         )
         approval_id = manager.store(request)
 
@@ -404,6 +430,94 @@ class TestApprovalManager:
         assert removed == 0
         assert manager.validate(approval_id) is True
 
+    def test_stored_request_expiry_uses_monotonic_deadline(
+        self, manager: ApprovalManager
+    ) -> None:
+        """Once stored, expiry follows the monotonic deadline, not expires_at."""
+        request = ApprovalRequest(
+            action="send_email",
+            preview={},
+            expires_at=_SENTINEL_EXPIRES,
+        )
+        manager.store(request)
+        request.expires_at = datetime.now(UTC) - timedelta(hours=1)
+
+        assert request.is_expired() is False
+
+    def test_expiry_heap_stays_bounded_when_requests_are_consumed(
+        self, manager: ApprovalManager
+    ) -> None:
+        """Consumed and rejected requests do not pile up in the expiry heap."""
+        pending_id = manager.store(
+            ApprovalRequest(
+                action="send_email", preview={}, expires_at=_SENTINEL_EXPIRES
+            )
+        )
+        for i in range(1000):
+            approval_id = manager.store(
+                ApprovalRequest(
+                    action="send_email", preview={}, expires_at=_SENTINEL_EXPIRES
+                )
+            )
+            if i % 2:
+                manager.consume(approval_id)
+            else:
+                manager.reject(approval_id)
+
+        assert len(manager._expiry_heap) <= 4
+        assert manager.validate(pending_id) is True
+
+    def test_cleanup_expired_skips_consumed_requests(self) -> None:
+        """Requests consumed before expiry are not counted by cleanup."""
+        short_manager = ApprovalManager(timeout_ms=200)
+        consumed_id = short_manager.store(
+            ApprovalRequest(action="a", preview={}, expires_at=_SENTINEL_EXPIRES)
+        )
+        expiring_id = short_manager.store(
+            ApprovalRequest(action="b", preview={}, expires_at=_SENTINEL_EXPIRES)
+        )
+        short_manager.consume(consumed_id)
+
+        time.sleep(0.25)
+
+        assert short_manager.cleanup_expired() == 1
+        assert short_manager.validate(expiring_id) is False
+
+    def test_bulk_cleanup_keeps_pending_requests(self) -> None:
+        """When most requests expire at once, the pending ones survive."""
+        short_manager = ApprovalManager(timeout_ms=1)
+        for _ in range(3):
+            short_manager.store(
+                ApprovalRequest(action="a", preview={}, expires_at=_SENTINEL_EXPIRES)
+            )
+        time.sleep(0.01)
+        short_manager._timeout_ns = 300 * 1_000_000_000
+        pending_id = short_manager.store(
+            ApprovalRequest(action="b", preview={}, expires_at=_SENTINEL_EXPIRES)
+        )
+
+        assert short_manager.cleanup_expired() == 3
+        assert short_manager.validate(pending_id) is True
+        assert short_manager.get_pending_count() == 1
+
+    def test_cleanup_expired_leaves_pending_heap_entries(self) -> None:
+        """Only expired entries are popped, even with many pending requests."""
+        short_manager = ApprovalManager(timeout_ms=1)
+        for _ in range(10):
+            short_manager.store(
+                ApprovalRequest(action="a", preview={}, expires_at=_SENTINEL_EXPIRES)
+            )
+        time.sleep(0.01)
+        short_manager._timeout_ns = 300 * 1_000_000_000
+        for _ in range(10_000):
+            short_manager.store(
+                ApprovalRequest(action="b", preview={}, expires_at=_SENTINEL_EXPIRES)
+            )
+
+        assert short_manager.cleanup_expired() == 10
+        assert len(short_manager._expiry_heap) == 10_000
+        assert short_manager.get_pending_count() == 10_000
+
     def test_get_pending_count(self, manager: ApprovalManager) -> None:
         """Test get_pending_count returns correct count."""
         assert manager.get_pending_count() == 0
@@ -412,7 +526,7 @@ class TestApprovalManager:
             request = ApprovalRequest(
                 action=f"action_{i}",
                 preview={},
-                expires_at=datetime.utcnow(),
+                expires_at=_SENTINEL_EXPIRES,
             )
             manager.store(request)
 
@@ -423,7 +537,7 @@ class TestApprovalManager:
         request = ApprovalRequest(
             action="send_email",
             preview={},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
         )
         approval_id = manager.store(request)
 
@@ -445,43 +559,33 @@ class TestApprovalManagerThreadSafety:
     def test_concurrent_store_and_consume(self) -> None:
         """Test concurrent store and consume operations."""
         manager = ApprovalManager(timeout_ms=60000)
-        stored_ids: list[str] = []
-        consumed_ids: list[str] = []
-        errors: list[Exception] = []
-        lock = threading.Lock()
+        stored_ids: queue.SimpleQueue[str] = queue.SimpleQueue()
+        errors: queue.SimpleQueue[Exception] = queue.SimpleQueue()
 
         def store_requests() -> None:
             for i in range(100):
                 request = ApprovalRequest(
                     action=f"action_{i}",
                     preview={},
-                    expires_at=datetime.utcnow(),
+                    expires_at=_SENTINEL_EXPIRES,
                 )
                 try:
-                    approval_id = manager.store(request)
-                    with lock:
-                        stored_ids.append(approval_id)
+                    stored_ids.put_nowait(manager.store(request))
                 except Exception as e:
-                    with lock:
-                        errors.append(e)
+                    errors.put_nowait(e)
 
         def consume_requests() -> None:
             for _ in range(100):
-                time.sleep(0.001)  # Small delay to let store populate
-                with lock:
-                    if stored_ids:
-                        approval_id = stored_ids.pop(0)
-                    else:
-                        continue
+                try:
+                    approval_id = stored_ids.get(timeout=0.05)
+                except queue.Empty:
+                    continue
                 try:
                     manager.consume(approval_id)
-                    with lock:
-                        consumed_ids.append(approval_id)
                 except ApprovalError:
                     pass  # Expected for some cases
                 except Exception as e:
-                    with lock:
-                        errors.append(e)
+                    errors.put_nowait(e)
 
         store_thread = threading.Thread(target=store_requests)
         consume_thread = threading.Thread(target=consume_requests)
@@ -492,7 +596,34 @@ class TestApprovalManagerThreadSafety:
         store_thread.join()
         consume_thread.join()
 
-        assert len(errors) == 0, f"Unexpected errors: {errors}"
+        assert errors.empty(), f"Unexpected error: {errors.get_nowait()}"
+
+    async def test_interleaved_async_store_and_consume(self) -> None:
+        """Tasks on one event loop, as the tools call it, consume every store."""
+        manager = ApprovalManager(timeout_ms=60000)
+        stored_ids: asyncio.Queue[str] = asyncio.Queue()
+
+        async def store_batch() -> None:
+            for i in range(100):
+                request = ApprovalRequest(
+                    action=f"action_{i}",
+                    preview={},
+                    expires_at=_SENTINEL_EXPIRES,
+                )
+                stored_ids.put_nowait(manager.store(request))
+                await asyncio.sleep(0)
+
+        async def consume_batch() -> int:
+            consumed = 0
+            for _ in range(100):
+                manager.consume(await stored_ids.get())
+                consumed += 1
+            return consumed
+
+        _, consumed = await asyncio.gather(store_batch(), consume_batch())
+
+        assert consumed == 100
+        assert manager.get_pending_count() == 0
 
     def test_concurrent_validate_operations(self) -> None:
         """Test concurrent validate operations on the same ID."""
@@ -500,7 +631,7 @@ class TestApprovalManagerThreadSafety:
         request = ApprovalRequest(
             action="send_email",
             preview={},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
         )
         approval_id = manager.store(request)
 
@@ -525,6 +656,20 @@ class TestApprovalManagerThreadSafety:
         assert len(errors) == 0
         assert all(r is True for r in results)
 
+    def test_validate_does_not_wait_for_lock(self) -> None:
+        """validate() answers while another thread holds the manager lock."""
+        manager = ApprovalManager(timeout_ms=60000)
+        approval_id = manager.store(
+            ApprovalRequest(
+                action="send_email",
+                preview={},
+                expires_at=_SENTINEL_EXPIRES,
+            )
+        )
+
+        with manager._lock:
+            assert manager.validate(approval_id) is True
+
 
 class TestParamsHashVerification:
     """Tests for params_hash parameter tampering detection."""
@@ -540,7 +685,7 @@ class TestParamsHashVerification:
         request = ApprovalRequest(
             action="send_email",
             preview={"to": "test@example.com"},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
             params_hash=params_hash,
         )
         approval_id = manager.store(request)
@@ -562,7 +707,7 @@ class TestParamsHashVerification:
         request = ApprovalRequest(
             action="send_email",
             preview={"to": "test@example.com"},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
             params_hash="original_hash_value",
         )
         approval_id = manager.store(request)
@@ -585,7 +730,7 @@ class TestParamsHashVerification:
         request = ApprovalRequest(
             action="send_email",
             preview={"to": "test@example.com"},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
             # No params_hash
         )
         approval_id = manager.store(request)
@@ -606,7 +751,7 @@ class TestParamsHashVerification:
         request = ApprovalRequest(
             action="send_email",
             preview={"to": "test@example.com"},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
             params_hash="stored_hash_value",
         )
         approval_id = manager.store(request)
@@ -626,7 +771,7 @@ class TestParamsHashVerification:
         request_with_hash = ApprovalRequest(
             action="send_email",
             preview={},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
             params_hash="test_hash_123",
         )
         assert request_with_hash.params_hash == "test_hash_123"
@@ -635,7 +780,7 @@ class TestParamsHashVerification:
         request_without_hash = ApprovalRequest(
             action="send_email",
             preview={},
-            expires_at=datetime.utcnow(),
+            expires_at=_SENTINEL_EXPIRES,
         )
         assert request_without_hash.params_hash is None
 
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import os
-from unittest.mock import patch
+import threading
+from collections.abc import Iterator
 
 import pytest
 
-from gmail_mcp.gmail.client import GmailClient
+from gmail_mcp.gmail.client import GmailClient, _env_client_secret
 from gmail_mcp.middleware.rate_limiter import RateLimiter
 from gmail_mcp.utils.errors import RateLimitError
 
@@ -15,6 +15,14 @@ from gmail_mcp.utils.errors import RateLimitError
 class TestTokenRefreshFallback:
     """Test client_secret fallback to env var during token refresh."""
 
+    @pytest.fixture(autouse=True)
+    def _client_secret_env(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+        """Set GOOGLE_CLIENT_SECRET and make the client re-read it."""
+        monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "env_secret")
+        _env_client_secret.cache_clear()
+        yield
+        _env_client_secret.cache_clear()
+
     def test_build_credentials_uses_env_secret_when_not_in_token(self) -> None:
         """When token_data has no client_secret, fall back to GOOGLE_CLIENT_SECRET."""
         client = GmailClient()
@@ -27,9 +35,8 @@ class TestTokenRefreshFallback:
             "scopes": ["https://www.googleapis.com/auth/gmail.readonly"],
         }
 
-        with patch.dict(os.environ, {"GOOGLE_CLIENT_SECRET": "env_secret"}):
-            creds = client._build_credentials(token_data)
-            assert creds.client_secret == "env_secret"
+        creds = client._build_credentials(token_data)
+        assert creds.client_secret == "env_secret"
 
     def test_build_credentials_with_empty_string_secret_uses_env(self) -> None:
         """Empty string client_secret should fall back to env var."""
@@ -44,9 +51,8 @@ class TestTokenRefreshFallback:
             "scopes": ["https://www.googleapis.com/auth/gmail.readonly"],
         }
 
-        with patch.dict(os.environ, {"GOOGLE_CLIENT_SECRET": "env_secret"}):
-            creds = client._build_credentials(token_data)
-            assert creds.client_secret == "env_secret"
+        creds = client._build_credentials(token_data)
+        assert creds.client_secret == "env_secret"
 
     def test_build_credentials_prefers_token_secret_over_env(self) -> None:
         """When token_data has client_secret, prefer it over env var."""
@@ -61,9 +67,8 @@ class TestTokenRefreshFallback:
             "scopes": ["https://www.googleapis.com/auth/gmail.readonly"],
         }
 
-        with patch.dict(os.environ, {"GOOGLE_CLIENT_SECRET": "env_secret"}):
-            creds = client._build_credentials(token_data)
-            assert creds.client_secret == "token_secret"
+        creds = client._build_credentials(token_data)
+        assert creds.client_secret == "token_secret"
 
 
 class TestRateLimiterBoundary:
@@ -115,3 +120,31 @@ class TestRateLimiterBoundary:
         limiter.consume("test_user")
         assert limiter.check("test_user") is False
         assert limiter.remaining("test_user") == 0
+
+    def test_reads_do_not_create_buckets(self) -> None:
+        """check() and remaining() on an unseen user leave no bucket behind."""
+        limiter = RateLimiter(max_requests=3)
+
+        assert limiter.check("new_user") is True
+        assert limiter.remaining("new_user") == 3
+        assert limiter.cleanup_stale(max_age_seconds=0) == 0
+
+    def test_concurrent_users_keep_exact_counts(self) -> None:
+        """Concurrent consumers across users must not lose updates."""
+        limiter = RateLimiter(max_requests=1000, window_seconds=3600)
+        users = [f"user_{i}" for i in range(10)]
+
+        def consume_all() -> None:
+            for _ in range(10):
+                for user_id in users:
+                    limiter.consume(user_id)
+
+        threads = [threading.Thread(target=consume_all) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 10 threads x 10 rounds; refill over the run is well under one token
+        for user_id in users:
+            assert limiter.remaining(user_id) == 900
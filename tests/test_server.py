@@ -10,21 +10,96 @@ Tests cover:
 
 from __future__ import annotations
 
-import os
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from gmail_mcp.__main__ import validate_environment
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+    from mcp.server.fastmcp.tools import Tool
+
+READ_TOOLS = (
+    "gmail_triage_inbox",
+    "gmail_summarize_thread",
+    "gmail_draft_reply",
+    "gmail_search",
+    "gmail_chat_inbox",
+    "gmail_apply_labels",
+    "gmail_download_email",
+)
+
+WRITE_TOOLS = (
+    "gmail_send_email",
+    "gmail_send_emails_batch",
+    "gmail_archive_email",
+    "gmail_delete_email",
+    "gmail_unsubscribe",
+    "gmail_create_label",
+    "gmail_organize_labels",
+)
+
+READ_ONLY_TOOLS = (
+    "gmail_triage_inbox",
+    "gmail_summarize_thread",
+    "gmail_draft_reply",
+    "gmail_search",
+    "gmail_chat_inbox",
+)
+
+DESTRUCTIVE_TOOLS = (
+    "gmail_send_email",
+    "gmail_send_emails_batch",
+    "gmail_archive_email",
+    "gmail_delete_email",
+    "gmail_unsubscribe",
+    "gmail_organize_labels",
+)
+
+IDEMPOTENT_TOOLS = (
+    "gmail_triage_inbox",
+    "gmail_summarize_thread",
+    "gmail_draft_reply",
+    "gmail_search",
+    "gmail_chat_inbox",
+    "gmail_apply_labels",
+    "gmail_archive_email",
+)
+
+
+@pytest.fixture(scope="session")
+def server() -> FastMCP:
+    """Build the server once; tool registration is identical on every call."""
+    from gmail_mcp.server import create_server
+
+    return create_server()
+
+
+@pytest.fixture(scope="session")
+def tools(server: FastMCP) -> list[Tool]:
+    """List the tools registered on the shared server."""
+    return server._tool_manager.list_tools()
+
+
+@pytest.fixture(scope="session")
+def tool_names(tools: list[Tool]) -> set[str]:
+    """Names of the tools registered on the shared server."""
+    return {tool.name for tool in tools}
+
+
+@pytest.fixture(scope="session")
+def tools_by_name(tools: list[Tool]) -> dict[str, Tool]:
+    """Tools registered on the shared server, keyed by name."""
+    return {tool.name: tool for tool in tools}
+
 
 class TestServerCreation:
     """Tests for server creation and FastMCP instance."""
 
-    def test_create_server_returns_fastmcp_instance(self) -> None:
+    def test_create_server_returns_fastmcp_instance(self, server: FastMCP) -> None:
         """Test that create_server returns a FastMCP instance."""
-        from gmail_mcp.server import create_server
-
-        server = create_server()
-
         assert server is not None
         assert server.name == "gmail-mcp-server"
 
@@ -35,11 +110,11 @@ class TestServerCreation:
         assert mcp is not None
         assert mcp.name == "gmail-mcp-server"
 
-    def test_create_server_returns_same_type_as_module_mcp(self) -> None:
+    def test_create_server_returns_same_type_as_module_mcp(
+        self, server: FastMCP
+    ) -> None:
         """Test that create_server returns the same type as the module mcp."""
-        from gmail_mcp.server import create_server, mcp
-
-        server = create_server()
+        from gmail_mcp.server import mcp
 
         assert type(server) is type(mcp)
 
@@ -47,149 +122,67 @@ class TestServerCreation:
 class TestToolRegistration:
     """Tests for tool registration verification."""
 
-    def test_all_sixteen_tools_registered(self) -> None:
-        """Test that all 16 tools are registered (3 auth + 7 read + 6 write)."""
-        from gmail_mcp.server import create_server
-
-        server = create_server()
-        tools = server._tool_manager.list_tools()
+    def test_all_seventeen_tools_registered(self, tools: list[Tool]) -> None:
+        """Test that all 17 tools are registered (3 auth + 7 read + 7 write)."""
+        assert len(tools) == 17
 
-        assert len(tools) == 16
-
-    def test_read_tools_registered(self) -> None:
+    @pytest.mark.parametrize("name", READ_TOOLS)
+    def test_read_tools_registered(self, name: str, tool_names: set[str]) -> None:
         """Test that all 7 read tools are registered."""
-        from gmail_mcp.server import create_server
-
-        server = create_server()
-        tools = server._tool_manager.list_tools()
-        tool_names = [tool.name for tool in tools]
-
-        read_tools = [
-            "gmail_triage_inbox",
-            "gmail_summarize_thread",
-            "gmail_draft_reply",
-            "gmail_search",
-            "gmail_chat_inbox",
-            "gmail_apply_labels",
-            "gmail_download_email",
-        ]
-
-        for tool in read_tools:
-            assert tool in tool_names, f"Read tool {tool} not registered"
-
-    def test_write_tools_registered(self) -> None:
-        """Test that all 6 write tools are registered."""
-        from gmail_mcp.server import create_server
-
-        server = create_server()
-        tools = server._tool_manager.list_tools()
-        tool_names = [tool.name for tool in tools]
-
-        write_tools = [
-            "gmail_send_email",
-            "gmail_archive_email",
-            "gmail_delete_email",
-            "gmail_unsubscribe",
-            "gmail_create_label",
-            "gmail_organize_labels",
-        ]
-
-        for tool in write_tools:
-            assert tool in tool_names, f"Write tool {tool} not registered"
+        assert name in tool_names, f"Read tool {name} not registered"
+
+    @pytest.mark.parametrize("name", WRITE_TOOLS)
+    def test_write_tools_registered(self, name: str, tool_names: set[str]) -> None:
+        """Test that all 7 write tools are registered."""
+        assert name in tool_names, f"Write tool {name} not registered"
 
 
 class TestToolAnnotations:
     """Tests for tool annotation verification."""
 
-    def test_read_tools_have_readonly_hint(self) -> None:
+    @pytest.mark.parametrize("name", READ_ONLY_TOOLS)
+    def test_read_tools_have_readonly_hint(
+        self, name: str, tools_by_name: dict[str, Tool]
+    ) -> None:
         """Test that read tools have readOnlyHint=True."""
-        from gmail_mcp.server import create_server
-
-        server = create_server()
-        tools = server._tool_manager.list_tools()
+        annotations = tools_by_name[name].annotations
 
-        read_only_tools = [
-            "gmail_triage_inbox",
-            "gmail_summarize_thread",
-            "gmail_draft_reply",
-            "gmail_search",
-            "gmail_chat_inbox",
-        ]
+        assert annotations is not None, f"{name} has no annotations"
+        assert annotations.readOnlyHint is True
 
-        for tool in tools:
-            if tool.name in read_only_tools:
-                assert tool.annotations is not None, f"{tool.name} has no annotations"
-                assert (
-                    tool.annotations.readOnlyHint is True
-                ), f"{tool.name} should have readOnlyHint=True"
-
-    def test_destructive_tools_have_destructive_hint(self) -> None:
+    @pytest.mark.parametrize("name", DESTRUCTIVE_TOOLS)
+    def test_destructive_tools_have_destructive_hint(
+        self, name: str, tools_by_name: dict[str, Tool]
+    ) -> None:
         """Test that destructive tools have destructiveHint=True."""
-        from gmail_mcp.server import create_server
-
-        server = create_server()
-        tools = server._tool_manager.list_tools()
+        annotations = tools_by_name[name].annotations
 
-        destructive_tools = [
-            "gmail_send_email",
-            "gmail_archive_email",
-            "gmail_delete_email",
-            "gmail_unsubscribe",
-            "gmail_organize_labels",
-        ]
+        assert annotations is not None, f"{name} has no annotations"
+        assert annotations.destructiveHint is True
 
-        for tool in tools:
-            if tool.name in destructive_tools:
-                assert tool.annotations is not None, f"{tool.name} has no annotations"
-                assert (
-                    tool.annotations.destructiveHint is True
-                ), f"{tool.name} should have destructiveHint=True"
-
-    def test_idempotent_tools_have_idempotent_hint(self) -> None:
+    @pytest.mark.parametrize("name", IDEMPOTENT_TOOLS)
+    def test_idempotent_tools_have_idempotent_hint(
+        self, name: str, tools_by_name: dict[str, Tool]
+    ) -> None:
         """Test that idempotent tools have idempotentHint=True."""
-        from gmail_mcp.server import create_server
-
-        server = create_server()
-        tools = server._tool_manager.list_tools()
+        annotations = tools_by_name[name].annotations
 
-        idempotent_tools = [
-            "gmail_triage_inbox",
-            "gmail_summarize_thread",
-            "gmail_draft_reply",
-            "gmail_search",
-            "gmail_chat_inbox",
-            "gmail_apply_labels",
-            "gmail_archive_email",
-        ]
+        assert annotations is not None, f"{name} has no annotations"
+        assert annotations.idempotentHint is True
 
-        for tool in tools:
-            if tool.name in idempotent_tools:
-                assert tool.annotations is not None, f"{tool.name} has no annotations"
-                assert (
-                    tool.annotations.idempotentHint is True
-                ), f"{tool.name} should have idempotentHint=True"
-
-    def test_apply_labels_not_readonly(self) -> None:
+    def test_apply_labels_not_readonly(self, tools_by_name: dict[str, Tool]) -> None:
         """Test that gmail_apply_labels does not have readOnlyHint=True.
 
         gmail_apply_labels modifies email labels but doesn't require HITL,
         so it should not be marked as readOnly.
         """
-        from gmail_mcp.server import create_server
-
-        server = create_server()
-        tools = server._tool_manager.list_tools()
-
-        for tool in tools:
-            if tool.name == "gmail_apply_labels":
-                # apply_labels is not readOnly (it modifies state)
-                # but is also not destructive and is idempotent
-                if tool.annotations:
-                    read_only = tool.annotations.readOnlyHint
-                    assert (
-                        read_only is False
-                    ), "gmail_apply_labels should not have readOnlyHint=True"
-                break
+        # apply_labels is not readOnly (it modifies state)
+        # but is also not destructive and is idempotent
+        annotations = tools_by_name["gmail_apply_labels"].annotations
+        if annotations:
+            assert annotations.readOnlyHint is False, (
+                "gmail_apply_labels should not have readOnlyHint=True"
+            )
 
 
 class TestServerLifespan:
@@ -241,110 +234,56 @@ class TestServerLifespan:
 class TestMainEntryPoint:
     """Tests for the main entry point and environment validation."""
 
+    @pytest.fixture(autouse=True)
+    def _valid_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Start each test from a complete, valid environment."""
+        monkeypatch.setenv("GOOGLE_CLIENT_ID", "test-client-id")
+        monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "test-client-secret")
+        monkeypatch.setenv("TOKEN_ENCRYPTION_KEY", "a" * 64)
+
     def test_validate_environment_success(self) -> None:
         """Test validate_environment succeeds with valid env vars."""
-        env = {
-            "GOOGLE_CLIENT_ID": "test-client-id",
-            "GOOGLE_CLIENT_SECRET": "test-client-secret",
-            "TOKEN_ENCRYPTION_KEY": "a" * 64,
-        }
-        with patch.dict(os.environ, env, clear=False):
-            from gmail_mcp.__main__ import validate_environment
-
-            result = validate_environment()
-
-            assert result is True
+        assert validate_environment() is True
 
-    def test_validate_environment_missing_client_id(self) -> None:
+    def test_validate_environment_missing_client_id(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test validate_environment fails when GOOGLE_CLIENT_ID is missing."""
-        env = {
-            "GOOGLE_CLIENT_SECRET": "test-secret",
-            "TOKEN_ENCRYPTION_KEY": "a" * 64,
-        }
-        # Remove GOOGLE_CLIENT_ID if it exists
-        with patch.dict(os.environ, env, clear=False):
-            with patch.dict(os.environ, {"GOOGLE_CLIENT_ID": ""}, clear=False):
-                from importlib import reload
+        monkeypatch.delenv("GOOGLE_CLIENT_ID")
 
-                import gmail_mcp.__main__ as main_module
+        assert validate_environment() is False
 
-                reload(main_module)
-
-                result = main_module.validate_environment()
-
-                assert result is False
-
-    def test_validate_environment_missing_client_secret(self) -> None:
+    def test_validate_environment_missing_client_secret(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test validate_environment fails when GOOGLE_CLIENT_SECRET is missing."""
-        env = {
-            "GOOGLE_CLIENT_ID": "test-id",
-            "TOKEN_ENCRYPTION_KEY": "a" * 64,
-        }
-        with patch.dict(os.environ, env, clear=False):
-            with patch.dict(os.environ, {"GOOGLE_CLIENT_SECRET": ""}, clear=False):
-                from importlib import reload
-
-                import gmail_mcp.__main__ as main_module
-
-                reload(main_module)
-
-                result = main_module.validate_environment()
+        monkeypatch.delenv("GOOGLE_CLIENT_SECRET")
 
-                assert result is False
+        assert validate_environment() is False
 
-    def test_validate_environment_missing_encryption_key(self) -> None:
+    def test_validate_environment_missing_encryption_key(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test validate_environment fails when TOKEN_ENCRYPTION_KEY is missing."""
-        env = {
-            "GOOGLE_CLIENT_ID": "test-id",
-            "GOOGLE_CLIENT_SECRET": "test-secret",
-        }
-        with patch.dict(os.environ, env, clear=False):
-            with patch.dict(os.environ, {"TOKEN_ENCRYPTION_KEY": ""}, clear=False):
-                from importlib import reload
+        monkeypatch.delenv("TOKEN_ENCRYPTION_KEY")
 
-                import gmail_mcp.__main__ as main_module
+        assert validate_environment() is False
 
-                reload(main_module)
-
-                result = main_module.validate_environment()
-
-                assert result is False
-
-    def test_validate_environment_invalid_key_length(self) -> None:
+    def test_validate_environment_invalid_key_length(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test validate_environment fails with invalid encryption key length."""
-        env = {
-            "GOOGLE_CLIENT_ID": "test-id",
-            "GOOGLE_CLIENT_SECRET": "test-secret",
-            "TOKEN_ENCRYPTION_KEY": "tooshort",  # Less than 64 chars
-        }
-        with patch.dict(os.environ, env, clear=False):
-            from importlib import reload
-
-            import gmail_mcp.__main__ as main_module
-
-            reload(main_module)
+        monkeypatch.setenv("TOKEN_ENCRYPTION_KEY", "tooshort")  # Less than 64 chars
 
-            result = main_module.validate_environment()
+        assert validate_environment() is False
 
-            assert result is False
-
-    def test_validate_environment_key_exactly_64_chars(self) -> None:
+    def test_validate_environment_key_exactly_64_chars(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test validate_environment succeeds with exactly 64 char key."""
-        env = {
-            "GOOGLE_CLIENT_ID": "test-id",
-            "GOOGLE_CLIENT_SECRET": "test-secret",
-            "TOKEN_ENCRYPTION_KEY": "0" * 64,  # Exactly 64 chars
-        }
-        with patch.dict(os.environ, env, clear=False):
-            from importlib import reload
-
-            import gmail_mcp.__main__ as main_module
-
-            reload(main_module)
+        monkeypatch.setenv("TOKEN_ENCRYPTION_KEY", "0" * 64)  # Exactly 64 chars
 
-            result = main_module.validate_environment()
-
-            assert result is True
+        assert validate_environment() is True
 
 
 class TestServerConfiguration:
@@ -364,13 +303,8 @@ class TestServerConfiguration:
 
         assert len(tools) > 0
 
-    def test_all_tools_have_descriptions(self) -> None:
+    def test_all_tools_have_descriptions(self, tools: list[Tool]) -> None:
         """Test all tools have non-empty descriptions."""
-        from gmail_mcp.server import create_server
-
-        server = create_server()
-        tools = server._tool_manager.list_tools()
-
         for tool in tools:
             assert tool.description, f"{tool.name} has no description"
             assert len(tool.description) > 10, f"{tool.name} description is too short"
@@ -379,36 +313,16 @@ class TestServerConfiguration:
 class TestToolSchemas:
     """Tests for tool input schemas."""
 
-    def test_all_tools_have_input_schemas(self) -> None:
+    def test_all_tools_have_input_schemas(self, tools: list[Tool]) -> None:
         """Test all tools have input schemas defined."""
-        from gmail_mcp.server import create_server
-
-        server = create_server()
-        tools = server._tool_manager.list_tools()
-
         for tool in tools:
             assert tool.parameters is not None, f"{tool.name} has no input schema"
 
-    def test_write_tools_have_approval_id_parameter(self) -> None:
+    @pytest.mark.parametrize("name", WRITE_TOOLS)
+    def test_write_tools_have_approval_id_parameter(
+        self, name: str, tools_by_name: dict[str, Tool]
+    ) -> None:
         """Test all write tools have approval_id parameter."""
-        from gmail_mcp.server import create_server
-
-        server = create_server()
-        tools = server._tool_manager.list_tools()
+        properties = tools_by_name[name].parameters.get("properties", {})
 
-        write_tools = [
-            "gmail_send_email",
-            "gmail_archive_email",
-            "gmail_delete_email",
-            "gmail_unsubscribe",
-            "gmail_create_label",
-            "gmail_organize_labels",
-        ]
-
-        for tool in tools:
-            if tool.name in write_tools:
-                schema = tool.parameters
-                properties = schema.get("properties", {})
-                assert (
-                    "approval_id" in properties
-                ), f"{tool.name} missing approval_id parameter"
+        assert "approval_id" in properties, f"{name} missing approval_id parameter"
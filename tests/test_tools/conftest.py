@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -47,53 +49,65 @@ def mock_approval_manager():
         yield mock
 
 
-@pytest.fixture
-def sample_message_list() -> list[dict[str, str]]:
-    """Sample message list response."""
-    return [
-        {"id": "msg1", "threadId": "thread1"},
-        {"id": "msg2", "threadId": "thread2"},
-    ]
+@pytest.fixture(scope="session")
+def sample_message_list() -> tuple[Mapping[str, str], ...]:
+    """Sample message list response (read-only, shared across tests)."""
+    return (
+        MappingProxyType({"id": "msg1", "threadId": "thread1"}),
+        MappingProxyType({"id": "msg2", "threadId": "thread2"}),
+    )
 
 
-@pytest.fixture
-def sample_full_message() -> dict[str, Any]:
-    """Sample full message response."""
-    return {
-        "id": "msg1",
-        "threadId": "thread1",
-        "labelIds": ["INBOX", "UNREAD"],
-        "snippet": "Test message snippet",
-        "payload": {
-            "headers": [
-                {"name": "From", "value": "sender@example.com"},
-                {"name": "To", "value": "recipient@example.com"},
-                {"name": "Subject", "value": "Test Subject"},
-                {"name": "Date", "value": "Mon, 20 Jan 2026 10:00:00 -0500"},
-            ],
-            "body": {"data": "VGVzdCBib2R5IGNvbnRlbnQ="},
-        },
-    }
+@pytest.fixture(scope="session")
+def sample_full_message() -> Mapping[str, Any]:
+    """Sample full message response (read-only, shared across tests)."""
+    return MappingProxyType(
+        {
+            "id": "msg1",
+            "threadId": "thread1",
+            "labelIds": ("INBOX", "UNREAD"),
+            "snippet": "Test message snippet",
+            "payload": MappingProxyType(
+                {
+                    "headers": (
+                        MappingProxyType(
+                            {"name": "From", "value": "sender@example.com"}
+                        ),
+                        MappingProxyType(
+                            {"name": "To", "value": "recipient@example.com"}
+                        ),
+                        MappingProxyType({"name": "Subject", "value": "Test Subject"}),
+                        MappingProxyType(
+                            {"name": "Date", "value": "Mon, 20 Jan 2026 10:00:00 -0500"}
+                        ),
+                    ),
+                    "body": MappingProxyType({"data": "VGVzdCBib2R5IGNvbnRlbnQ="}),
+                }
+            ),
+        }
+    )
 
 
-@pytest.fixture
-def sample_thread(sample_full_message: dict[str, Any]) -> dict[str, Any]:
-    """Sample thread response."""
-    return {
-        "id": "thread1",
-        "messages": [sample_full_message],
-    }
+@pytest.fixture(scope="session")
+def sample_thread(sample_full_message: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Sample thread response (read-only, shared across tests)."""
+    return MappingProxyType(
+        {
+            "id": "thread1",
+            "messages": (sample_full_message,),
+        }
+    )
 
 
-@pytest.fixture
-def sample_labels() -> list[dict[str, str]]:
-    """Sample labels list response."""
-    return [
-        {"id": "INBOX", "name": "INBOX", "type": "system"},
-        {"id": "UNREAD", "name": "UNREAD", "type": "system"},
-        {"id": "Label_1", "name": "Work", "type": "user"},
-        {"id": "Label_2", "name": "Personal", "type": "user"},
-    ]
+@pytest.fixture(scope="session")
+def sample_labels() -> tuple[Mapping[str, str], ...]:
+    """Sample labels list response (read-only, shared across tests)."""
+    return (
+        MappingProxyType({"id": "INBOX", "name": "INBOX", "type": "system"}),
+        MappingProxyType({"id": "UNREAD", "name": "UNREAD", "type": "system"}),
+        MappingProxyType({"id": "Label_1", "name": "Work", "type": "user"}),
+        MappingProxyType({"id": "Label_2", "name": "Personal", "type": "user"}),
+    )
 
 
 @pytest.fixture
@@ -9,7 +9,10 @@ import pytest
 from gmail_mcp.tools.base import (
     ResponseKeys,
     build_error_response,
+    build_message_previews,
     build_success_response,
+    compute_params_hash,
+    compute_params_hash_stream,
     create_approval_request,
     execute_tool,
     validate_and_consume_approval,
@@ -48,6 +51,14 @@ class TestBuildSuccessResponse:
         assert result[ResponseKeys.MESSAGE] == "Found items"
         assert result[ResponseKeys.COUNT] == 0
 
+    def test_responses_do_not_share_state(self):
+        """Test mutating one response leaves later responses untouched."""
+        first = build_success_response(data=1, message="first")
+        first["extra"] = True
+
+        second = build_success_response(data=2)
+        assert second == {ResponseKeys.STATUS: "success", ResponseKeys.DATA: 2}
+
 
 class TestBuildErrorResponse:
     """Tests for build_error_response."""
@@ -76,6 +87,21 @@ class TestBuildErrorResponse:
         assert result["reason"] == "Invalid format"
 
 
+class TestComputeParamsHashStream:
+    """Tests for streamed parameter hashing."""
+
+    def test_matches_dict_hash(self):
+        """Test streamed hash equals the dict-based hash regardless of order."""
+        params = {"name": "Work", "nested": {"b": 1, "a": [1, "x"]}, "n": None}
+        assert compute_params_hash_stream(
+            reversed(list(params.items()))
+        ) == compute_params_hash(params)
+
+    def test_empty_pairs(self):
+        """Test empty input hashes like an empty dict."""
+        assert compute_params_hash_stream(()) == compute_params_hash({})
+
+
 class TestExecuteTool:
     """Tests for execute_tool wrapper."""
 
@@ -88,7 +114,7 @@ class TestExecuteTool:
             operation=lambda: {"result": "ok"},
         )
         assert result == {"result": "ok"}
-        mock_rate_limiter.consume.assert_called_once_with("default")
+        mock_rate_limiter.consume.assert_called_once_with("default", tokens=1)
         mock_audit_logger.log_tool_call.assert_called_once()
 
     @pytest.mark.asyncio
@@ -112,7 +138,20 @@ class TestExecuteTool:
             operation=lambda: None,
             user_id="custom_user",
         )
-        mock_rate_limiter.consume.assert_called_once_with("custom_user")
+        mock_rate_limiter.consume.assert_called_once_with("custom_user", tokens=1)
+
+    @pytest.mark.asyncio
+    async def test_consumes_requested_tokens(
+        self, mock_rate_limiter, mock_audit_logger
+    ):
+        """Test operations that cost several requests consume several tokens."""
+        await execute_tool(
+            tool_name="test_tool",
+            params={},
+            operation=lambda: None,
+            tokens=3,
+        )
+        mock_rate_limiter.consume.assert_called_once_with("default", tokens=3)
 
 
 class TestHITLHelpers:
@@ -136,24 +175,66 @@ class TestHITLHelpers:
         """Test successful approval validation."""
         mock_approval_manager.consume.return_value = valid_approval_request
         result = validate_and_consume_approval(
-            approval_id="test-id",
+            approval_id=valid_approval_request.id,
             expected_action="send_email",
         )
         assert result == valid_approval_request
         mock_approval_manager.consume.assert_called_once_with(
-            "test-id", expected_action="send_email", params_hash=None
+            valid_approval_request.id, expected_action="send_email", params_hash=None
         )
 
     def test_validate_and_consume_approval_failure(self, mock_approval_manager):
         """Test approval validation failure."""
         # approval_manager.consume() raises ApprovalError on failure
+        unknown_id = "00000000-0000-4000-8000-000000000000"
         mock_approval_manager.consume.side_effect = ApprovalError(
             "Invalid approval ID",
-            details={"approval_id": "invalid-id", "reason": "not_found"},
+            details={"approval_id": unknown_id, "reason": "not_found"},
         )
         with pytest.raises(ApprovalError) as exc_info:
             validate_and_consume_approval(
-                approval_id="invalid-id",
+                approval_id=unknown_id,
                 expected_action="send_email",
             )
         assert "Invalid approval ID" in str(exc_info.value)
+
+    def test_validate_and_consume_approval_rejects_malformed_id(
+        self, mock_approval_manager
+    ):
+        """Test ids that were never generated fail without a manager lookup."""
+        with pytest.raises(ApprovalError, match="Invalid approval ID"):
+            validate_and_consume_approval(
+                approval_id="not-a-uuid",
+                expected_action="send_email",
+            )
+        mock_approval_manager.consume.assert_not_called()
+
+
+class TestBuildMessagePreviews:
+    """Tests for batched HITL message previews."""
+
+    def test_failed_messages_get_placeholder(self, sample_full_message):
+        """Test per-message failures keep their slot with a placeholder."""
+        with patch("gmail_mcp.tools.base.execute_batch") as mock_batch:
+            mock_batch.return_value = [
+                (sample_full_message, None),
+                (None, Exception("not found")),
+            ]
+            previews = build_message_previews(MagicMock(), ["msg1", "msg2"])
+
+        assert previews[0]["id"] == "msg1"
+        assert previews[0]["subject"] != "(failed to fetch)"
+        assert previews[1] == {
+            "id": "msg2",
+            "from": "Unknown",
+            "subject": "(failed to fetch)",
+            "snippet": "",
+        }
+
+    def test_batch_failure_returns_placeholders(self):
+        """Test a failed batch request yields placeholders for every message."""
+        with patch("gmail_mcp.tools.base.execute_batch") as mock_batch:
+            mock_batch.side_effect = Exception("network down")
+            previews = build_message_previews(MagicMock(), ["msg1", "msg2"])
+
+        assert [p["subject"] for p in previews] == ["(failed to fetch)"] * 2
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -27,17 +28,17 @@ class TestGmailTriageInbox:
         mock_gmail_client: MagicMock,
         mock_rate_limiter: MagicMock,
         mock_audit_logger: MagicMock,
-        sample_message_list: list[dict[str, str]],
-        sample_full_message: dict[str, Any],
+        sample_message_list: tuple[Mapping[str, str], ...],
+        sample_full_message: Mapping[str, Any],
     ):
         """Test successful triage returns categorized results."""
         with (
             patch("gmail_mcp.tools.read.triage.list_messages") as mock_list,
-            patch("gmail_mcp.tools.read.triage.get_message") as mock_get,
+            patch("gmail_mcp.tools.read.triage.batch_get_messages") as mock_get,
             patch("gmail_mcp.tools.read.triage.gmail_client", mock_gmail_client),
         ):
             mock_list.return_value = sample_message_list
-            mock_get.return_value = sample_full_message
+            mock_get.return_value = [sample_full_message] * len(sample_message_list)
 
             from gmail_mcp.tools.read.triage import gmail_triage_inbox
 
@@ -47,6 +48,8 @@ class TestGmailTriageInbox:
             assert result["status"] == "success"
             # Data contains the triaged emails list directly
             assert isinstance(result["data"], list)
+            assert len(result["data"]) == len(sample_message_list)
+            mock_get.assert_called_once()
             mock_rate_limiter.consume.assert_called_once()
             mock_audit_logger.log_tool_call.assert_called_once()
 
@@ -74,6 +77,55 @@ class TestGmailTriageInbox:
             assert call_args.kwargs["max_results"] == 25
 
 
+class TestCategorizeEmail:
+    """Tests for triage categorization precedence."""
+
+    def test_category_label_used_without_text_match(self):
+        """Test Gmail category labels classify mail with no text signals."""
+        from gmail_mcp.tools.read.triage import _categorize_email
+
+        message = {"labelIds": ["INBOX", "CATEGORY_PROMOTIONS"], "snippet": "Hi"}
+
+        assert _categorize_email(message, {"subject": "Sale"}) == ("newsletter", 4)
+
+    def test_urgent_keywords_take_precedence_over_category_label(self):
+        """Test urgent mail stays urgent even in a Gmail category."""
+        from gmail_mcp.tools.read.triage import _categorize_email
+
+        message = {"labelIds": ["CATEGORY_SOCIAL"], "snippet": ""}
+
+        assert _categorize_email(message, {"subject": "URGENT"}) == ("urgent", 1)
+
+    def test_list_unsubscribe_header_marks_newsletter(self):
+        """Test a List-Unsubscribe header alone classifies as newsletter."""
+        from gmail_mcp.tools.read.triage import _categorize_email
+
+        headers = {"subject": "Hello", "list-unsubscribe": "<https://x.test/u>"}
+
+        assert _categorize_email({"snippet": ""}, headers) == ("newsletter", 4)
+
+
+class TestExtractFromDomain:
+    """Tests for From header domain extraction used by triage."""
+
+    @pytest.mark.parametrize(
+        ("from_header", "expected"),
+        [
+            ("John Doe <john@Example.COM>", "example.com"),
+            ("john@example.com", "example.com"),
+            ('"a@b.org" <news@mail.example.com>', "mail.example.com"),
+            ("John Doe <john@example.com.>", "example.com"),
+            ("no address here", ""),
+            ("", ""),
+        ],
+    )
+    def test_extract_from_domain(self, from_header: str, expected: str):
+        """Test domain is taken from the last address and lowercased."""
+        from gmail_mcp.tools.read.triage import _extract_from_domain
+
+        assert _extract_from_domain(from_header) == expected
+
+
 class TestGmailSearch:
     """Tests for gmail_search tool."""
 
@@ -83,8 +135,8 @@ class TestGmailSearch:
         mock_gmail_client: MagicMock,
         mock_rate_limiter: MagicMock,
         mock_audit_logger: MagicMock,
-        sample_message_list: list[dict[str, str]],
-        sample_full_message: dict[str, Any],
+        sample_message_list: tuple[Mapping[str, str], ...],
+        sample_full_message: Mapping[str, Any],
     ):
         """Test successful search returns formatted results."""
         with (
@@ -137,7 +189,7 @@ class TestGmailSummarizeThread:
         mock_gmail_client: MagicMock,
         mock_rate_limiter: MagicMock,
         mock_audit_logger: MagicMock,
-        sample_thread: dict[str, Any],
+        sample_thread: Mapping[str, Any],
     ):
         """Test thread content is properly formatted for summarization."""
         with (
@@ -156,6 +208,43 @@ class TestGmailSummarizeThread:
             assert "messages" in result["data"]
             assert "message_count" in result["data"]
 
+    @pytest.mark.asyncio
+    async def test_summarize_reads_deeply_nested_text_part(
+        self,
+        mock_gmail_client: MagicMock,
+        mock_rate_limiter: MagicMock,
+        mock_audit_logger: MagicMock,
+    ):
+        """Test a text part three levels down is returned instead of the snippet."""
+        text_part = {"mimeType": "text/plain", "body": {"data": "TmVzdGVkIGJvZHk="}}
+        alternative = {"mimeType": "multipart/alternative", "parts": [text_part]}
+        related = {"mimeType": "multipart/related", "parts": [alternative]}
+        thread = {
+            "messages": [
+                {
+                    "id": "msg1",
+                    "snippet": "snippet",
+                    "payload": {
+                        "mimeType": "multipart/mixed",
+                        "headers": [],
+                        "parts": [related],
+                    },
+                }
+            ]
+        }
+        with (
+            patch("gmail_mcp.tools.read.summarize.get_thread") as mock_get,
+            patch("gmail_mcp.tools.read.summarize.gmail_client", mock_gmail_client),
+        ):
+            mock_get.return_value = thread
+
+            from gmail_mcp.tools.read.summarize import gmail_summarize_thread
+
+            params = SummarizeThreadParams(thread_id="thread1")
+            result = await gmail_summarize_thread(params)
+
+            assert result["data"]["messages"][0]["body"] == "Nested body"
+
 
 class TestGmailDraftReply:
     """Tests for gmail_draft_reply tool."""
@@ -166,7 +255,7 @@ class TestGmailDraftReply:
         mock_gmail_client: MagicMock,
         mock_rate_limiter: MagicMock,
         mock_audit_logger: MagicMock,
-        sample_thread: dict[str, Any],
+        sample_thread: Mapping[str, Any],
     ):
         """Test reply context includes suggested recipients."""
         with (
@@ -223,7 +312,7 @@ class TestGmailApplyLabels:
         mock_gmail_client: MagicMock,
         mock_rate_limiter: MagicMock,
         mock_audit_logger: MagicMock,
-        sample_labels: list[dict[str, str]],
+        sample_labels: tuple[Mapping[str, str], ...],
     ):
         """Test labels are applied to messages."""
         with (
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -14,9 +15,10 @@ from gmail_mcp.schemas.tools import (
     DeleteEmailParams,
     OrganizeLabelsParams,
     SendEmailParams,
+    SendEmailsBatchParams,
     UnsubscribeParams,
 )
-from gmail_mcp.utils.errors import ApprovalError
+from gmail_mcp.utils.errors import ApprovalError, GmailAPIError
 
 
 class TestHITLTwoStepFlow:
@@ -86,6 +88,29 @@ class TestGmailSendEmail:
             preview = call_args.kwargs.get("preview") or call_args.args[1]
             assert len(preview.get("body_preview", "")) <= 503  # 500 + "..."
 
+    @pytest.mark.asyncio
+    async def test_send_revalidates_pydantic_email_fields(
+        self,
+        mock_gmail_client: MagicMock,
+        mock_rate_limiter: MagicMock,
+        mock_audit_logger: MagicMock,
+    ):
+        """Test addresses accepted by EmailStr still go through validate_email."""
+        with patch("gmail_mcp.tools.write.send.gmail_client", mock_gmail_client):
+            from gmail_mcp.tools.write.send import gmail_send_email
+
+            # EmailStr allows internationalized local parts; our validator does not
+            params = SendEmailParams(
+                to="test@example.com",
+                subject="Test",
+                body="Hello",
+                cc=["jörg@example.com"],
+            )
+            result = await gmail_send_email(params)
+
+            assert result["status"] == "error"
+            assert result["error_code"] == "VALIDATION_ERROR"
+
     @pytest.mark.asyncio
     async def test_send_execution_calls_gmail_api(
         self,
@@ -120,6 +145,126 @@ class TestGmailSendEmail:
             mock_send.assert_called_once()
 
 
+class TestGmailSendEmailsBatch:
+    """Tests for gmail_send_emails_batch tool."""
+
+    @pytest.mark.asyncio
+    async def test_batch_preview_lists_every_email(
+        self,
+        mock_gmail_client: MagicMock,
+        mock_rate_limiter: MagicMock,
+        mock_audit_logger: MagicMock,
+    ):
+        """Test one approval preview covers all emails."""
+        with patch("gmail_mcp.tools.write.send.create_approval_request") as mock_create:
+            mock_create.return_value = {"status": "pending_approval"}
+
+            from gmail_mcp.tools.write.send import gmail_send_emails_batch
+
+            params = SendEmailsBatchParams(
+                emails=[
+                    SendEmailParams(to="a@example.com", subject="A", body="x"),
+                    SendEmailParams(to="b@example.com", subject="B", body="y"),
+                ]
+            )
+            await gmail_send_emails_batch(params)
+
+            preview = mock_create.call_args.kwargs["preview"]
+            assert preview["email_count"] == 2
+            assert [e["to"] for e in preview["emails"]] == [
+                "a@example.com",
+                "b@example.com",
+            ]
+
+    @pytest.mark.asyncio
+    async def test_batch_send_reports_partial_failure(
+        self,
+        mock_gmail_client: MagicMock,
+        mock_rate_limiter: MagicMock,
+        mock_audit_logger: MagicMock,
+        valid_approval_request: ApprovalRequest,
+    ):
+        """Test per-email results are returned from one batch send."""
+        with (
+            patch("gmail_mcp.tools.write.send.gmail_client", mock_gmail_client),
+            patch(
+                "gmail_mcp.tools.write.send.validate_and_consume_approval"
+            ) as mock_validate,
+            patch("gmail_mcp.tools.write.send.batch_send_messages") as mock_batch,
+        ):
+            mock_validate.return_value = valid_approval_request
+            mock_batch.return_value = [
+                ({"id": "sent1", "threadId": "t1"}, None),
+                (None, Exception("quota exceeded")),
+            ]
+
+            from gmail_mcp.tools.write.send import gmail_send_emails_batch
+
+            params = SendEmailsBatchParams(
+                emails=[
+                    SendEmailParams(to="a@example.com", subject="A", body="x"),
+                    SendEmailParams(to="b@example.com", subject="B", body="y"),
+                ],
+                approval_id="valid-id",
+            )
+            result = await gmail_send_emails_batch(params)
+
+            mock_batch.assert_called_once()
+            mock_rate_limiter.consume.assert_called_once_with("default", tokens=2)
+            assert result["status"] == "success"
+            assert result["data"]["partial_success"] is True
+            first, second = result["data"]["results"]
+            assert first["message_id"] == "sent1"
+            assert second["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_batch_send_audits_each_email(
+        self,
+        mock_gmail_client: MagicMock,
+        mock_rate_limiter: MagicMock,
+        mock_audit_logger: MagicMock,
+        valid_approval_request: ApprovalRequest,
+    ):
+        """Test the audit log records the same per-email fields as a single send."""
+        with (
+            patch("gmail_mcp.tools.write.send.gmail_client", mock_gmail_client),
+            patch(
+                "gmail_mcp.tools.write.send.validate_and_consume_approval"
+            ) as mock_validate,
+            patch("gmail_mcp.tools.write.send.batch_send_messages") as mock_batch,
+        ):
+            mock_validate.return_value = valid_approval_request
+            mock_batch.return_value = [({"id": "sent1", "threadId": "t1"}, None)]
+
+            from gmail_mcp.tools.write.send import gmail_send_emails_batch
+
+            params = SendEmailsBatchParams(
+                emails=[
+                    SendEmailParams(
+                        to="a@example.com",
+                        subject="A",
+                        body="x",
+                        cc=["c@example.com"],
+                        bcc=["d@example.com"],
+                    ),
+                ],
+                approval_id="valid-id",
+            )
+            await gmail_send_emails_batch(params)
+
+            parameters = mock_audit_logger.log_tool_call.call_args.kwargs["parameters"]
+            assert parameters["emails"] == [
+                {
+                    "to": "a@example.com",
+                    "subject": "A",
+                    "cc": ["c@example.com"],
+                    "bcc": ["d@example.com"],
+                    "reply_to_thread_id": None,
+                    "has_body": True,
+                }
+            ]
+
+
 class TestGmailArchiveEmail:
     """Tests for gmail_archive_email tool."""
 
@@ -129,15 +274,15 @@ class TestGmailArchiveEmail:
         mock_gmail_client: MagicMock,
         mock_rate_limiter: MagicMock,
         mock_audit_logger: MagicMock,
-        sample_full_message: dict[str, Any],
+        sample_full_message: Mapping[str, Any],
     ):
         """Test preview includes message details."""
         with patch(
             "gmail_mcp.tools.write.archive.gmail_client", mock_gmail_client
-        ), patch("gmail_mcp.tools.write.archive.get_message") as mock_get, patch(
+        ), patch("gmail_mcp.tools.base.execute_batch") as mock_batch, patch(
             "gmail_mcp.tools.write.archive.create_approval_request"
         ) as mock_create:
-            mock_get.return_value = sample_full_message
+            mock_batch.return_value = [(sample_full_message, None)]
             mock_create.return_value = {"status": "pending_approval"}
 
             from gmail_mcp.tools.write.archive import gmail_archive_email
@@ -149,6 +294,8 @@ class TestGmailArchiveEmail:
             call_args = mock_create.call_args
             preview = call_args.kwargs.get("preview") or call_args.args[1]
             assert "messages" in preview
+            assert preview["messages"][0]["id"] == "msg1"
+            mock_batch.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_archive_removes_inbox_label(
@@ -181,6 +328,35 @@ class TestGmailArchiveEmail:
             call_args = mock_modify.call_args
             assert "INBOX" in call_args.kwargs.get("remove_labels", [])
 
+    @pytest.mark.asyncio
+    async def test_archive_deduplicates_message_ids(
+        self,
+        mock_gmail_client: MagicMock,
+        mock_rate_limiter: MagicMock,
+        mock_audit_logger: MagicMock,
+        valid_approval_request: ApprovalRequest,
+    ):
+        """Test repeated message IDs are archived once, in order."""
+        with patch(
+            "gmail_mcp.tools.write.archive.gmail_client", mock_gmail_client
+        ), patch(
+            "gmail_mcp.tools.write.archive.validate_and_consume_approval"
+        ) as mock_validate, patch(
+            "gmail_mcp.tools.write.archive.batch_modify_messages"
+        ) as mock_modify:
+            mock_validate.return_value = valid_approval_request
+
+            from gmail_mcp.tools.write.archive import gmail_archive_email
+
+            params = ArchiveEmailParams(
+                message_ids=["msg2", "msg1", "msg2"],
+                approval_id="valid-id",
+            )
+            result = await gmail_archive_email(params)
+
+            assert result["data"]["archived_count"] == 2
+            assert mock_modify.call_args.kwargs["message_ids"] == ["msg2", "msg1"]
+
 
 class TestGmailDeleteEmail:
     """Tests for gmail_delete_email tool."""
@@ -199,9 +375,10 @@ class TestGmailDeleteEmail:
         ), patch(
             "gmail_mcp.tools.write.delete.validate_and_consume_approval"
         ) as mock_validate, patch(
-            "gmail_mcp.tools.write.delete.trash_message"
+            "gmail_mcp.tools.write.delete.batch_trash_messages"
         ) as mock_trash:
             mock_validate.return_value = valid_approval_request
+            mock_trash.return_value = {}
 
             from gmail_mcp.tools.write.delete import gmail_delete_email
 
@@ -212,7 +389,9 @@ class TestGmailDeleteEmail:
             result = await gmail_delete_email(params)
 
             assert result["status"] == "success"
-            mock_trash.assert_called_once_with(mock_gmail_client.get_service(), "msg1")
+            mock_trash.assert_called_once_with(
+                mock_gmail_client.get_service(), ["msg1"]
+            )
 
 
 class TestGmailUnsubscribe:
@@ -224,7 +403,7 @@ class TestGmailUnsubscribe:
         mock_gmail_client: MagicMock,
         mock_rate_limiter: MagicMock,
         mock_audit_logger: MagicMock,
-        sample_full_message: dict[str, Any],
+        sample_full_message: Mapping[str, Any],
     ):
         """Test error when no List-Unsubscribe header."""
         with patch(
@@ -240,6 +419,80 @@ class TestGmailUnsubscribe:
 
             assert result["status"] == "error"
             assert "NO_UNSUBSCRIBE_HEADER" in result.get("error_code", "")
+            mock_audit_logger.log_tool_call.assert_called_once()
+            audit_params = mock_audit_logger.log_tool_call.call_args.kwargs[
+                "parameters"
+            ]
+            assert audit_params == {"message_id": "msg1"}
+
+
+class TestExtractUnsubscribeLink:
+    """Tests for List-Unsubscribe header parsing."""
+
+    @pytest.mark.parametrize(
+        ("value", "link", "is_mailto"),
+        [
+            ("<https://example.com/u?id=1>", "https://example.com/u?id=1", False),
+            ("<mailto:u@example.com>", "mailto:u@example.com", True),
+            (
+                "<mailto:u@example.com>, <https://example.com/u>",
+                "https://example.com/u",
+                False,
+            ),
+        ],
+    )
+    def test_extracts_preferred_link(self, value: str, link: str, is_mailto: bool):
+        """Test HTTP links are preferred over mailto regardless of order."""
+        from gmail_mcp.tools.write.unsubscribe import _extract_unsubscribe_link
+
+        info = _extract_unsubscribe_link(value)
+
+        assert info is not None
+        assert info["link"] == link
+        assert info["is_mailto"] is is_mailto
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "<https://>, <mailto:u@example.com>",
+            "<httpx>, <mailto:u@example.com>",
+            "<https://example.com/u",
+        ],
+    )
+    def test_malformed_http_falls_back_to_regex(self, value: str):
+        """Test the find fast path defers malformed links to the regex."""
+        from gmail_mcp.tools.write.unsubscribe import (
+            UNSUBSCRIBE_LINK_PATTERN,
+            _extract_unsubscribe_link,
+        )
+
+        info = _extract_unsubscribe_link(value)
+
+        match = UNSUBSCRIBE_LINK_PATTERN.search(value)
+        expected = match.group(2) if match else None
+        assert (info["link"] if info else None) == expected
+
+    def test_returns_none_without_link(self):
+        """Test a missing header or one with no bracketed link yields None."""
+        from gmail_mcp.tools.write.unsubscribe import _extract_unsubscribe_link
+
+        assert _extract_unsubscribe_link("not a link") is None
+        assert _extract_unsubscribe_link(None) is None
+
+
+class TestUnsubscribePreview:
+    """Tests for the unsubscribe approval preview."""
+
+    @pytest.mark.parametrize("is_mailto", [False, True])
+    def test_warning_mentions_mailto_only_for_mailto(self, is_mailto: bool):
+        """Test the mailto note is appended only for mailto links."""
+        from gmail_mcp.tools.write.unsubscribe import _build_preview
+
+        info = {"link": "mailto:u@example.com", "is_mailto": is_mailto}
+        preview = _build_preview("msg1", "a@example.com", "Hi", info)
+
+        assert preview["warning"].startswith("This will return the unsubscribe link.")
+        assert ("For mailto links" in preview["warning"]) is is_mailto
 
 
 class TestGmailCreateLabel:
@@ -268,10 +521,113 @@ class TestGmailCreateLabel:
             assert result["status"] == "pending_approval"
             mock_create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_label_skips_lookup_on_success(
+        self,
+        mock_gmail_client: MagicMock,
+        mock_rate_limiter: MagicMock,
+        mock_audit_logger: MagicMock,
+        valid_approval_request: ApprovalRequest,
+    ):
+        """Test a successful create makes no label-name lookup."""
+        with (
+            patch("gmail_mcp.tools.write.labels.gmail_client", mock_gmail_client),
+            patch(
+                "gmail_mcp.tools.write.labels.validate_and_consume_approval"
+            ) as mock_validate,
+            patch("gmail_mcp.tools.write.labels.create_label") as mock_create,
+            patch("gmail_mcp.tools.write.labels.get_label_by_name") as mock_lookup,
+        ):
+            mock_validate.return_value = valid_approval_request
+            mock_create.return_value = {"id": "Label_9", "name": "New Label"}
+
+            from gmail_mcp.tools.write.labels import gmail_create_label
+
+            params = CreateLabelParams(name="New Label", approval_id="valid-id")
+            result = await gmail_create_label(params)
+
+            assert result["status"] == "success"
+            assert result["data"]["label_id"] == "Label_9"
+            mock_lookup.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_label_reports_existing_on_conflict(
+        self,
+        mock_gmail_client: MagicMock,
+        mock_rate_limiter: MagicMock,
+        mock_audit_logger: MagicMock,
+        valid_approval_request: ApprovalRequest,
+    ):
+        """Test a 409 from Gmail is reported with the existing label."""
+        with (
+            patch("gmail_mcp.tools.write.labels.gmail_client", mock_gmail_client),
+            patch(
+                "gmail_mcp.tools.write.labels.validate_and_consume_approval"
+            ) as mock_validate,
+            patch("gmail_mcp.tools.write.labels.create_label") as mock_create,
+            patch("gmail_mcp.tools.write.labels.get_label_by_name") as mock_lookup,
+        ):
+            mock_validate.return_value = valid_approval_request
+            mock_create.side_effect = GmailAPIError("conflict", status_code=409)
+            mock_lookup.return_value = {"id": "Label_1", "name": "New Label"}
+
+            from gmail_mcp.tools.write.labels import gmail_create_label
+
+            params = CreateLabelParams(name="New Label", approval_id="valid-id")
+            result = await gmail_create_label(params)
+
+            assert result["status"] == "error"
+            assert result["error_code"] == "LABEL_EXISTS"
+            assert result["existing_label_id"] == "Label_1"
+
 
 class TestGmailOrganizeLabels:
     """Tests for gmail_organize_labels tool."""
 
+    def test_organize_preview_per_action(self):
+        """Test each action kind produces its own preview fields."""
+        from gmail_mcp.tools.write.labels import _build_organize_preview
+
+        preview = _build_organize_preview(
+            [
+                {"action": "rename", "label_id": "L1", "new_name": "Work"},
+                {"action": "delete", "label_id": "L2"},
+                {
+                    "action": "update_visibility",
+                    "label_id": "L3",
+                    "visibility": "labelHide",
+                },
+            ]
+        )
+
+        rename, delete, visibility = preview["operations"]
+        assert preview["operation_count"] == 3
+        assert rename["description"] == "Rename label 'L1' to 'Work'"
+        assert rename["new_name"] == "Work"
+        assert delete == {
+            "action": "delete",
+            "label_id": "L2",
+            "description": "Delete label 'L2'",
+        }
+        assert visibility["visibility"] == "labelHide"
+
+    def test_organize_preview_does_not_reuse_previous_preview(self):
+        """Test an unmatched operation gets its own generic preview."""
+        from gmail_mcp.tools.write.labels import _build_organize_preview
+
+        preview = _build_organize_preview(
+            [
+                {"action": "delete", "label_id": "L1"},
+                {"action": "delete"},
+            ]
+        )
+
+        assert preview["operations"][1] == {
+            "action": "delete",
+            "label_id": "",
+            "description": "delete on label ''",
+        }
+
     @pytest.mark.asyncio
     async def test_organize_validates_operations(
         self,
@@ -290,3 +646,99 @@ class TestGmailOrganizeLabels:
             result = await gmail_organize_labels(params)
 
             assert result["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_organize_audit_logs_full_operations(
+        self,
+        mock_rate_limiter: MagicMock,
+        mock_audit_logger: MagicMock,
+    ):
+        """Test the audit log keeps new names and visibilities of operations."""
+        from gmail_mcp.tools.write.labels import gmail_organize_labels
+
+        operations = [
+            {"action": "rename", "label_id": "L1", "new_name": "Work"},
+            {
+                "action": "update_visibility",
+                "label_id": "L2",
+                "visibility": "labelHide",
+            },
+        ]
+        await gmail_organize_labels(OrganizeLabelsParams(operations=operations))
+
+        parameters = mock_audit_logger.log_tool_call.call_args.kwargs["parameters"]
+        assert parameters["operations"] == operations
+
+    @pytest.mark.asyncio
+    async def test_organize_batches_multiple_operations(
+        self,
+        mock_gmail_client: MagicMock,
+        mock_rate_limiter: MagicMock,
+        mock_audit_logger: MagicMock,
+        valid_approval_request: ApprovalRequest,
+    ):
+        """Test multiple operations share one batch request with partial results."""
+        with (
+            patch("gmail_mcp.tools.write.labels.gmail_client", mock_gmail_client),
+            patch(
+                "gmail_mcp.tools.write.labels.validate_and_consume_approval"
+            ) as mock_validate,
+            patch("gmail_mcp.tools.write.labels.execute_batch") as mock_batch,
+        ):
+            mock_validate.return_value = valid_approval_request
+            mock_batch.return_value = [
+                ({"id": "Label_1", "name": "Renamed"}, None),
+                (None, Exception("not found")),
+            ]
+
+            from gmail_mcp.tools.write.labels import gmail_organize_labels
+
+            params = OrganizeLabelsParams(
+                operations=[
+                    {"action": "rename", "label_id": "Label_1", "new_name": "Renamed"},
+                    {"action": "delete", "label_id": "Label_2"},
+                ],
+                approval_id="valid-id",
+            )
+            result = await gmail_organize_labels(params)
+
+            mock_batch.assert_called_once()
+            assert result["data"]["partial_success"] is True
+            first, second = result["data"]["results"]
+            assert first["new_name"] == "Renamed"
+            assert second["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_organize_falls_back_when_batch_fails(
+        self,
+        mock_gmail_client: MagicMock,
+        mock_rate_limiter: MagicMock,
+        mock_audit_logger: MagicMock,
+        valid_approval_request: ApprovalRequest,
+    ):
+        """Test operations run individually if the batch request fails."""
+        with (
+            patch("gmail_mcp.tools.write.labels.gmail_client", mock_gmail_client),
+            patch(
+                "gmail_mcp.tools.write.labels.validate_and_consume_approval"
+            ) as mock_validate,
+            patch("gmail_mcp.tools.write.labels.execute_batch") as mock_batch,
+            patch("gmail_mcp.tools.write.labels.delete_label") as mock_delete,
+        ):
+            mock_validate.return_value = valid_approval_request
+            mock_batch.side_effect = Exception("batch unavailable")
+
+            from gmail_mcp.tools.write.labels import gmail_organize_labels
+
+            params = OrganizeLabelsParams(
+                operations=[
+                    {"action": "delete", "label_id": "Label_1"},
+                    {"action": "delete", "label_id": "Label_2"},
+                ],
+                approval_id="valid-id",
+            )
+            result = await gmail_organize_labels(params)
+
+            assert result["status"] == "success"
+            assert result["data"]["success_count"] == 2
+            assert mock_delete.call_count == 2